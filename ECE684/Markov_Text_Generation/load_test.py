@@ -0,0 +1,111 @@
+"""Drive mtg_service locally with concurrent clients.
+
+By default the service is started in-process on a free port, so one command
+is enough:
+
+    python load_test.py --corpus austen.txt --clients 32 --requests 50
+
+Use --host/--port (without --corpus) to hit an already running service.
+Prompts are random windows of the corpus (or of a built-in toy text), so
+some are repeated and exercise the per-batch de-duplication.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from mtg_service import CompletionService, load_corpus, tokenize
+
+TOY_TEXT = (
+    "she was not in the room . she was not at home . he was in the garden ."
+    " they were not at home . the garden was quiet and the room was empty ."
+)
+
+
+async def client(host, port, prompts, n, results):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i, prompt in enumerate(prompts):
+            t0 = time.perf_counter()
+            writer.write(
+                (json.dumps({"id": i, "sentence": prompt, "n": n}) + "\n").encode()
+            )
+            await writer.drain()
+            reply = json.loads(await reader.readline())
+            results.append(((time.perf_counter() - t0) * 1000, "error" in reply))
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'{"cmd": "stats"}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return stats
+
+
+async def run(args):
+    corpus = None
+    server = service = None
+    host, port = args.host, args.port
+    if args.port is None:
+        corpus = load_corpus(args.corpus) if args.corpus else tuple(tokenize(TOY_TEXT))
+        service = CompletionService(corpus, args.batch_window_ms, args.max_batch)
+        server = await service.serve(host, 0)
+        port = server.sockets[0].getsockname()[1]
+    vocab_src = corpus or tuple(tokenize(TOY_TEXT))
+
+    rng = random.Random(args.seed)
+
+    def prompt():
+        i = rng.randrange(max(len(vocab_src) - args.prompt_len, 1))
+        return list(vocab_src[i : i + args.prompt_len])
+
+    results = []
+    t0 = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client(
+                host, port, [prompt() for _ in range(args.requests)], args.n, results
+            )
+            for _ in range(args.clients)
+        )
+    )
+    elapsed = time.perf_counter() - t0
+
+    lat = sorted(ms for ms, _ in results)
+    print(f"{len(results)} requests from {args.clients} clients in {elapsed:.2f}s")
+    print(f"client throughput: {len(results) / elapsed:.1f} req/s")
+    print(
+        "client latency ms: "
+        f"p50={lat[len(lat) // 2]:.2f} "
+        f"p95={lat[int(0.95 * (len(lat) - 1))]:.2f} max={lat[-1]:.2f}"
+    )
+    print(f"errors: {sum(err for _, err in results)}")
+    print("server stats:", json.dumps(await fetch_stats(host, port), indent=2))
+
+    if server is not None:
+        server.close()
+        await service.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Load test for mtg_service.")
+    ap.add_argument("--corpus", help="Corpus for the in-process service.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, help="Running service (skips in-process).")
+    ap.add_argument("--clients", type=int, default=16)
+    ap.add_argument("--requests", type=int, default=25, help="Per client.")
+    ap.add_argument("--n", type=int, default=3)
+    ap.add_argument("--prompt-len", type=int, default=3)
+    ap.add_argument("--batch-window-ms", type=float, default=2.0)
+    ap.add_argument("--max-batch", type=int, default=64)
+    ap.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(ap.parse_args()))
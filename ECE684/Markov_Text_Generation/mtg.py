@@ -6,12 +6,15 @@ ALPHA = 0.4
 _counts_cache = {}
 
 
-def finish_sentence(sentence, n, corpus, randomize=False):
+def finish_sentence(sentence, n, corpus, randomize=False, index=None):
     """
     Three Steps:
     1. build models
     2. predict sentence
     3. return result
+
+    index: optional SuffixArrayIndex over the same corpus; built once, it
+    replaces the per-call dict model for every n
     """
     # edge cases
     if n < 1:
@@ -22,8 +25,11 @@ def finish_sentence(sentence, n, corpus, randomize=False):
     # clean the cache before predict
     _counts_cache.clear()
 
-    # build n-gram model
-    n_grams = build_n_gram_model(corpus, n)
+    # build n-gram model (or look histories up in the shared index)
+    if index is not None:
+        n_grams = index.view(n)
+    else:
+        n_grams = build_n_gram_model(corpus, n)
 
     # start to predict
     result = predict(n_grams, sentence, n, randomize)
@@ -102,7 +108,8 @@ def _get_possible_words(model, current_key):
     """
     possible_words = set()
     while True:
-        possible_words.update(model.get(current_key, []))
+        # same words as model.get(current_key), but from the cached counts
+        possible_words.update(_counts(model, current_key))
         # break where is no current_key
         if len(current_key) == 0:
             break
@@ -133,7 +140,9 @@ def _get_score(model, current_key, w, alpha=ALPHA):
 def _counts(model, current_key):
     """
     _counts_cache == Counter({'possible_word1': 2, 'possible_word2': 3})
+    a model may carry its own cache (counts_cache) that outlives one call
     """
-    if current_key not in _counts_cache:
-        _counts_cache[current_key] = Counter(model.get(current_key, []))
-    return _counts_cache[current_key]
+    cache = getattr(model, "counts_cache", _counts_cache)
+    if current_key not in cache:
+        cache[current_key] = Counter(model.get(current_key, []))
+    return cache[current_key]
@@ -0,0 +1,275 @@
+"""Asyncio completion service over a preloaded Markov model.
+
+The corpus is indexed once at startup (suffix_array.SuffixArrayIndex serves
+every n), and one model view per n keeps its counts cache across requests.
+
+Protocol: newline-delimited JSON over TCP, one object per line.
+    -> {"id": 1, "sentence": ["she", "was", "not"], "n": 3, "randomize": false}
+    <- {"id": 1, "output": ["she", "was", ...], "latency_ms": 1.9}
+    -> {"cmd": "stats"}
+    <- {"requests": ..., "batches": ..., "throughput_rps": ..., ...}
+A malformed or failed request gets {"id": ..., "error": "..."} instead.
+
+Requests that arrive within `batch_window_ms` of each other are handled as one
+batch: identical deterministic requests are computed once, and the batch runs
+in a worker thread so the event loop keeps accepting connections.
+
+    python mtg_service.py --corpus austen.txt --port 8765
+    python mtg_service.py --gutenberg austen-sense.txt   (needs nltk data)
+
+Standard library only (nltk is optional, for --gutenberg).
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from collections import deque
+
+from mtg import predict
+from suffix_array import SuffixArrayIndex
+
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def load_corpus(path=None, gutenberg=None):
+    if gutenberg:
+        import nltk
+
+        return tuple(nltk.word_tokenize(nltk.corpus.gutenberg.raw(gutenberg).lower()))
+    with open(path, encoding="utf-8") as f:
+        return tuple(tokenize(f.read()))
+
+
+class Stats:
+    """Request/batch counters plus a window of recent latencies."""
+
+    def __init__(self, window=1000):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.deduplicated = 0
+        self.latencies_ms = deque(maxlen=window)
+
+    def snapshot(self):
+        elapsed = time.perf_counter() - self.started
+        lat = sorted(self.latencies_ms)
+
+        def pct(p):
+            return round(lat[min(len(lat) - 1, int(p * len(lat)))], 3) if lat else None
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch_size": (
+                round(self.requests / self.batches, 2) if self.batches else None
+            ),
+            "deduplicated": self.deduplicated,
+            "uptime_s": round(elapsed, 3),
+            "throughput_rps": round(self.requests / elapsed, 2) if elapsed else None,
+            "latency_ms_p50": pct(0.50),
+            "latency_ms_p95": pct(0.95),
+            "latency_ms_p99": pct(0.99),
+        }
+
+
+class CompletionService:
+    """Batches concurrent requests and completes them against one index."""
+
+    def __init__(self, corpus, batch_window_ms=2.0, max_batch=64):
+        self.index = SuffixArrayIndex(corpus)
+        self.views = {}  # n -> NGramView (and its counts cache)
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.stats = Stats()
+        self._queue = asyncio.Queue()
+        self._batcher = None
+        self._connections = set()
+
+    def _view(self, n):
+        if n not in self.views:
+            self.views[n] = self.index.view(n)
+        return self.views[n]
+
+    def _complete(self, sentence, n, randomize):
+        if n < 1:
+            raise ValueError("n should larger than 0")
+        return predict(self._view(n), list(sentence), n, randomize)
+
+    def _run_batch(self, batch):
+        """Runs in a worker thread; returns one (output, error) per request."""
+        done = {}
+        results = []
+        for req in batch:
+            key = None
+            try:
+                key = (tuple(req["sentence"]), req["n"])
+                if not req["randomize"] and key in done:
+                    self.stats.deduplicated += 1
+                    results.append(done[key])
+                    continue
+                out = (
+                    self._complete(req["sentence"], req["n"], req["randomize"]),
+                    None,
+                )
+            except (ValueError, TypeError) as e:
+                out = (None, str(e))
+            if not req["randomize"] and key is not None:
+                done[key] = out
+            results.append(out)
+        return results
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            reqs = [req for req, _ in batch]
+            self.stats.batches += 1
+            try:
+                results = await loop.run_in_executor(None, self._run_batch, reqs)
+            except Exception as e:
+                # fail this batch's requests, keep serving the next ones
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
+
+    async def complete(self, sentence, n, randomize=False):
+        """Queue one request and wait for its batch; returns the sentence.
+
+        Raises TypeError for a malformed request and ValueError when it fails.
+        """
+        if self._batcher is None:
+            self._batcher = asyncio.create_task(self._batch_loop())
+        t0 = time.perf_counter()
+        if not isinstance(sentence, (list, tuple)) or not all(
+            isinstance(word, str) for word in sentence
+        ):
+            error = "sentence should be a list of strings"
+        elif isinstance(n, bool) or not isinstance(n, int):
+            error = "n should be an integer"
+        else:
+            error = None
+        if error is not None:
+            self.stats.requests += 1
+            self.stats.errors += 1
+            raise TypeError(error)
+
+        fut = asyncio.get_running_loop().create_future()
+        req = {"sentence": list(sentence), "n": n, "randomize": bool(randomize)}
+        await self._queue.put((req, fut))
+        try:
+            output, error = await fut
+        except Exception as e:  # the whole batch failed
+            output, error = None, f"internal error: {e}"
+        self.stats.requests += 1
+        self.stats.latencies_ms.append((time.perf_counter() - t0) * 1000)
+        if error is not None:
+            self.stats.errors += 1
+            raise ValueError(error)
+        return output
+
+    async def _answer(self, msg):
+        if msg.get("cmd") == "stats":
+            return self.stats.snapshot()
+        t0 = time.perf_counter()
+        sentence = msg.get("sentence")
+        if sentence is None and isinstance(msg.get("text", ""), str):
+            sentence = tokenize(msg.get("text", ""))
+        try:
+            output = await self.complete(
+                sentence, msg.get("n", 3), msg.get("randomize", False)
+            )
+        except (ValueError, TypeError) as e:
+            return {"id": msg.get("id"), "error": str(e)}
+        return {
+            "id": msg.get("id"),
+            "output": output,
+            "latency_ms": round((time.perf_counter() - t0) * 1000, 3),
+        }
+
+    async def handle(self, reader, writer):
+        """One connection; requests on it may be pipelined and answered out of order."""
+        self._connections.add(asyncio.current_task())
+        lock = asyncio.Lock()
+        pending = set()
+
+        async def respond(msg):
+            reply = await self._answer(msg)
+            async with lock:
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError as e:
+                    msg, error = None, f"bad json: {e}"
+                else:
+                    error = None if isinstance(msg, dict) else "expected a JSON object"
+                if error is not None:
+                    writer.write((json.dumps({"error": error}) + "\n").encode())
+                    continue
+                task = asyncio.create_task(respond(msg))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            self._connections.discard(asyncio.current_task())
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def close(self, timeout=1.0):
+        """Let open connections drain, then stop the batcher."""
+        if self._connections:
+            await asyncio.wait(self._connections, timeout=timeout)
+        if self._batcher is not None:
+            self._batcher.cancel()
+            self._batcher = None
+
+
+async def main(args):
+    t0 = time.perf_counter()
+    corpus = load_corpus(args.corpus, args.gutenberg)
+    service = CompletionService(corpus, args.batch_window_ms, args.max_batch)
+    print(f"indexed {len(corpus)} tokens in {time.perf_counter() - t0:.2f}s")
+    server = await service.serve(args.host, args.port)
+    print(f"listening on {args.host}:{args.port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Markov text completion service.")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--corpus", help="Plain-text corpus file.")
+    src.add_argument("--gutenberg", help="NLTK gutenberg file id (needs nltk).")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--batch-window-ms", type=float, default=2.0)
+    ap.add_argument("--max-batch", type=int, default=64)
+    asyncio.run(main(ap.parse_args()))
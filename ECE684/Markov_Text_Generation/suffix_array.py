@@ -0,0 +1,104 @@
+from bisect import bisect_left, bisect_right
+
+
+def build_suffix_array(ids):
+    """
+    Suffix array of a list of token ids by prefix doubling.
+    Each round sorts suffixes by (rank of first k tokens, rank of next k tokens);
+    it stops as soon as every rank is unique, which for text happens after about
+    log2(longest repeated phrase) rounds.
+    """
+    n = len(ids)
+    sa = list(range(n))
+    rank = list(ids)
+    k = 1
+    while n > 1:
+
+        def pair(i):
+            return (rank[i], rank[i + k] if i + k < n else -1)
+
+        sa.sort(key=pair)
+        new_rank = [0] * n
+        for j in range(1, n):
+            new_rank[sa[j]] = new_rank[sa[j - 1]] + (pair(sa[j]) != pair(sa[j - 1]))
+        rank = new_rank
+        if rank[sa[-1]] == n - 1:
+            break
+        k *= 2
+    return sa
+
+
+class SuffixArrayIndex:
+    """
+    One index over the corpus that serves every n.
+    The next words after a history h are read off the block of suffixes that
+    start with h, found with two binary searches.
+
+    index = SuffixArrayIndex(corpus)
+    finish_sentence(sentence, 3, corpus, index=index)
+    """
+
+    def __init__(self, corpus):
+        self.tokens = list(corpus)
+        self.vocab = {}
+        self.ids = [self.vocab.setdefault(w, len(self.vocab)) for w in self.tokens]
+        self.sa = build_suffix_array(self.ids)
+
+    def _range(self, history):
+        """[lo, hi) of suffix array positions whose suffix starts with history."""
+        k = len(history)
+        if k == 0:
+            return 0, len(self.sa)
+        try:
+            target = [self.vocab[w] for w in history]
+        except KeyError:  # unseen word -> unseen history
+            return 0, 0
+
+        def prefix(i):
+            return self.ids[i : i + k]
+
+        lo = bisect_left(self.sa, target, key=prefix)
+        hi = bisect_right(self.sa, target, lo=lo, key=prefix)
+        return lo, hi
+
+    def count(self, history):
+        """How many times history occurs in the corpus."""
+        lo, hi = self._range(tuple(history))
+        return hi - lo
+
+    def next_words(self, history):
+        """Every token that follows an occurrence of history (with repeats)."""
+        history = tuple(history)
+        if not history:
+            return list(self.tokens)
+        k = len(history)
+        n = len(self.tokens)
+        lo, hi = self._range(history)
+        return [self.tokens[i + k] for i in self.sa[lo:hi] if i + k < n]
+
+    def view(self, n):
+        """Read-only model for one n (histories up to n-1 tokens)."""
+        return NGramView(self, n)
+
+
+class NGramView:
+    """
+    Same lookups as the dict from build_n_gram_model(corpus, n), so predict()
+    and the stupid-backoff helpers can use either.
+    """
+
+    def __init__(self, index, n):
+        self.index = index
+        self.n = n
+        # history -> Counter, filled by mtg._counts; valid for this view's n
+        self.counts_cache = {}
+
+    def get(self, key, default=None):
+        # build_n_gram_model only stores histories of length 0 .. n-1
+        if len(key) > max(self.n - 1, 0):
+            return default
+        words = self.index.next_words(key)
+        return words if words else default
+
+    def __contains__(self, key):
+        return self.get(key) is not None
@@ -6,13 +6,22 @@ Resources:
 Jelinek 1985 "Markov Source Modeling of Text Generation"
 """
 
+import asyncio
 import csv
+import json
 import nltk
 
 nltk.download("gutenberg", quiet=True)
 nltk.download("punkt_tab", quiet=True)
 
 from mtg import finish_sentence
+from mtg_service import CompletionService
+from suffix_array import SuffixArrayIndex, build_suffix_array
+
+TOY = (
+    "the cat sat on the mat . the cat ate the fish . "
+    "the dog sat on the rug . the dog ate the bone ."
+).split()
 
 
 def test_generator():
@@ -21,6 +30,9 @@ def test_generator():
         nltk.word_tokenize(nltk.corpus.gutenberg.raw("austen-sense.txt").lower())
     )
 
+    # one suffix-array index serves every n in the examples
+    index = SuffixArrayIndex(corpus)
+
     with open("test_examples.csv") as csvfile:
         csvreader = csv.DictReader(csvfile, delimiter=",")
         for row in csvreader:
@@ -33,7 +45,108 @@ def test_generator():
             print(f"input: {row['input']} (n={row['n']})")
             print(f"output: {' '.join(words)}")
             assert words == row["output"].split(" ")
+            assert words == finish_sentence(
+                row["input"].split(" "), int(row["n"]), corpus, index=index
+            )
+
+
+def test_suffix_array_matches_dict_model():
+    """Suffix-array backend gives the dict model's output for every n."""
+    toy = TOY
+    ids = [ord(c) for c in "banana"]
+    assert build_suffix_array(ids) == [5, 3, 1, 0, 4, 2]
+
+    index = SuffixArrayIndex(toy)
+    assert index.count(("the", "cat")) == 2
+    assert sorted(index.next_words(("sat", "on"))) == ["the", "the"]
+    assert index.view(2).get(("sat", "on"), []) == []  # longer than n - 1
+
+    for n in range(1, 6):
+        for seed in (["the", "cat"], ["the", "dog"], ["sat", "on", "the"], ["a"]):
+            expected = finish_sentence(list(seed), n, toy)
+            assert finish_sentence(list(seed), n, toy, index=index) == expected
+
+
+def test_service_batches_concurrent_requests():
+    """Concurrent TCP requests are batched and match finish_sentence."""
+    seeds = [["the", "cat"], ["the", "dog"], ["the", "cat"], ["sat", "on"]]
+
+    async def scenario():
+        service = CompletionService(TOY, batch_window_ms=20)
+        server = await service.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def ask(msg):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write((json.dumps(msg) + "\n").encode())
+            reply = json.loads(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+            return reply
+
+        replies = await asyncio.gather(
+            *(ask({"id": i, "sentence": s, "n": 3}) for i, s in enumerate(seeds))
+        )
+        bad = await ask({"sentence": ["the"], "n": 0})
+        stats = await ask({"cmd": "stats"})
+        server.close()
+        await service.close()
+        await server.wait_closed()
+        return replies, bad, stats
+
+    replies, bad, stats = asyncio.run(scenario())
+    for reply, seed in zip(replies, seeds):
+        assert reply["output"] == finish_sentence(list(seed), 3, TOY)
+    assert "error" in bad
+    assert stats["requests"] == 5 and stats["errors"] == 1
+    assert stats["batches"] == 2  # the four concurrent requests share one
+    assert stats["deduplicated"] == 1
+
+
+def test_service_answers_after_bad_requests():
+    """Malformed requests and a failed batch get error replies, not a hang."""
+    bad_lines = [
+        {"id": 1, "sentence": [["the"]], "n": 3},
+        {"id": 2, "sentence": 5},
+        {"id": 3, "sentence": ["the"], "n": None},
+        {"id": 4, "sentence": ["the"], "n": True},
+        {"id": 5, "text": 7},
+        ["not", "an", "object"],
+    ]
+
+    async def scenario():
+        service = CompletionService(TOY, batch_window_ms=1)
+        server = await service.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def ask(msg):
+            writer.write((json.dumps(msg) + "\n").encode())
+            return json.loads(await reader.readline())
+
+        bad = [await ask(msg) for msg in bad_lines]
+        run_batch = service._run_batch
+        service._run_batch = lambda batch: 1 / 0  # one batch blows up
+        failed = await ask({"id": 6, "sentence": ["the", "cat"], "n": 3})
+        service._run_batch = run_batch
+        good = await ask({"id": 7, "sentence": ["the", "cat"], "n": 3})
+
+        writer.close()
+        await writer.wait_closed()
+        server.close()
+        await service.close()
+        await server.wait_closed()
+        return bad, failed, good
+
+    bad, failed, good = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert all("error" in reply for reply in bad)
+    assert [reply.get("id") for reply in bad] == [1, 2, 3, 4, 5, None]
+    assert failed["id"] == 6 and "error" in failed
+    assert good["output"] == finish_sentence(["the", "cat"], 3, TOY)
 
 
 if __name__ == "__main__":
+    test_suffix_array_matches_dict_model()
+    test_service_batches_concurrent_requests()
+    test_service_answers_after_bad_requests()
     test_generator()
@@ -0,0 +1,84 @@
+# scripts/bench_cli_startup.py
+"""
+CLI startup benchmark. Runs `python -X importtime -m src.app.cli ...` in fresh
+interpreters and reports median wall time, total import time, the slowest
+top-level imports, and whether any heavy dependency (polars, sklearn, ...) was
+loaded. `--help` and per-command `--help` must stay free of heavy imports;
+commands import what they need in their own bodies.
+
+    python scripts/bench_cli_startup.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+PROJ = pathlib.Path(__file__).resolve().parents[1]
+
+HEAVY = ("polars", "pyarrow", "numpy", "sklearn", "scipy", "pandas")
+CASES = {
+    "cli --help": ["-m", "src.app.cli", "--help"],
+    "cli build --help": ["-m", "src.app.cli", "build", "--help"],
+    "cli sweep --help": ["-m", "src.app.cli", "sweep", "--help"],
+    "import polars (reference)": ["-c", "import polars"],
+}
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) per line of -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line.removeprefix("import time:").split("|")
+        # one separator space, then two spaces of indent per nesting level
+        rows.append((name[1:].rstrip(), int(self_us), int(cum_us)))
+    return rows
+
+
+def run_case(args: list[str]) -> tuple[float, list[tuple[str, int, int]]]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJ,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"{args} failed:\n{proc.stderr[-2000:]}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--top", type=int, default=5, help="Slowest imports to list.")
+    args = ap.parse_args()
+
+    for label, case in CASES.items():
+        walls, rows = [], []
+        for _ in range(args.repeat):
+            wall, rows = run_case(case)
+            walls.append(wall)
+        # top-level imports (no indentation) sum to the total import time
+        top = [(n.strip(), cum) for n, _, cum in rows if not n.startswith(" ")]
+        total_ms = sum(cum for _, cum in top) / 1000
+        loaded = {n.strip().split(".")[0] for n, _, _ in rows}
+        heavy = [m for m in HEAVY if m in loaded]
+
+        print(
+            f"{label:<28} wall={statistics.median(walls) * 1000:7.1f} ms  "
+            f"imports={total_ms:7.1f} ms  heavy={heavy or '-'}"
+        )
+        for name, cum in sorted(top, key=lambda t: -t[1])[: args.top]:
+            print(f"    {cum / 1000:7.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# scripts/benchmark_pipeline.py
+"""
+Offline benchmark suite for the jobs pipeline.
+
+Generates synthetic raw data (scripts/make_synthetic_data.py) at one or more
+scales, times every transformer, the aggregator and the full JobsPipeline.build,
+and appends one JSON line per (scale, stage) to a results file. Each run is
+compared against the previous result for the same scale/stage so regressions
+show up without the Kaggle download.
+
+    python scripts/benchmark_pipeline.py --rows 10000 100000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable
+
+import polars as pl
+
+PROJ = pathlib.Path(__file__).resolve().parents[1]
+DEFAULT_RESULTS = PROJ / "data" / "reports" / "benchmarks.jsonl"
+
+if str(PROJ) not in sys.path:
+    sys.path.insert(0, str(PROJ))
+
+from make_synthetic_data import generate  # noqa: E402
+from src.app.pipeline import JobsPipeline  # noqa: E402
+from src.infra.aggregators import TopSkillsAggregator  # noqa: E402
+from src.infra.io_polars import PolarsLocalRepository  # noqa: E402
+from src.infra.transformers import (  # noqa: E402
+    CleanJobTransformer,
+    RoleFilterTransformer,
+    TextJoinTransformer,
+    DeriveWorkTypeTransformer,
+    DeriveSeniorityTransformer,
+)
+from src.settings import TARGET_ROLES  # noqa: E402
+
+
+def _git_rev() -> str | None:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=PROJ,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Minimum wall time over `repeat` runs (least noisy estimate)."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_scale(rows: int, repeat: int, workdir: pathlib.Path) -> list[dict]:
+    """Time each stage in isolation on in-memory input, then the full build."""
+    raw_dir = workdir / "data" / "raw"
+    generate(rows, raw_dir)
+    raw_files = [str(p) for p in sorted(raw_dir.glob("*.parquet"))]
+
+    repo = PolarsLocalRepository()
+    # Materialize each stage's input once, so a stage's timing is only its own work
+    raw = repo.load_many(raw_files).collect()
+    bronze = CleanJobTransformer().run(raw.lazy()).collect()
+    filtered = RoleFilterTransformer(TARGET_ROLES).run(bronze.lazy()).collect()
+    texted = TextJoinTransformer().run(filtered.lazy()).collect()
+    silver = DeriveSeniorityTransformer().run(
+        DeriveWorkTypeTransformer().run(texted.lazy())
+    )
+    silver = silver.collect()
+
+    stages: dict[str, tuple[Callable[[], object], int]] = {
+        "load_many": (lambda: repo.load_many(raw_files).collect(), rows),
+        "clean": (lambda: CleanJobTransformer().run(raw.lazy()).collect(), raw.height),
+        "role_filter": (
+            lambda: RoleFilterTransformer(TARGET_ROLES).run(bronze.lazy()).collect(),
+            bronze.height,
+        ),
+        "text_join": (
+            lambda: TextJoinTransformer().run(filtered.lazy()).collect(),
+            filtered.height,
+        ),
+        "derive_work_type": (
+            lambda: DeriveWorkTypeTransformer().run(texted.lazy()).collect(),
+            texted.height,
+        ),
+        "derive_seniority": (
+            lambda: DeriveSeniorityTransformer().run(texted.lazy()).collect(),
+            texted.height,
+        ),
+        "top_skills": (
+            lambda: TopSkillsAggregator(topk=40).aggregate(silver.lazy()).collect(),
+            silver.height,
+        ),
+    }
+
+    results = []
+    for name, (fn, n_in) in stages.items():
+        results.append(
+            {"stage": name, "rows_in": n_in, "seconds": _best_of(fn, repeat)}
+        )
+
+    # settings paths are relative to the project root, so build from workdir
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        seconds = _best_of(lambda: JobsPipeline().build(), repeat)
+    finally:
+        os.chdir(cwd)
+    results.append({"stage": "pipeline_build", "rows_in": rows, "seconds": seconds})
+    return results
+
+
+def _previous(results_path: pathlib.Path) -> dict[tuple[int, str], dict]:
+    """Latest recorded result per (scale, stage)."""
+    prev: dict[tuple[int, str], dict] = {}
+    if results_path.exists():
+        for line in results_path.read_text().splitlines():
+            if line.strip():
+                r = json.loads(line)
+                prev[(r["scale_rows"], r["stage"])] = r
+    return prev
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark the jobs pipeline offline.")
+    ap.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--results", type=pathlib.Path, default=DEFAULT_RESULTS)
+    ap.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=1.25,
+        help="Flag stages slower than previous run by this factor.",
+    )
+    args = ap.parse_args()
+
+    prev = _previous(args.results)
+    run_meta = {
+        "run_at": datetime.now().isoformat(timespec="seconds"),
+        "git_rev": _git_rev(),
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "polars_threads": pl.thread_pool_size(),
+        "cpu_count": os.cpu_count(),
+    }
+
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    regressions = []
+    with open(args.results, "a") as out:
+        for rows in args.rows:
+            with tempfile.TemporaryDirectory() as tmp:
+                results = bench_scale(rows, args.repeat, pathlib.Path(tmp))
+            print(f"\n== {rows:,} raw rows ==")
+            for r in results:
+                rec = {**run_meta, "scale_rows": rows, **r}
+                rec["rows_per_sec"] = (
+                    r["rows_in"] / r["seconds"] if r["seconds"] else None
+                )
+                out.write(json.dumps(rec) + "\n")
+
+                old = prev.get((rows, r["stage"]))
+                ratio = (
+                    r["seconds"] / old["seconds"] if old and old["seconds"] else None
+                )
+                flag = ""
+                if ratio and ratio > args.regression_threshold:
+                    flag = "  <-- REGRESSION"
+                    regressions.append((rows, r["stage"], ratio))
+                vs = f"  x{ratio:.2f} vs {old['git_rev']}" if ratio else ""
+                print(f"  {r['stage']:<18} {r['seconds']:>9.4f}s{vs}{flag}")
+
+    print(f"\nResults appended to {args.results}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,265 @@
 # scripts/download_kaggle.py
 
-import kagglehub
-import polars as pl
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import polars as pl
 
-def download_and_convert(dataset: str, out_dir: str | Path):
-    # Download Kaggle dataset (returns a local directory path)
-    path = kagglehub.dataset_download(dataset)
-    data_dir = Path(path)
+DEFAULT_ROW_GROUP_SIZE = 128_000
+MANIFEST_NAME = "_ingest_manifest.json"
+
+
+def _merge_dtypes(dtypes: list[pl.DataType]) -> pl.DataType:
+    """Combine per-sample inferred dtypes; anything ambiguous stays a string."""
+    uniq = set(dtypes) - {pl.Null}
+    if not uniq:
+        return pl.String
+    if len(uniq) == 1:
+        return uniq.pop()
+    if uniq <= {pl.Int64, pl.Float64}:
+        return pl.Float64
+    return pl.String
+
+
+def infer_schema(
+    csv_file: Path, n_samples: int = 8, sample_bytes: int = 1 << 20
+) -> dict[str, pl.DataType]:
+    """
+    Infer column types from several evenly spaced samples (head, middle, tail...),
+    not just the first rows, so late-appearing values are accounted for.
+    """
+    size = csv_file.stat().st_size
+    with open(csv_file, "rb") as f:
+        header = f.readline()
+        body_start = f.tell()
+        names = pl.read_csv(io.BytesIO(header), infer_schema=False).columns
+
+        samples: dict[str, list[pl.DataType]] = {c: [] for c in names}
+        step = max(1, (size - body_start) // n_samples)
+        for i in range(n_samples):
+            f.seek(body_start + i * step)
+            if i:
+                f.readline()  # realign to the next line start
+            chunk = f.read(sample_bytes)
+            chunk = chunk[: chunk.rfind(b"\n") + 1]  # drop the partial last line
+            if not chunk:
+                continue
+            try:
+                df = pl.read_csv(
+                    io.BytesIO(header + chunk),
+                    infer_schema_length=None,
+                    truncate_ragged_lines=True,
+                )
+            except pl.exceptions.PolarsError:
+                # a sample starting inside a quoted multi-line field; skip it
+                continue
+            for c in names:
+                if c in df.columns:
+                    samples[c].append(df.schema[c])
 
-    # Ensure output directory exists
-    out_dir = Path(out_dir)
+    return {c: _merge_dtypes(dts) for c, dts in samples.items()}
+
+
+def ragged_rows(csv_file: Path, n_cols: int) -> list[int]:
+    """
+    Data row numbers (0-based, blank lines skipped, as Polars counts them) of
+    records with more than n_cols fields. Only called once a scan has failed.
+    """
+    csv.field_size_limit(sys.maxsize)
+    out, i = [], 0
+    with open(csv_file, newline="", encoding="utf-8", errors="replace") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        for record in reader:
+            if not record:
+                continue
+            if len(record) > n_cols:
+                out.append(i)
+            i += 1
+    return out
+
+
+def convert_csv(
+    csv_file: Path,
+    parquet_file: Path,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    sort_keys: list[str] | None = None,
+    schema: dict[str, pl.DataType] | None = None,
+) -> dict:
+    """
+    Stream one CSV to parquet. Columns are read as text and cast to `schema`
+    (inferred when not given); values that fail the cast become null and are
+    counted as rejects. Records with more fields than the header are dropped and
+    counted as rejects too. `sort_keys` is opt-in: sorting loads the whole file
+    into memory.
+    """
+    t0 = time.perf_counter()
+    schema = schema or infer_schema(csv_file)
+    keys = [k for k in (sort_keys or []) if k in schema]
+    tmp = parquet_file.with_name(parquet_file.name + ".tmp")
+    try:
+        ragged: list[int] = []
+        stats = _convert(csv_file, tmp, schema, keys, row_group_size, ragged)
+    except pl.exceptions.ComputeError as e:
+        if "more fields" not in str(e):
+            raise
+        # rare: find the offending records, then rescan without them
+        ragged = ragged_rows(csv_file, len(schema))
+        stats = _convert(csv_file, tmp, schema, keys, row_group_size, ragged)
+    tmp.replace(parquet_file)
+
+    return {
+        "file": csv_file.name,
+        "parquet": str(parquet_file),
+        "rows": stats.pop("__rows__") + len(ragged),
+        "rejected_rows": stats.pop("__rejected__") + len(ragged),
+        "ragged_rows": len(ragged),
+        "rejected_by_column": {c: n for c, n in stats.items() if n},
+        "schema": {c: str(dt) for c, dt in schema.items()},
+        "sorted_by": keys,
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+
+def _convert(
+    csv_file: Path,
+    out: Path,
+    schema: dict[str, pl.DataType],
+    keys: list[str],
+    row_group_size: int,
+    ragged: list[int],
+) -> dict:
+    """Write `out` and return the row / reject counts of the rows kept."""
+    casts = {c: dt for c, dt in schema.items() if dt != pl.String}
+    raw = pl.scan_csv(
+        csv_file,
+        has_header=True,
+        infer_schema=False,
+        low_memory=True,
+        truncate_ragged_lines=bool(ragged),
+    )
+    if ragged:
+        raw = (
+            raw.with_row_index("__row__")
+            .filter(~pl.col("__row__").is_in(ragged))
+            .drop("__row__")
+        )
+    typed = raw.with_columns(
+        [pl.col(c).cast(dt, strict=False) for c, dt in casts.items()]
+    )
+    if keys:
+        typed = typed.sort(keys)
+
+    failed = [
+        (pl.col(c).is_not_null() & pl.col(c).cast(dt, strict=False).is_null()).alias(c)
+        for c, dt in casts.items()
+    ]
+    counts = raw.select(
+        pl.len().alias("__rows__"),
+        (pl.any_horizontal(failed) if failed else pl.lit(False))
+        .sum()
+        .alias("__rejected__"),
+        *[f.sum() for f in failed],
+    )
+
+    sink = typed.sink_parquet(
+        out,
+        compression="zstd",
+        statistics=True,
+        row_group_size=row_group_size,
+        lazy=True,
+    )
+    # one call, so the scan of the CSV can be shared between the two queries
+    _, stats = pl.collect_all([sink, counts])
+    return stats.row(0, named=True)
+
+
+def ingest_local(
+    src_dir: str | Path,
+    out_dir: str | Path,
+    max_workers: int = 4,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    sort_keys: list[str] | None = None,
+) -> list[dict]:
+    """
+    Convert every CSV under src_dir to parquet concurrently (no network). A file
+    that fails is recorded with its error in the manifest; the others go on.
+    """
+    src_dir, out_dir = Path(src_dir), Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
+    csv_files = sorted(src_dir.glob("*.csv"))
+    if not csv_files:
+        raise FileNotFoundError(f"No .csv files found in {src_dir}")
 
-    # Convert all CSV files in the dataset folder to Parquet
-    for csv_file in data_dir.glob("*.csv"):
+    def _one(csv_file: Path) -> dict:
         parquet_file = out_dir / (csv_file.stem + ".parquet")
         print(f"Converting {csv_file} -> {parquet_file}")
+        try:
+            return convert_csv(csv_file, parquet_file, row_group_size, sort_keys)
+        except Exception as e:
+            parquet_file.with_name(parquet_file.name + ".tmp").unlink(missing_ok=True)
+            return {"file": csv_file.name, "error": f"{type(e).__name__}: {e}"}
 
-        # Use Polars Lazy API (streaming), with safer options
-        (
-            pl.scan_csv(
-                csv_file,
-                has_header=True,
-                ignore_errors=True,
-                infer_schema_length=1000,
-                low_memory=True,
-            ).sink_parquet(parquet_file, statistics=True, compression="zstd")
-        )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_one, csv_files))
+
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(results, indent=2))
+    for r in results:
+        if "error" in r:
+            print(f"  {r['file']}: FAILED ({r['error']})")
+        else:
+            print(f"  {r['file']}: {r['rows']} rows, {r['rejected_rows']} rejected")
+    return results
 
-    return out_dir
+
+def download_and_convert(dataset: str, out_dir: str | Path, **ingest_kwargs):
+    import kagglehub  # only needed for the download path
+
+    # Download Kaggle dataset (returns a local directory path)
+    path = kagglehub.dataset_download(dataset)
+    return ingest_local(path, out_dir, **ingest_kwargs)
 
 
 if __name__ == "__main__":
-    out = download_and_convert(
-        dataset="asaniczka/1-3m-linkedin-jobs-and-skills-2024", out_dir="data/raw"
+    ap = argparse.ArgumentParser(description="Download/convert Kaggle CSVs to parquet.")
+    ap.add_argument(
+        "--src",
+        type=Path,
+        default=None,
+        help="Local folder of CSVs to ingest (skips the Kaggle download).",
     )
-    print("All CSV converted to Parquet under:", out)
+    ap.add_argument("--out", type=Path, default=Path("data/raw"))
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    ap.add_argument(
+        "--sort-by",
+        nargs="*",
+        default=None,
+        help="Sort each file by these columns when present, e.g. job_link "
+        "(off by default: sorting holds a whole file in memory).",
+    )
+    args = ap.parse_args()
+
+    kwargs = dict(
+        max_workers=args.workers,
+        row_group_size=args.row_group_size,
+        sort_keys=args.sort_by,
+    )
+    if args.src is not None:
+        results = ingest_local(args.src, args.out, **kwargs)
+    else:
+        results = download_and_convert(
+            dataset="asaniczka/1-3m-linkedin-jobs-and-skills-2024",
+            out_dir=args.out,
+            **kwargs,
+        )
+    failed = [r["file"] for r in results if "error" in r]
+    if failed:
+        sys.exit(f"{len(failed)} file(s) failed, see {args.out / MANIFEST_NAME}")
+    print("All CSV converted to Parquet under:", args.out)
@@ -0,0 +1,283 @@
+# scripts/make_synthetic_data.py
+"""
+Generate realistic *raw* job-posting parquet at any scale (10k .. 10M rows),
+without the Kaggle download. Files are written in chunks, and each chunk uses one
+of several schema variants so every candidate-column branch of
+CleanJobTransformer gets exercised.
+
+    python scripts/make_synthetic_data.py --rows 1000000 --out data/synthetic/raw
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import pathlib
+
+import numpy as np
+import polars as pl
+
+PROJ = pathlib.Path(__file__).resolve().parents[1]
+DEFAULT_OUT = PROJ / "data" / "synthetic" / "raw"
+
+# -------------------------
+# Vocabularies
+# -------------------------
+ROLES = [
+    "data scientist",
+    "data analyst",
+    "data engineer",
+    "software engineer",
+    "machine learning engineer",
+    "business analyst",
+    "product manager",
+    "registered nurse",
+    "account executive",
+    "project manager",
+    "sales associate",
+    "mechanical engineer",
+]
+TITLE_PREFIXES = [
+    "",
+    "",
+    "",
+    "senior ",
+    "sr. ",
+    "junior ",
+    "lead ",
+    "staff ",
+    "intern ",
+]
+TITLE_SUFFIXES = ["", "", " ii", " - remote", " (hybrid)", ", analytics"]
+COMPANIES = [
+    f"{a} {b}"
+    for a in (
+        "Acme",
+        "Globex",
+        "Initech",
+        "Umbrella",
+        "Hooli",
+        "Stark",
+        "Wayne",
+        "Tyrell",
+        "Wonka",
+        "Cyberdyne",
+    )
+    for b in ("Inc", "LLC", "Labs", "Group", "Health", "Systems")
+]
+LOCATIONS = [
+    "San Francisco, CA",
+    "New York, NY",
+    "Austin, TX",
+    "Seattle, WA",
+    "Boston, MA",
+    "Chicago, IL",
+    "Denver, CO",
+    "Remote, US",
+    "San Francisco Bay Area",
+    "Greater Chicago Area",
+    "London, England, United Kingdom",
+    "Toronto, ON, Canada",
+]
+SKILLS = [
+    "python",
+    "sql",
+    "spark",
+    "aws",
+    "azure",
+    "gcp",
+    "docker",
+    "kubernetes",
+    "pandas",
+    "tableau",
+    "power bi",
+    "excel",
+    "java",
+    "scala",
+    "c++",
+    "airflow",
+    "dbt",
+    "snowflake",
+    "machine learning",
+    "deep learning",
+    "statistics",
+    "communication",
+    "leadership",
+    "patient care",
+    "salesforce",
+    "autocad",
+]
+WORK_TYPES = ["Onsite", "Remote", "Hybrid"]
+LEVELS = ["Entry level", "Mid senior", "Associate", "Director", "Internship"]
+SENTENCES = [
+    "we are looking for a motivated teammate to join our growing team.",
+    "you will work closely with stakeholders across the business.",
+    "this role offers a hybrid schedule with flexible hours.",
+    "this is a fully remote position; work from home anywhere in the us.",
+    "the position is on-site at our downtown office.",
+    "experience with cloud platforms and modern tooling is a plus.",
+    "you will build reliable pipelines and dashboards.",
+    "strong written and verbal communication skills are required.",
+    "we offer competitive salary, equity and full benefits.",
+    "responsibilities include mentoring junior colleagues.",
+]
+
+# target column -> source column name, per schema variant
+# (names are taken from CleanJobTransformer's candidate lists)
+VARIANTS = {
+    "linkedin": {
+        "title": "job_title",
+        "company": "company",
+        "location": "job_location",
+        "posted": "first_seen",
+        "desc": "job_summary",
+        "skills": "job_skills",
+        "work_type": "job_type",
+        "seniority": "job_level",
+    },
+    "generic": {
+        "title": "title",
+        "company": "company_name",
+        "location": "location",
+        "posted": "posted_at",
+        "desc": "description",
+        "skills": "skills",
+        "work_type": "work_type",
+        "seniority": "seniority",
+    },
+    "legacy": {
+        "title": "position",
+        "company": "employer",
+        "location": "city",
+        "posted": "date_posted",
+        "desc": "job_description",
+        "skills": "tags",
+        "work_type": "employment_type",
+        "seniority": "experience_level",
+    },
+}
+
+# A pool of pre-rendered values is gathered by random index, which keeps the
+# generator vectorized (no per-row Python) even at 10M rows.
+POOL_SIZE = 4096
+
+
+def make_pools(rng: np.random.Generator) -> dict[str, list[str]]:
+    """Pre-rendered titles, descriptions and CSV/JSON skill strings."""
+    titles = [
+        f"{p}{r}{s}" for p in TITLE_PREFIXES for r in ROLES for s in TITLE_SUFFIXES
+    ]
+    descs = [
+        " ".join(rng.choice(SENTENCES, size=rng.integers(2, 7)))
+        for _ in range(POOL_SIZE)
+    ]
+    skill_sets = [
+        list(rng.choice(SKILLS, size=rng.integers(1, 8), replace=False))
+        for _ in range(POOL_SIZE)
+    ]
+    return {
+        "title": titles + [t.title() for t in titles],
+        "desc": descs,
+        # both encodings seen in the wild: "a, b" and '["a", "b"]'
+        "skills_csv": [", ".join(s) for s in skill_sets],
+        "skills_json": [json.dumps(s) for s in skill_sets],
+    }
+
+
+def _with_nulls(s: pl.Series, rate: float, rng: np.random.Generator) -> pl.Series:
+    if rate <= 0:
+        return s
+    mask = pl.Series(rng.random(len(s)) < rate)
+    return pl.select(pl.when(mask).then(None).otherwise(s)).to_series().alias(s.name)
+
+
+def make_chunk(
+    n: int,
+    variant: str,
+    rng: np.random.Generator,
+    pools: dict[str, list[str]],
+    start_id: int = 0,
+) -> pl.DataFrame:
+    """One chunk of n raw rows using the given schema variant."""
+    names = VARIANTS[variant]
+
+    def pick(values: list[str], name: str) -> pl.Series:
+        idx = rng.integers(0, len(values), size=n)
+        return pl.Series(name, values).gather(idx)
+
+    start = np.datetime64("2024-01-01T00:00:00")
+    seconds = rng.integers(0, 90 * 24 * 3600, size=n).astype("timedelta64[s]")
+    posted = pl.Series(names["posted"], (start + seconds).astype("datetime64[ms]"))
+    if variant == "generic":
+        # ISO with a UTC suffix exercises the tz-aware parse branch
+        posted = posted.dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    else:
+        posted = posted.dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    skills_pool = pools["skills_json" if variant == "generic" else "skills_csv"]
+    cols = [
+        pl.Series("job_link", np.arange(start_id, start_id + n))
+        .cast(pl.Utf8)
+        .str.pad_start(10, "0"),
+        pick(pools["title"], names["title"]),
+        pick(COMPANIES, names["company"]),
+        pick(LOCATIONS, names["location"]),
+        posted,
+        _with_nulls(pick(pools["desc"], names["desc"]), 0.05, rng),
+        _with_nulls(pick(skills_pool, names["skills"]), 0.1, rng),
+        # most real postings lack these, which forces the derive transformers
+        _with_nulls(pick(WORK_TYPES, names["work_type"]), 0.6, rng),
+        _with_nulls(pick(LEVELS, names["seniority"]), 0.6, rng),
+    ]
+    return pl.DataFrame(cols)
+
+
+def generate(
+    rows: int,
+    out_dir: str | pathlib.Path = DEFAULT_OUT,
+    chunk_rows: int = 250_000,
+    seed: int = 42,
+    variants: list[str] | None = None,
+) -> list[pathlib.Path]:
+    """Write `rows` synthetic raw rows as chunked parquet files; return the paths."""
+    variants = variants or list(VARIANTS)
+    # small runs still write one file per variant
+    chunk_rows = max(1, min(chunk_rows, math.ceil(rows / len(variants))))
+    out_dir = pathlib.Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    pools = make_pools(rng)
+
+    paths = []
+    for i, start in enumerate(range(0, rows, chunk_rows)):
+        n = min(chunk_rows, rows - start)
+        variant = variants[i % len(variants)]
+        df = make_chunk(n, variant, rng, pools, start_id=start)
+        path = out_dir / f"synthetic_{variant}_{i:04d}.parquet"
+        df.write_parquet(path, compression="zstd")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Generate synthetic raw job parquet.")
+    ap.add_argument("--rows", type=int, default=10_000)
+    ap.add_argument("--out", type=pathlib.Path, default=DEFAULT_OUT)
+    ap.add_argument("--chunk-rows", type=int, default=250_000)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument(
+        "--variants",
+        nargs="+",
+        choices=sorted(VARIANTS),
+        default=None,
+        help="Schema variants to rotate through (default: all).",
+    )
+    args = ap.parse_args()
+
+    paths = generate(args.rows, args.out, args.chunk_rows, args.seed, args.variants)
+    print(f"Wrote {args.rows} rows in {len(paths)} files under {args.out}")
+
+
+if __name__ == "__main__":
+    main()
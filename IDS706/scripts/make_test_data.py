@@ -6,7 +6,7 @@ import os
 import pathlib
 import random
 import sys
-from typing import Iterable, Optional, List
+from typing import Optional, List
 
 import polars as pl
 
@@ -21,37 +21,37 @@ OUT = PROJ / "data" / "test"
 DEFAULT_SEED = int(os.getenv("TINY_SEED", 42))
 DEFAULT_N_PER_GROUP = int(os.getenv("TINY_N_PER_GROUP", 2))  # rows per group
 DEFAULT_MAX_ROWS = int(os.getenv("TINY_MAX_ROWS", 2000))  # global cap
+DEFAULT_BATCH_SIZE = int(os.getenv("TINY_BATCH_SIZE", 200_000))  # rows per batch
 DEFAULT_GEN_TOP_SKILLS = os.getenv(
     "TINY_GEN_TOP_SKILLS", "1"
 )  # "1" to enable, "0" to disable
 
+TINY_COLUMNS = [
+    "job_id",
+    "title",
+    "title_lc",
+    "company",
+    "location",
+    "desc",
+    "posted_at",
+    "skills_list",
+]
+
 random.seed(DEFAULT_SEED)
 OUT.mkdir(parents=True, exist_ok=True)
 
-# Ensure project src on sys.path (future-proof)
-if str(PROJ / "src") not in sys.path:
-    sys.path.append(str(PROJ / "src"))
+# Ensure project root on sys.path so "src" imports as a package
+if str(PROJ) not in sys.path:
+    sys.path.append(str(PROJ))
+
+from src.infra.normalization import DEFAULT_PLAN  # noqa: E402
+from src.infra.sampling import StreamingStratifiedSampler  # noqa: E402
+from src.infra.transformers import SkillsJoinTransformer  # noqa: E402
 
 
 # -------------------------
 # Helpers
 # -------------------------
-def stratified_sample(
-    df: pl.DataFrame, by: str, n_per_group: int, seed: int
-) -> pl.DataFrame:
-    """Stratified sampling: take up to n_per_group rows from each group."""
-    if by not in df.columns:
-        raise ValueError(
-            f'Stratified sample "by" column "{by}" not found. Available: {df.columns}'
-        )
-    return (
-        df.with_columns(pl.int_range(0, pl.len()).shuffle(seed=seed).alias("__rand__"))
-        .with_columns(pl.col("__rand__").rank("ordinal").over(by).alias("__rk__"))
-        .filter(pl.col("__rk__") <= n_per_group)
-        .drop(["__rand__", "__rk__"])
-    )
-
-
 def read_if_exists(path: pathlib.Path) -> Optional[pl.LazyFrame]:
     """Return a LazyFrame if parquet exists, else None."""
     return pl.scan_parquet(path) if path.exists() else None
@@ -62,98 +62,10 @@ def normalize_lazy(lf: pl.LazyFrame) -> pl.LazyFrame:
     Normalize raw columns into a consistent schema:
       job_id, title, title_lc, company, location, desc, posted_at, skills_list
 
-    This is a lightweight/standalone version aligned with your CleanJobTransformer.
-    It inspects the *source* schema first to pick best-matching columns.
+    Uses the same NormalizationPlan as CleanJobTransformer (applied per source,
+    to avoid concat issues), keeping only the columns the fixture needs.
     """
-    # collect_schema per-source (avoid concat issues)
-    schema_names = set(lf.collect_schema().names())
-
-    def pick(cands: Iterable[str]) -> pl.Expr:
-        for c in cands:
-            if c in schema_names:
-                return pl.col(c)
-        return pl.lit(None)
-
-    title_candidates = ["job_title", "title", "position"]
-    company_candidates = ["company", "company_name", "employer"]
-    location_candidates = ["location", "job_location", "city"]
-    posted_candidates = [
-        "posted_time",
-        "posted_at",
-        "date_posted",
-        "post_date",
-        "first_seen",
-        "last_processed_time",
-        "created_at",
-        "timestamp",
-    ]
-    desc_candidates = ["description", "job_description", "desc", "job_summary"]
-    skills_candidates = ["skills", "skill_list", "tags", "job_skills"]
-    jobid_candidates = ["job_id", "id", "jobkey", "posting_id"]
-
-    # 1) map source columns -> normalized columns
-    lf = lf.with_columns(
-        [
-            pick(title_candidates).cast(pl.Utf8).alias("title"),
-            pick(company_candidates).cast(pl.Utf8).alias("company"),
-            pick(location_candidates).cast(pl.Utf8).alias("location"),
-            pick(posted_candidates).cast(pl.Utf8).alias("posted_raw"),
-            pick(desc_candidates).cast(pl.Utf8).alias("desc"),
-            pick(skills_candidates).cast(pl.Utf8).alias("skills_raw"),
-            pick(jobid_candidates).alias("job_id"),
-        ]
-    )
-
-    # 2) derive title_lc & posted_at
-    lf = lf.with_columns(
-        [
-            pl.when(pl.col("title").is_not_null())
-            .then(pl.col("title").str.to_lowercase())
-            .otherwise(pl.lit(None))
-            .alias("title_lc"),
-            pl.coalesce(
-                [
-                    # try parse as tz-aware UTC then drop tz
-                    pl.col("posted_raw")
-                    .str.strptime(pl.Datetime(time_zone="UTC"), strict=False)
-                    .dt.replace_time_zone(None),
-                    # fallback naive datetime
-                    pl.col("posted_raw").str.strptime(pl.Datetime, strict=False),
-                ]
-            ).alias("posted_at"),
-        ]
-    )
-
-    # 3) normalize skills as list[str]
-    lf = lf.with_columns(
-        [
-            pl.when(pl.col("skills_raw").is_not_null())
-            .then(
-                pl.when(pl.col("skills_raw").str.starts_with("["))
-                .then(pl.col("skills_raw").str.json_decode(pl.List(pl.Utf8)))
-                .otherwise(pl.col("skills_raw").str.split(","))
-            )
-            .otherwise(pl.lit([]))
-            .list.eval(pl.element().cast(pl.Utf8).str.strip_chars().str.to_lowercase())
-            .alias("skills_list")
-        ]
-    )
-
-    # 4) final projection + basic filtering
-    lf = lf.select(
-        [
-            "job_id",
-            "title",
-            "title_lc",
-            "company",
-            "location",
-            "desc",
-            "posted_at",
-            "skills_list",
-        ]
-    ).filter(pl.col("title").is_not_null() & pl.col("company").is_not_null())
-
-    return lf
+    return DEFAULT_PLAN.apply(lf).select(TINY_COLUMNS)
 
 
 def write_parquet(df: pl.DataFrame, path: pathlib.Path) -> None:
@@ -170,6 +82,12 @@ def main() -> None:
     ap.add_argument("--seed", type=int, default=DEFAULT_SEED)
     ap.add_argument("--n-per-group", type=int, default=DEFAULT_N_PER_GROUP)
     ap.add_argument("--max-rows", type=int, default=DEFAULT_MAX_ROWS)
+    ap.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per streamed batch while sampling (bounds memory).",
+    )
     ap.add_argument(
         "--gen-top-skills",
         type=int,
@@ -201,28 +119,36 @@ def main() -> None:
         else pl.concat(normalized_sources, how="vertical")
     )
 
-    # Collect to DataFrame for sampling
-    jobs_df = base_norm.collect()
+    # Stratified sample to keep diversity (streamed in batches; the normalized
+    # table is never collected whole), then apply a global cap
+    tiny_jobs = StreamingStratifiedSampler(
+        by="title_lc",
+        n_per_group=args.n_per_group,
+        seed=args.seed,
+        batch_size=args.batch_size,
+    ).sample(base_norm)
 
-    if (
-        "title_lc" not in jobs_df.columns
-        or jobs_df["title_lc"].null_count() == jobs_df.height
-    ):
+    if tiny_jobs.height == 0 or tiny_jobs["title_lc"].null_count() == tiny_jobs.height:
         raise ValueError(
             "No usable title/title_lc found after normalization. "
             "Check your raw files' column names."
         )
 
-    # Prefer title_lc for grouping
-    by_col = "title_lc" if "title_lc" in jobs_df.columns else "title"
-
-    # Stratified sample to keep diversity, then apply a global cap
-    tiny_jobs = stratified_sample(
-        jobs_df, by=by_col, n_per_group=args.n_per_group, seed=args.seed
-    )
     if tiny_jobs.height > args.max_rows:
         tiny_jobs = tiny_jobs.head(args.max_rows)
 
+    # Enrich the sample with real skills from job_skills (lazy semi-join + join;
+    # the skills table is never collected whole)
+    skills_join = None
+    if (
+        job_skills_lf is not None
+        and tiny_jobs["job_id"].null_count() < tiny_jobs.height
+    ):
+        skills_join = SkillsJoinTransformer(
+            job_skills_lf, keys=tiny_jobs.lazy().select("job_id")
+        )
+        tiny_jobs = skills_join.run(tiny_jobs.lazy()).collect()
+
     # Inject edge cases on 'desc' if possible
     if "desc" in tiny_jobs.columns and tiny_jobs.height >= 2:
         long_text = (
@@ -250,25 +176,14 @@ def main() -> None:
 
     # Optional: build top_skills
     if args.gen_top_skills:
-        if job_skills_lf is not None and "job_id" in tiny_jobs.columns:
-            tiny_ids = set(tiny_jobs["job_id"].drop_nulls().to_list())
-            skills_df = job_skills_lf.collect()
-            if {"job_id", "skill"}.issubset(skills_df.columns):
-                tiny_sk = skills_df.filter(pl.col("job_id").is_in(list(tiny_ids)))
-                top_skills = (
-                    tiny_sk.group_by("skill")
-                    .agg(pl.len().alias("count"))
-                    .sort(pl.col("count"), descending=True)
-                )
-            else:
-                top_skills = (
-                    tiny_jobs.with_columns(pl.col("skills_list").alias("skill"))
-                    .explode("skill")
-                    .drop_nulls("skill")
-                    .group_by("skill")
-                    .agg(pl.len().alias("count"))
-                    .sort(pl.col("count"), descending=True)
-                )
+        if skills_join is not None:
+            top_skills = (
+                skills_join.skills_long()
+                .group_by("skill")
+                .agg(pl.len().alias("count"))
+                .sort(pl.col("count"), descending=True)
+                .collect()
+            )
         else:
             top_skills = (
                 tiny_jobs.with_columns(pl.col("skills_list").alias("skill"))
@@ -1,15 +1,212 @@
 import typer
-from .pipeline import JobsPipeline
+from pathlib import Path
 
+from ..settings import SILVER_PATH, GOLD_DIR, K_SWEEP_PATH, KMEANS_KS, REPORTS_DIR
+from ..utils.config import ensure_dirs
+from ..utils.runtime import ENGINES, RuntimeConfig, current
+
+# Commands import polars-backed modules in their bodies: the runtime config
+# (thread pool size in particular) must be applied before polars is loaded.
 app = typer.Typer()
 
 
+@app.callback()
+def main(
+    engine: str = typer.Option(
+        None, help=f"Polars engine for every collect/sink: {' | '.join(ENGINES)}."
+    ),
+    threads: int = typer.Option(None, help="Polars thread pool size."),
+    chunk_size: int = typer.Option(None, help="Rows per streaming chunk."),
+    memory_limit_mb: int = typer.Option(
+        None, help="Advisory; with engine auto, switches to streaming."
+    ),
+    config: Path = typer.Option(
+        None, help="TOML runtime config (default: jobs.toml if present)."
+    ),
+):
+    """Jobs pipeline CLI. Runtime options also read JOBS_* env vars."""
+    try:
+        RuntimeConfig.load(
+            config,
+            engine=engine,
+            threads=threads,
+            chunk_size=chunk_size,
+            memory_limit_mb=memory_limit_mb,
+        ).apply()
+    except (ValueError, FileNotFoundError) as e:
+        raise typer.BadParameter(str(e))
+
+
 @app.command()
-def build():
+def build(
+    profile: bool = typer.Option(
+        False, "--profile", help="Record per-stage timings/RSS/rows to a JSON report."
+    ),
+    polars_profile: bool = typer.Option(
+        False, help="With --profile, also run Polars profile() per plan (slower)."
+    ),
+):
     """Build pipeline."""
-    JobsPipeline().build()
+    from .pipeline import JobsPipeline
+    from ..infra.profiling import StageProfiler
+
+    typer.echo("runtime:\n" + current().describe())
+    profiler = StageProfiler(polars_profile=polars_profile) if profile else None
+    JobsPipeline(profiler=profiler).build()
+    if profiler is not None:
+        typer.echo(profiler.summary())
+        typer.echo(f"Profile report: {profiler.write_report(REPORTS_DIR)}")
     typer.echo("build done.")
 
 
+@app.command()
+def rollups(
+    full: bool = typer.Option(
+        False, help="Rebuild from scratch, not from the watermark."
+    ),
+):
+    """
+    Update the daily/weekly/monthly posting and skill rollups from silver.
+
+    Incremental by default, for silver that only gained newer postings since the
+    last run. `build` always rebuilds the rollups in full.
+    """
+    from .pipeline import JobsPipeline
+
+    JobsPipeline().update_rollups(full=full)
+    typer.echo("rollups done.")
+
+
+@app.command()
+def features():
+    """Fit (or reuse cached) TF-IDF features over silver text."""
+    from ..infra.features import TfidfFeatureStore
+
+    fs = TfidfFeatureStore().get_or_build(SILVER_PATH)
+    n_docs, n_terms = fs.matrix.shape
+    typer.echo(f"features {fs.key}: {n_docs} docs x {n_terms} terms")
+
+
+@app.command()
+def sweep(
+    k: list[int] = typer.Option(KMEANS_KS, "--k", help="K values to try."),
+    workers: int = typer.Option(0, help="Process count (0 = one per K, up to CPUs)."),
+    sample_size: int = typer.Option(20_000, help="Rows used for silhouette."),
+):
+    """Fit KMeans for every K in parallel and write a gold metrics table."""
+    from ..infra.features import TfidfFeatureStore
+    from ..infra.io_polars import PolarsLocalRepository
+    from ..infra.model_selection import KMeansSweep
+
+    store = TfidfFeatureStore()
+    fs = store.get_or_build(SILVER_PATH)
+    metrics = KMeansSweep(k, sample_size=sample_size, max_workers=workers or None).run(
+        store, fs.key
+    )
+    ensure_dirs(GOLD_DIR)
+    PolarsLocalRepository().save_lazy(metrics, str(K_SWEEP_PATH))
+    typer.echo(metrics)
+    typer.echo(f"K sweep written: {K_SWEEP_PATH}")
+
+
+@app.command()
+def similar_index(
+    components: int = typer.Option(128, help="SVD dimensions per vector."),
+):
+    """Build the nearest-job similarity index over silver text."""
+    from ..infra.similarity import SimilarityIndex
+
+    idx = SimilarityIndex.build(SILVER_PATH, n_components=components)
+    typer.echo(f"similarity index: {len(idx.row_ids)} rows, {len(idx.centroids)} lists")
+
+
+@app.command()
+def similar(
+    text: str = typer.Argument(None, help="Free-text query."),
+    row: int = typer.Option(None, help="Silver row id to find neighbours of."),
+    k: int = typer.Option(10, help="Number of results."),
+):
+    """Query the similarity index by text or by silver row id."""
+    if text is None and row is None:
+        raise typer.BadParameter("give TEXT or --row")
+    from ..infra.similarity import SimilarityIndex
+
+    idx = SimilarityIndex.load()
+    try:
+        hits = idx.similar_to(row, k=k) if row is not None else idx.query(text, k=k)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    typer.echo(hits)
+
+
+@app.command()
+def text_index():
+    """Build the inverted keyword index over silver text."""
+    from ..infra.text_index import TextIndex
+
+    idx = TextIndex.build(SILVER_PATH)
+    typer.echo(f"text index: {idx.n_docs} docs")
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(..., help='e.g. python "machine learning" -intern'),
+    limit: int = typer.Option(20, help="Rows to print."),
+):
+    """Boolean / phrase keyword search over silver text."""
+    from ..infra.text_index import TextIndex
+
+    idx = TextIndex.load()
+    try:
+        ids = idx.search(query)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    typer.echo(f"{len(ids)} matching rows")
+    typer.echo(idx.frame(ids[:limit]))
+
+
+@app.command()
+def catalog(
+    dataset: str = typer.Argument(None, help="Dataset to summarize (default: list)."),
+    column: str = typer.Option(None, help="With --lo/--hi: row groups to read."),
+    lo: str = typer.Option(None, help="Lower bound (inclusive), e.g. 2024-03-01."),
+    hi: str = typer.Option(None, help="Upper bound (inclusive)."),
+):
+    """Row counts, null rates, min/max and pruning from parquet footers only."""
+    from ..infra.catalog import DatasetCatalog
+
+    cat = DatasetCatalog()
+    files = cat.refresh()  # re-reads only new or changed footers
+    if dataset is None:
+        typer.echo(files.drop("mtime_ns"))
+        return
+    try:
+        if column is None:
+            typer.echo(f"{dataset}: {cat.row_count(dataset)} rows")
+            typer.echo(cat.summary(dataset))
+        else:
+            hits = cat.prune(dataset, column, lo, hi)
+            total = cat.row_count(dataset)
+            typer.echo(
+                f"{hits.height} row groups, <= {hits['num_rows'].sum()} of "
+                f"{total} rows may match"
+            )
+            typer.echo(hits)
+    except (KeyError, ValueError) as e:
+        raise typer.BadParameter(str(e.args[0]) if e.args else str(e))
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Bind address."),
+    port: int = typer.Option(8000, help="Port."),
+):
+    """Serve cached top-skills / counts-over-time queries as local JSON HTTP."""
+    from .query import QueryService, serve as serve_http
+
+    typer.echo(f"Serving on http://{host}:{port} (/top-skills, /counts)")
+    serve_http(QueryService(), host, port)
+
+
 if __name__ == "__main__":
     app()
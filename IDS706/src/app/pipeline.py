@@ -1,4 +1,8 @@
-from ..utils.config import ensure_dirs, list_parquet_files
+from contextlib import nullcontext
+
+import polars as pl
+
+from ..utils.config import ensure_dirs, list_parquet_files, write_options
 from ..settings import (
     RAW_DIR,
     BRONZE_DIR,
@@ -8,22 +12,29 @@ from ..settings import (
     SILVER_PATH,
     TOP_SKILLS_PATH,
     TARGET_ROLES,
+    JOB_SKILLS_PATH,
+    ROLLUP_PATHS,
 )
 from ..infra.io_polars import PolarsLocalRepository
 from ..infra.transformers import (
     CleanJobTransformer,
+    SkillsJoinTransformer,
     RoleFilterTransformer,
     TextJoinTransformer,
     DeriveWorkTypeTransformer,
     DeriveSeniorityTransformer,
+    LocationNormalizeTransformer,
 )
-from ..infra.aggregators import TopSkillsAggregator
+from ..infra.location_cache import LocationCache
+from ..infra.aggregators import PostingRollupAggregator, TopSkillsAggregator
+from ..infra.catalog import DatasetCatalog
+from ..infra.profiling import StageProfiler
 
 
 class JobsPipeline:
     """Orchestrates raw -> bronze -> silver -> gold tables."""
 
-    def __init__(self):
+    def __init__(self, profiler: StageProfiler | None = None):
         self.repo = PolarsLocalRepository()
         self.cleaner = CleanJobTransformer()
         self.role_filter = RoleFilterTransformer(TARGET_ROLES)
@@ -31,34 +42,133 @@ class JobsPipeline:
         self.topskills = TopSkillsAggregator(topk=40)
         self.worktype = DeriveWorkTypeTransformer()
         self.seniority = DeriveSeniorityTransformer()
+        self.location_cache = LocationCache()
+        self.rollups = PostingRollupAggregator(TARGET_ROLES)
+        self.profiler = profiler
+
+    def _stage(self, name: str, lf, **kwargs):
+        """Profile a stage when a profiler is attached; otherwise a no-op."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name, lf, **kwargs)
 
     def build(self) -> None:
         """Run the end-to-end table build with whatever is in data/raw."""
         ensure_dirs(BRONZE_DIR, SILVER_DIR, GOLD_DIR)
 
-        # 1) Load all raw parquet files
-        raw_files = [str(p) for p in list_parquet_files(RAW_DIR)]
+        # 1) Load all raw posting files (the skills table is joined, not unioned)
+        raw_files = [
+            str(p) for p in list_parquet_files(RAW_DIR) if p != JOB_SKILLS_PATH
+        ]
         if not raw_files:
             raise FileNotFoundError(f"No .parquet files found in {RAW_DIR}")
 
         lf = self.repo.load_many(raw_files)
+        scanned = list(raw_files)
 
-        # 2) Clean/normalize -> bronze
+        # 2) Clean/normalize (+ skills from job_skills by job id) -> bronze
         lf_bronze = self.cleaner.run(lf)
-        self.repo.save_lazy(lf_bronze, str(BRONZE_PATH))
+        if JOB_SKILLS_PATH.exists():
+            skills = self.repo.load_many([str(JOB_SKILLS_PATH)])
+            lf_bronze = SkillsJoinTransformer(skills).run(lf_bronze)
+            scanned.append(str(JOB_SKILLS_PATH))
 
-        # 3) Role filter + text join -> silver
-        lf_silver = self.role_filter.run(lf_bronze)
+        with self._stage(
+            "bronze",
+            lf_bronze,
+            scans=scanned,
+            rows_in_from=raw_files,
+            output=BRONZE_PATH,
+        ):
+            self.repo.save_lazy(lf_bronze, str(BRONZE_PATH), write_options("bronze"))
+
+        # 3) Role filter + text join + derived columns, from the bronze just written
+        lf_silver = self.role_filter.run(self.repo.load_many([str(BRONZE_PATH)]))
         lf_silver = self.texter.run(lf_silver)
         lf_silver = self.worktype.run(lf_silver)
         lf_silver = self.seniority.run(lf_silver)
-        self.repo.save_lazy(lf_silver, str(SILVER_PATH))
 
-        # 4) Top skills aggregate -> gold
+        # 4) Resolve each distinct location once (via the cache), then join
+        # city/state/country onto silver; only the columns the role filter and
+        # location need are read from bronze.
+        lf_locations = lf_silver.select(pl.col("location").unique())
+        with self._stage(
+            "locations", lf_locations, scans=[BRONZE_PATH], rows_in_from=[BRONZE_PATH]
+        ) as record:
+            mapping = self.location_cache.mapping(
+                self.repo.collect(lf_locations).to_series()
+            )
+            if record is not None:
+                record.update(self.location_cache.stats)
+        lf_silver = LocationNormalizeTransformer(mapping).run(lf_silver)
+
+        # 5) Top skills aggregate -> gold
         lf_top = self.topskills.aggregate(lf_silver)
-        self.repo.save_lazy(lf_top, str(TOP_SKILLS_PATH))
+
+        outputs = {
+            "silver": (lf_silver, SILVER_PATH, [BRONZE_PATH]),
+            "gold": (lf_top, TOP_SKILLS_PATH, [SILVER_PATH]),
+        }
+        if self.profiler is None:
+            # both at once: silver is computed once and shared with gold
+            self.repo.save_many(
+                {str(path): lf for lf, path, _ in outputs.values()},
+                {
+                    str(path): write_options(name)
+                    for name, (_, path, _) in outputs.items()
+                },
+            )
+        else:
+            # one stage at a time, so each gets its own timings
+            for name, (lf_out, path, rows_in_from) in outputs.items():
+                with self._stage(
+                    name,
+                    lf_out,
+                    scans=[BRONZE_PATH],
+                    rows_in_from=rows_in_from,
+                    output=path,
+                ):
+                    self.repo.save_lazy(lf_out, str(path), write_options(name))
+
+        # 6) Daily/weekly/monthly rollups from the silver just written -> gold.
+        # Always in full: silver is one file rewritten from raw, so any day may
+        # have changed, and finding which would take a silver scan that costs
+        # about as much as the aggregate. Incremental updates are `rollups` only.
+        self.update_rollups(full=True)
+
+        # 7) Footer stats of every output (metadata only, changed files only)
+        DatasetCatalog().refresh()
 
         # Optional: small console hints (no heavy collect)
         print(f"Bronze written: {BRONZE_PATH}")
         print(f"Silver written: {SILVER_PATH}")
         print(f"Top skills written: {TOP_SKILLS_PATH}")
+        print(f"Rollups written: {ROLLUP_PATHS['1d'].parent}/rollup_*.parquet")
+
+    def update_rollups(self, full: bool = False) -> None:
+        """
+        Extend the daily rollup from its watermark (or rebuild it with `full`),
+        then re-derive weekly and monthly from daily. The incremental path is
+        only correct when silver grew by postings on or after the watermark;
+        build() therefore always passes full=True.
+        """
+        ensure_dirs(GOLD_DIR)
+        daily_path = ROLLUP_PATHS["1d"]
+        previous = None
+        if daily_path.exists() and not full:
+            previous = self.repo.collect(self.repo.load_many([str(daily_path)]))
+
+        lf_silver = self.repo.load_many([str(SILVER_PATH)])
+        lf_daily = self.rollups.update(lf_silver, previous)
+        outputs = {str(daily_path): lf_daily} | {
+            str(ROLLUP_PATHS[every]): self.rollups.roll_up(lf_daily, every)
+            for every in ("1w", "1mo")
+        }
+        with self._stage(
+            "rollups",
+            lf_daily,
+            scans=[str(SILVER_PATH)],
+            rows_in_from=[SILVER_PATH],
+            output=daily_path,
+        ):
+            self.repo.save_many(outputs, {p: write_options("gold") for p in outputs})
@@ -0,0 +1,314 @@
+# src/app/query.py
+"""
+Read-side API over the pipeline outputs.
+
+Typed queries (frozen dataclasses) run against silver/gold through one
+QueryService, which caches the scanned frames and the query results in an LRU.
+Every call checks the source files' (mtime, size); when the pipeline writes a
+new version, both caches are dropped. Counts over time are read from the gold
+rollups when they exist, and from silver otherwise. `serve()` exposes the same
+queries over a small local HTTP server (stdlib only).
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import polars as pl
+
+from ..infra.aggregators import TOP_SKILLS_SORT, PostingRollupAggregator
+from ..settings import ROLLUP_PATHS, SILVER_PATH, TARGET_ROLES, TOP_SKILLS_PATH
+
+EVERY = ("1d", "1w", "1mo")
+SILVER_COLS = ["title_lc", "seniority", "work_type", "posted_at", "skills_list"]
+
+
+# -------------------------
+# Queries
+# -------------------------
+@dataclass(frozen=True)
+class _Filters:
+    # a target role means "first target role in the title", as in the rollups;
+    # any other role is matched as a whole phrase inside title_lc
+    role: str | None = None
+    seniority: str | None = None
+    work_type: str | None = None
+
+    def has_filters(self) -> bool:
+        return any((self.role, self.seniority, self.work_type))
+
+    def predicate(self) -> pl.Expr:
+        pred = pl.lit(True)
+        if self.role and self.role.lower() in TARGET_ROLES:
+            role = PostingRollupAggregator(TARGET_ROLES).role_expr()
+            pred &= role == self.role.lower()
+        elif self.role:
+            pattern = r"\b" + re.escape(self.role.lower()) + r"\b"
+            pred &= pl.col("title_lc").str.contains(pattern)
+        if self.seniority:
+            pred &= pl.col("seniority").str.to_lowercase() == self.seniority.lower()
+        if self.work_type:
+            pred &= pl.col("work_type").str.to_lowercase() == self.work_type.lower()
+        return pred
+
+    @classmethod
+    def from_params(cls, params: dict[str, str]):
+        """Build from string params (query string / CLI), casting ints."""
+        kwargs = {}
+        for f in fields(cls):
+            if f.name in params:
+                value = params[f.name]
+                kwargs[f.name] = int(value) if f.type is int else value
+        unknown = set(params) - set(kwargs)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters for {cls.__name__}: {sorted(unknown)}"
+            )
+        return cls(**kwargs)
+
+
+@dataclass(frozen=True)
+class TopSkillsQuery(_Filters):
+    """Most frequent skills, optionally for one role / seniority / work_type."""
+
+    k: int = 20
+
+    def __post_init__(self):
+        if self.k <= 0:
+            raise ValueError(f"k must be a positive integer, got {self.k}")
+
+
+@dataclass(frozen=True)
+class CountsOverTimeQuery(_Filters):
+    """Postings per day/week/month, optionally only those listing `skill`."""
+
+    every: str = "1w"
+    skill: str | None = None
+
+    def __post_init__(self):
+        if self.every not in EVERY:
+            raise ValueError(f"every must be one of {EVERY}, got {self.every!r}")
+
+
+# -------------------------
+# Service
+# -------------------------
+class _LRU:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _file_version(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class QueryService:
+    """Runs typed queries over silver/gold with version-checked LRU caching."""
+
+    def __init__(
+        self,
+        silver_path: str | Path = SILVER_PATH,
+        top_skills_path: str | Path = TOP_SKILLS_PATH,
+        rollup_paths: dict[str, Path] | None = None,
+        cache_size: int = 256,
+    ):
+        self.silver_path = Path(silver_path)
+        self.top_skills_path = Path(top_skills_path)
+        self.rollup_paths = {
+            every: Path(p)
+            for every, p in (
+                ROLLUP_PATHS if rollup_paths is None else rollup_paths
+            ).items()
+        }
+        self._frames = _LRU(maxsize=4)
+        self._results = _LRU(maxsize=cache_size)
+        self._version = None
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def version(self) -> tuple:
+        return (
+            _file_version(self.silver_path),
+            _file_version(self.top_skills_path),
+            *(_file_version(p) for p in self.rollup_paths.values()),
+        )
+
+    def _frame(self, path: Path, columns: list[str] | None = None) -> pl.DataFrame:
+        key = (str(path), tuple(columns or ()))
+        with self._lock:
+            df = self._frames.get(key)
+            version = self._version
+        if df is None:
+            if not path.exists():
+                raise FileNotFoundError(f"{path} not found; run the pipeline first.")
+            df = pl.read_parquet(path, columns=columns)
+            with self._lock:
+                if self._version == version:
+                    self._frames.put(key, df)
+        return df
+
+    def run(self, query: TopSkillsQuery | CountsOverTimeQuery) -> pl.DataFrame:
+        with self._lock:
+            version = self.version()
+            if version != self._version:
+                if self._version is not None:
+                    self.stats["invalidations"] += 1
+                self._frames.clear()
+                self._results.clear()
+                self._version = version
+
+            cached = self._results.get(query)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached
+            self.stats["misses"] += 1
+
+        # only the cache bookkeeping is locked; queries themselves run in parallel
+        result = self._execute(query)
+        with self._lock:
+            if self._version == version:  # not built from files since replaced
+                self._results.put(query, result)
+        return result
+
+    def _execute(self, query) -> pl.DataFrame:
+        if isinstance(query, TopSkillsQuery):
+            return self._top_skills(query)
+        if isinstance(query, CountsOverTimeQuery):
+            return self._counts_over_time(query)
+        raise TypeError(f"Unsupported query: {type(query).__name__}")
+
+    def _top_skills(self, q: TopSkillsQuery) -> pl.DataFrame:
+        if not q.has_filters() and self.top_skills_path.exists():
+            gold = self._frame(self.top_skills_path)
+            if q.k <= gold.height:  # gold already holds the global top-k
+                return gold.sort(**TOP_SKILLS_SORT).head(q.k)
+        return (
+            self._frame(self.silver_path, SILVER_COLS)
+            .lazy()
+            .filter(q.predicate())
+            .select(pl.col("skills_list").explode())
+            .filter(pl.col("skills_list").is_not_null() & (pl.col("skills_list") != ""))
+            .group_by("skills_list")
+            .agg(pl.len().alias("count"))
+            .sort(**TOP_SKILLS_SORT)
+            .head(q.k)
+            .collect()
+        )
+
+    def _counts_over_time(self, q: CountsOverTimeQuery) -> pl.DataFrame:
+        rollup = self.rollup_paths.get(q.every)
+        # rollups know the pipeline's target roles only; other roles need silver
+        if (
+            rollup
+            and rollup.exists()
+            and (not q.role or q.role.lower() in TARGET_ROLES)
+        ):
+            return self._counts_from_rollup(q, rollup)
+
+        pred = q.predicate() & pl.col("posted_at").is_not_null()
+        if q.skill:
+            pred &= pl.col("skills_list").list.contains(q.skill.lower())
+        return (
+            self._frame(self.silver_path, SILVER_COLS)
+            .lazy()
+            .filter(pred)
+            .group_by(
+                pl.col("posted_at").dt.truncate(q.every).dt.date().alias("period")
+            )
+            .agg(pl.len().alias("count"))
+            .sort("period")
+            .collect()
+        )
+
+    def _counts_from_rollup(self, q: CountsOverTimeQuery, path: Path) -> pl.DataFrame:
+        # skill = null rows hold the posting totals
+        pred = (
+            pl.col("skill") == q.skill.lower() if q.skill else pl.col("skill").is_null()
+        )
+        for dim in ("role", "seniority", "work_type"):
+            value = getattr(q, dim)
+            if value:
+                pred &= pl.col(dim) == value.lower()
+        return (
+            self._frame(path)
+            .lazy()
+            .filter(pred)
+            .group_by("period")
+            .agg(pl.col("postings").sum().cast(pl.UInt32).alias("count"))
+            .sort("period")
+            .collect()
+        )
+
+
+# -------------------------
+# Local HTTP stand-in
+# -------------------------
+ROUTES = {"/top-skills": TopSkillsQuery, "/counts": CountsOverTimeQuery}
+
+
+def make_server(
+    service: QueryService, host: str = "127.0.0.1", port: int = 8000
+) -> ThreadingHTTPServer:
+    """GET /top-skills?role=..&k=.. and /counts?every=1w&skill=.. -> JSON rows."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query_cls = ROUTES.get(url.path)
+            if query_cls is None:
+                return self._reply(404, {"error": f"unknown route {url.path}"})
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                query = query_cls.from_params(params)
+                rows = service.run(query).to_dicts()
+            except (ValueError, TypeError) as e:
+                return self._reply(400, {"error": str(e)})
+            except FileNotFoundError as e:
+                return self._reply(503, {"error": str(e)})
+            self._reply(200, {"query": asdict(query), "rows": rows})
+
+        def _reply(self, status: int, body: dict) -> None:
+            payload = json.dumps(body, default=str).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, fmt, *args):  # keep test/CLI output quiet
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(service: QueryService, host: str = "127.0.0.1", port: int = 8000) -> None:
+    with make_server(service, host, port) as server:
+        server.serve_forever()
@@ -1,6 +1,13 @@
+import re
+from datetime import date
+
 import polars as pl
 from ..domain.ports import Aggregator
 
+ROLLUP_DIMS = ["role", "seniority", "work_type", "skill"]
+# count desc, then skill asc: ties never reorder between gold and QueryService
+TOP_SKILLS_SORT = {"by": ["count", "skills_list"], "descending": [True, False]}
+
 
 class TopSkillsAggregator(Aggregator):
     def __init__(self, topk: int = 40):
@@ -13,6 +20,87 @@ class TopSkillsAggregator(Aggregator):
             .filter(pl.col("skills_list").is_not_null() & (pl.col("skills_list") != ""))
             .group_by("skills_list")
             .agg(pl.len().alias("count"))
-            .sort("count", descending=True)
+            .sort(**TOP_SKILLS_SORT)
             .head(self.topk)
         )
+
+
+class PostingRollupAggregator(Aggregator):
+    """
+    Daily posting counts by role / seniority / work_type / skill.
+
+    Each posting adds one row per listed skill plus one row with skill = null,
+    so `skill is null` rows are the posting totals. Role is the first target role
+    found in title_lc ("other" if none). Counts are additive, so weekly/monthly
+    tables are re-aggregated from daily with `roll_up`.
+    """
+
+    def __init__(self, roles: list[str]):
+        self.roles = roles
+
+    def role_expr(self) -> pl.Expr:
+        """First target role in title_lc, else "other" (QueryService matches it)."""
+        matches = [
+            pl.when(pl.col("title_lc").str.contains(rf"\b{re.escape(r)}\b")).then(
+                pl.lit(r)
+            )
+            for r in self.roles
+        ]
+        return pl.coalesce(matches + [pl.lit("other")]).alias("role")
+
+    def aggregate(self, lf: pl.LazyFrame, since: date | None = None) -> pl.LazyFrame:
+        pred = pl.col("posted_at").is_not_null()
+        if since is not None:
+            pred &= pl.col("posted_at") >= pl.lit(since).cast(pl.Datetime)
+        base = lf.filter(pred).select(
+            pl.col("posted_at").dt.date().alias("period"),
+            self.role_expr(),
+            pl.col("seniority").str.to_lowercase().fill_null("na"),
+            pl.col("work_type").str.to_lowercase().fill_null("na"),
+            pl.col("skills_list").list.unique(),  # a posting counts once per skill
+        )
+        per_skill = (
+            base.explode("skills_list")
+            .rename({"skills_list": "skill"})
+            .filter(pl.col("skill").is_not_null() & (pl.col("skill") != ""))
+        )
+        totals = base.drop("skills_list").with_columns(
+            pl.lit(None, dtype=pl.Utf8).alias("skill")
+        )
+        return (
+            pl.concat([totals, per_skill])
+            .group_by(["period", *ROLLUP_DIMS])
+            .agg(pl.len().alias("postings"))
+            .sort(["period", *ROLLUP_DIMS], nulls_last=False)
+        )
+
+    def update(
+        self, lf: pl.LazyFrame, previous: pl.DataFrame | None = None
+    ) -> pl.LazyFrame:
+        """
+        Extend a previous daily rollup with the days since its watermark (its last
+        day, recomputed because it may have been partial); earlier days are kept.
+        """
+        watermark = None if previous is None else previous["period"].max()
+        if watermark is None:
+            return self.aggregate(lf)
+        return pl.concat(
+            [
+                # column order of a reloaded rollup may differ (load_many sorts)
+                previous.lazy()
+                .filter(pl.col("period") < watermark)
+                .select(["period", *ROLLUP_DIMS, "postings"]),
+                self.aggregate(lf, since=watermark),
+            ]
+        )
+
+    @staticmethod
+    def roll_up(daily: pl.LazyFrame, every: str) -> pl.LazyFrame:
+        """Re-aggregate a daily rollup to "1w" / "1mo" periods."""
+        return (
+            daily.group_by(
+                [pl.col("period").dt.truncate(every).alias("period"), *ROLLUP_DIMS]
+            )
+            .agg(pl.col("postings").sum())
+            .sort(["period", *ROLLUP_DIMS], nulls_last=False)
+        )
@@ -0,0 +1,280 @@
+# src/infra/catalog.py
+"""
+Metadata-only catalog of the pipeline's parquet outputs.
+
+`refresh()` reads each file's footer with pyarrow (no data pages) and persists
+one row per file and one row per (file, row group, column) with row counts, null
+counts and min/max to data/catalog/. Files whose (mtime, size) did not change
+keep their previous rows. Row counts, null rates, value ranges and row-group
+pruning for a range predicate are then answered from those two small tables.
+"""
+
+import glob
+from datetime import date, datetime
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from ..settings import CATALOG_DATASETS, CATALOG_DIR
+from .io_polars import PolarsLocalRepository
+
+FILE_SCHEMA = {
+    "dataset": pl.Utf8,
+    "path": pl.Utf8,
+    "mtime_ns": pl.Int64,
+    "size": pl.Int64,
+    "num_rows": pl.Int64,
+    "num_row_groups": pl.Int32,
+    "created_by": pl.Utf8,
+}
+ROW_GROUP_SCHEMA = {
+    "dataset": pl.Utf8,
+    "path": pl.Utf8,
+    "row_group": pl.Int32,
+    "column": pl.Utf8,  # parquet column path, e.g. skills_list.list.element
+    "kind": pl.Utf8,  # how min/max parse back: int, float, bool, str, date, ...
+    "num_rows": pl.Int64,
+    "null_count": pl.Int64,  # null when the writer stored none
+    "min": pl.Utf8,
+    "max": pl.Utf8,
+}
+
+# min/max are stored as text (columns differ in type); these read them back
+_PARSERS = {
+    "int": int,
+    "float": float,
+    "bool": lambda s: s == "True",
+    "str": str,
+    "date": date.fromisoformat,
+    "datetime": datetime.fromisoformat,
+}
+
+
+def _kind(value) -> str | None:
+    # bool before int: bool is an int subclass; datetime before date likewise
+    for kind, types in (
+        ("bool", bool),
+        ("int", int),
+        ("float", float),
+        ("str", str),
+        ("datetime", datetime),
+        ("date", date),
+    ):
+        if isinstance(value, types):
+            return kind
+    return None
+
+
+def _text(value) -> str:
+    return value.isoformat() if isinstance(value, (date, datetime)) else str(value)
+
+
+def _parse(kind: str | None, text: str | None):
+    if text is None or kind not in _PARSERS:
+        return None
+    return _PARSERS[kind](text)
+
+
+def _file_version(path: str) -> tuple[int, int]:
+    st = Path(path).stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def read_footer(dataset: str, path: str) -> tuple[dict, list[dict]]:
+    """One file row and its (row group, column) stats rows, from the footer only."""
+    mtime_ns, size = _file_version(path)
+    md = pq.ParquetFile(path).metadata
+    file_row = {
+        "dataset": dataset,
+        "path": path,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "num_rows": md.num_rows,
+        "num_row_groups": md.num_row_groups,
+        "created_by": md.created_by,
+    }
+    rows = []
+    for i in range(md.num_row_groups):
+        rg = md.row_group(i)
+        for j in range(rg.num_columns):
+            col = rg.column(j)
+            st = col.statistics
+            has_range = st is not None and st.has_min_max
+            kind = _kind(st.min) if has_range else None
+            rows.append(
+                {
+                    "dataset": dataset,
+                    "path": path,
+                    "row_group": i,
+                    "column": col.path_in_schema,
+                    "kind": kind,
+                    "num_rows": rg.num_rows,
+                    "null_count": (
+                        st.null_count if st is not None and st.has_null_count else None
+                    ),
+                    "min": _text(st.min) if kind else None,
+                    "max": _text(st.max) if kind else None,
+                }
+            )
+    return file_row, rows
+
+
+class DatasetCatalog:
+    """Footer statistics for named datasets (a parquet path or glob each)."""
+
+    def __init__(
+        self,
+        base: str | Path = CATALOG_DIR,
+        datasets: dict[str, str | Path] | None = None,
+    ):
+        self.base = Path(base)
+        self.datasets = {
+            name: str(p) for name, p in (datasets or CATALOG_DATASETS).items()
+        }
+        self.files_path = self.base / "files.parquet"
+        self.row_groups_path = self.base / "row_groups.parquet"
+        self._files: pl.DataFrame | None = None
+        self._row_groups: pl.DataFrame | None = None
+        self.stats = {"read": 0, "reused": 0}
+
+    # -------------------------
+    # Build
+    # -------------------------
+    def _load(self) -> tuple[pl.DataFrame, pl.DataFrame]:
+        if self._files is None:
+            if self.files_path.exists() and self.row_groups_path.exists():
+                self._files = pl.read_parquet(self.files_path)
+                self._row_groups = pl.read_parquet(self.row_groups_path)
+            else:
+                self._files = pl.DataFrame(schema=FILE_SCHEMA)
+                self._row_groups = pl.DataFrame(schema=ROW_GROUP_SCHEMA)
+        return self._files, self._row_groups
+
+    def refresh(self) -> pl.DataFrame:
+        """Re-read footers of new/changed files, drop vanished ones, persist."""
+        old_files, old_rgs = self._load()
+        known = {
+            (d, p): (m, s)
+            for d, p, m, s in old_files.select(
+                "dataset", "path", "mtime_ns", "size"
+            ).iter_rows()
+        }
+        keep, file_rows, rg_rows = [], [], []
+        self.stats = {"read": 0, "reused": 0}
+        for name, pattern in self.datasets.items():
+            for path in sorted(glob.glob(pattern)):
+                if known.get((name, path)) == _file_version(path):
+                    keep.append((name, path))
+                    self.stats["reused"] += 1
+                    continue
+                file_row, rows = read_footer(name, path)
+                file_rows.append(file_row)
+                rg_rows.extend(rows)
+                self.stats["read"] += 1
+
+        kept = pl.DataFrame(
+            keep, schema={"dataset": pl.Utf8, "path": pl.Utf8}, orient="row"
+        )
+        self._files = pl.concat(
+            [
+                old_files.join(kept, on=["dataset", "path"], how="semi"),
+                pl.DataFrame(file_rows, schema=FILE_SCHEMA),
+            ]
+        ).sort("dataset", "path")
+        self._row_groups = pl.concat(
+            [
+                old_rgs.join(kept, on=["dataset", "path"], how="semi"),
+                pl.DataFrame(rg_rows, schema=ROW_GROUP_SCHEMA),
+            ]
+        )
+        self.base.mkdir(parents=True, exist_ok=True)
+        PolarsLocalRepository().save_many(
+            {
+                str(self.files_path): self._files,
+                str(self.row_groups_path): self._row_groups,
+            }
+        )
+        return self._files
+
+    # -------------------------
+    # Questions
+    # -------------------------
+    def _rgs(self, dataset: str, column: str | None = None) -> pl.DataFrame:
+        _, rgs = self._load()
+        rgs = rgs.filter(pl.col("dataset") == dataset)
+        if rgs.is_empty() and dataset not in self.files()["dataset"]:
+            raise KeyError(f"{dataset!r} is not in the catalog; run refresh().")
+        if column is not None and not rgs.is_empty():
+            rgs = rgs.filter(pl.col("column") == column)
+            if rgs.is_empty():
+                raise KeyError(f"No column {column!r} in {dataset!r}.")
+        return rgs
+
+    def files(self) -> pl.DataFrame:
+        return self._load()[0]
+
+    def row_count(self, dataset: str) -> int:
+        files = self.files().filter(pl.col("dataset") == dataset)
+        return int(files["num_rows"].sum())
+
+    def summary(self, dataset: str) -> pl.DataFrame:
+        """Per column: rows, null count/rate and min/max over all files."""
+        out = []
+        for (column,), part in self._rgs(dataset).group_by(
+            "column", maintain_order=True
+        ):
+            # files of one dataset may disagree on a column's type (raw layouts)
+            kind = part["kind"].drop_nulls().first()
+            ranged = part.filter(pl.col("kind") == kind)
+            mins = [_parse(kind, v) for v in ranged["min"]]
+            maxs = [_parse(kind, v) for v in ranged["max"]]
+            rows = part["num_rows"].sum()
+            nulls = None if part["null_count"].has_nulls() else part["null_count"].sum()
+            out.append(
+                {
+                    "column": column,
+                    "rows": rows,
+                    "null_count": nulls,
+                    "null_rate": None if nulls is None or not rows else nulls / rows,
+                    "min": _text(min(mins)) if mins else None,
+                    "max": _text(max(maxs)) if maxs else None,
+                }
+            )
+        return pl.DataFrame(
+            out,
+            schema={
+                "column": pl.Utf8,
+                "rows": pl.Int64,
+                "null_count": pl.Int64,
+                "null_rate": pl.Float64,
+                "min": pl.Utf8,
+                "max": pl.Utf8,
+            },
+        )
+
+    def prune(self, dataset: str, column: str, lo=None, hi=None) -> pl.DataFrame:
+        """
+        Row groups that may hold `lo <= column <= hi` (either bound optional).
+        Bounds may be typed values or strings in the stored format. Row groups
+        without statistics are kept; all-null row groups are dropped.
+        """
+        rgs = self._rgs(dataset, column)
+        keep = []
+        for row in rgs.iter_rows(named=True):
+            if row["null_count"] is not None and row["null_count"] == row["num_rows"]:
+                keep.append(False)
+                continue
+            if row["kind"] is None:
+                keep.append(True)
+                continue
+            kind = row["kind"]
+            lo_v = _parse(kind, lo) if isinstance(lo, str) else lo
+            hi_v = _parse(kind, hi) if isinstance(hi, str) else hi
+            rg_min, rg_max = _parse(kind, row["min"]), _parse(kind, row["max"])
+            keep.append(
+                (lo_v is None or rg_max >= lo_v) and (hi_v is None or rg_min <= hi_v)
+            )
+        return rgs.filter(pl.Series(keep, dtype=pl.Boolean)).select(
+            "path", "row_group", "num_rows", "min", "max"
+        )
@@ -0,0 +1,160 @@
+# src/infra/features.py
+import hashlib
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ..settings import FEATURES_DIR, TFIDF_PARAMS
+
+
+def _file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """sha256 of a file's bytes, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _jsonable(params: dict) -> dict:
+    # tuples (e.g. ngram_range) round-trip through JSON as lists
+    return json.loads(json.dumps(params, sort_keys=True))
+
+
+def feature_key(path: str | Path, params: dict, text_col: str = "text") -> str:
+    """Cache key: hash of the input file + vectorizer parameters + text column."""
+    h = hashlib.sha256()
+    h.update(_file_digest(Path(path)).encode())
+    h.update(json.dumps(_jsonable(params), sort_keys=True).encode())
+    h.update(text_col.encode())
+    return h.hexdigest()[:16]
+
+
+@dataclass
+class FeatureSet:
+    """A fitted TF-IDF matrix plus the vocabulary/idf needed to reuse it."""
+
+    key: str
+    matrix: sparse.csr_matrix
+    vocabulary: dict[str, int]
+    idf: np.ndarray
+    params: dict
+
+    def vectorizer(self) -> TfidfVectorizer:
+        """Rebuild a fitted vectorizer (for transforming new text) without refit."""
+        params = {
+            k: tuple(v) if isinstance(v, list) else v for k, v in self.params.items()
+        }
+        vec = TfidfVectorizer(vocabulary=self.vocabulary, **params)
+        vec.idf_ = self.idf
+        return vec
+
+    def feature_names(self) -> np.ndarray:
+        names = np.empty(len(self.vocabulary), dtype=object)
+        for term, j in self.vocabulary.items():
+            names[j] = term
+        return names
+
+
+class TfidfFeatureStore:
+    """
+    Persist fitted TF-IDF features keyed by (silver file hash, vectorizer params).
+
+    Layout: <root>/<key>/{data,indices,indptr,idf}.npy + vocabulary.json + meta.json
+    The CSR arrays are plain .npy files so they can be memory-mapped on load.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = FEATURES_DIR,
+        params: dict | None = None,
+        text_col: str = "text",
+    ):
+        self.root = Path(root)
+        self.params = dict(TFIDF_PARAMS if params is None else params)
+        self.text_col = text_col
+
+    def key_for(self, path: str | Path) -> str:
+        return feature_key(path, self.params, self.text_col)
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        return (self.path_for(key) / "meta.json").exists()
+
+    def get_or_build(self, path: str | Path, mmap: bool = True) -> FeatureSet:
+        """Load cached features for this input if present, else fit and persist."""
+        key = self.key_for(path)
+        if self.exists(key):
+            return self.load(key, mmap=mmap)
+        return self.build(path, key=key, mmap=mmap)
+
+    def build(
+        self, path: str | Path, key: str | None = None, mmap: bool = True
+    ) -> FeatureSet:
+        key = key or self.key_for(path)
+        texts = (
+            pl.scan_parquet(path)
+            .select(pl.col(self.text_col).fill_null(""))
+            .collect()
+            .to_series()
+            .to_list()
+        )
+        vec = TfidfVectorizer(**self.params)
+        X = vec.fit_transform(texts).tocsr()
+        X.sort_indices()
+
+        # write into a temp dir first, then rename, so readers never see a half cache
+        final = self.path_for(key)
+        tmp = final.with_name(final.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        np.save(tmp / "data.npy", X.data)
+        np.save(tmp / "indices.npy", X.indices)
+        np.save(tmp / "indptr.npy", X.indptr)
+        np.save(tmp / "idf.npy", vec.idf_)
+        vocab = {term: int(j) for term, j in vec.vocabulary_.items()}
+        (tmp / "vocabulary.json").write_text(json.dumps(vocab))
+        meta = {
+            "key": key,
+            "source": str(path),
+            "text_col": self.text_col,
+            "params": _jsonable(self.params),
+            "shape": list(X.shape),
+            "nnz": int(X.nnz),
+        }
+        (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+        shutil.rmtree(final, ignore_errors=True)
+        tmp.rename(final)
+
+        return self.load(key, mmap=mmap)
+
+    def load(self, key: str, mmap: bool = True) -> FeatureSet:
+        base = self.path_for(key)
+        if not (base / "meta.json").exists():
+            raise FileNotFoundError(f"No cached features under {base}")
+        meta = json.loads((base / "meta.json").read_text())
+        mode = "r" if mmap else None
+        X = sparse.csr_matrix(
+            (
+                np.load(base / "data.npy", mmap_mode=mode),
+                np.load(base / "indices.npy", mmap_mode=mode),
+                np.load(base / "indptr.npy", mmap_mode=mode),
+            ),
+            shape=tuple(meta["shape"]),
+            copy=False,
+        )
+        return FeatureSet(
+            key=key,
+            matrix=X,
+            vocabulary=json.loads((base / "vocabulary.json").read_text()),
+            idf=np.load(base / "idf.npy"),
+            params=meta["params"],
+        )
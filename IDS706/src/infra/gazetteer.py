@@ -0,0 +1,319 @@
+# src/infra/gazetteer.py
+"""
+Bundled offline gazetteer for free-text job locations.
+
+`resolve_location("San Francisco, CA")` -> ("San Francisco", "CA", "United States").
+It is meant to run once per *distinct* location (see LocationNormalizeTransformer),
+so it is plain Python. US states and Canadian provinces are returned as their
+postal codes; other regions are returned as written. GAZETTEER_VERSION changes
+whenever these tables change, which invalidates cached mappings.
+"""
+
+import hashlib
+import re
+import string
+
+US = "United States"
+CANADA = "Canada"
+
+US_STATES = {
+    "AL": "Alabama",
+    "AK": "Alaska",
+    "AZ": "Arizona",
+    "AR": "Arkansas",
+    "CA": "California",
+    "CO": "Colorado",
+    "CT": "Connecticut",
+    "DE": "Delaware",
+    "DC": "District of Columbia",
+    "FL": "Florida",
+    "GA": "Georgia",
+    "HI": "Hawaii",
+    "ID": "Idaho",
+    "IL": "Illinois",
+    "IN": "Indiana",
+    "IA": "Iowa",
+    "KS": "Kansas",
+    "KY": "Kentucky",
+    "LA": "Louisiana",
+    "ME": "Maine",
+    "MD": "Maryland",
+    "MA": "Massachusetts",
+    "MI": "Michigan",
+    "MN": "Minnesota",
+    "MS": "Mississippi",
+    "MO": "Missouri",
+    "MT": "Montana",
+    "NE": "Nebraska",
+    "NV": "Nevada",
+    "NH": "New Hampshire",
+    "NJ": "New Jersey",
+    "NM": "New Mexico",
+    "NY": "New York",
+    "NC": "North Carolina",
+    "ND": "North Dakota",
+    "OH": "Ohio",
+    "OK": "Oklahoma",
+    "OR": "Oregon",
+    "PA": "Pennsylvania",
+    "PR": "Puerto Rico",
+    "RI": "Rhode Island",
+    "SC": "South Carolina",
+    "SD": "South Dakota",
+    "TN": "Tennessee",
+    "TX": "Texas",
+    "UT": "Utah",
+    "VT": "Vermont",
+    "VA": "Virginia",
+    "WA": "Washington",
+    "WV": "West Virginia",
+    "WI": "Wisconsin",
+    "WY": "Wyoming",
+}
+
+CA_PROVINCES = {
+    "AB": "Alberta",
+    "BC": "British Columbia",
+    "MB": "Manitoba",
+    "NB": "New Brunswick",
+    "NL": "Newfoundland and Labrador",
+    "NS": "Nova Scotia",
+    "NT": "Northwest Territories",
+    "NU": "Nunavut",
+    "ON": "Ontario",
+    "PE": "Prince Edward Island",
+    "QC": "Quebec",
+    "SK": "Saskatchewan",
+    "YT": "Yukon",
+}
+
+# canonical name -> extra spellings (lowercase, dots removed)
+COUNTRIES = {
+    US: ["us", "usa", "united states of america", "america"],
+    CANADA: [],
+    "United Kingdom": ["uk", "great britain", "britain"],
+    "Ireland": [],
+    "Germany": ["deutschland"],
+    "France": [],
+    "Netherlands": ["the netherlands", "holland"],
+    "Belgium": [],
+    "Switzerland": [],
+    "Austria": [],
+    "Spain": [],
+    "Portugal": [],
+    "Italy": [],
+    "Poland": [],
+    "Sweden": [],
+    "Norway": [],
+    "Denmark": [],
+    "Finland": [],
+    "Czechia": ["czech republic"],
+    "Romania": [],
+    "Greece": [],
+    "Israel": [],
+    "Turkey": ["turkiye"],
+    "United Arab Emirates": ["uae"],
+    "Saudi Arabia": [],
+    "South Africa": [],
+    "Nigeria": [],
+    "Egypt": [],
+    "Kenya": [],
+    "India": [],
+    "Pakistan": [],
+    "China": [],
+    "Hong Kong": ["hong kong sar"],
+    "Taiwan": [],
+    "Japan": [],
+    "South Korea": ["korea", "republic of korea"],
+    "Singapore": [],
+    "Malaysia": [],
+    "Philippines": [],
+    "Indonesia": [],
+    "Vietnam": ["viet nam"],
+    "Thailand": [],
+    "Australia": [],
+    "New Zealand": [],
+    "Mexico": [],
+    "Brazil": [],
+    "Argentina": [],
+    "Chile": [],
+    "Colombia": [],
+    "Peru": [],
+    "Costa Rica": [],
+}
+
+# regions written without a country that imply one
+REGION_COUNTRY = {
+    "england": "United Kingdom",
+    "scotland": "United Kingdom",
+    "wales": "United Kingdom",
+    "northern ireland": "United Kingdom",
+}
+
+# core of "Greater X Area" / "X Metropolitan Area" -> (city, state, country)
+METRO_AREAS = {
+    "san francisco bay": ("San Francisco", "CA", US),
+    "sf bay": ("San Francisco", "CA", US),
+    "bay area": ("San Francisco", "CA", US),
+    "silicon valley": ("San Jose", "CA", US),
+    "los angeles": ("Los Angeles", "CA", US),
+    "san diego": ("San Diego", "CA", US),
+    "new york city": ("New York", "NY", US),
+    "new york": ("New York", "NY", US),
+    "nyc": ("New York", "NY", US),
+    "buffalo-niagara falls": ("Buffalo", "NY", US),
+    "utica-rome": ("Utica", "NY", US),
+    "greater boston": ("Boston", "MA", US),
+    "boston": ("Boston", "MA", US),
+    "hartford": ("Hartford", "CT", US),
+    "philadelphia": ("Philadelphia", "PA", US),
+    "pittsburgh": ("Pittsburgh", "PA", US),
+    "washington dc-baltimore": ("Washington", "DC", US),
+    "dmv": ("Washington", "DC", US),
+    "chicago": ("Chicago", "IL", US),
+    "seattle": ("Seattle", "WA", US),
+    "dallas-fort worth": ("Dallas", "TX", US),
+    "houston": ("Houston", "TX", US),
+    "austin": ("Austin", "TX", US),
+    "atlanta": ("Atlanta", "GA", US),
+    "miami-fort lauderdale": ("Miami", "FL", US),
+    "orlando": ("Orlando", "FL", US),
+    "tampa bay": ("Tampa", "FL", US),
+    "denver": ("Denver", "CO", US),
+    "phoenix": ("Phoenix", "AZ", US),
+    "albuquerque-santa fe": ("Albuquerque", "NM", US),
+    "salt lake city": ("Salt Lake City", "UT", US),
+    "minneapolis-st paul": ("Minneapolis", "MN", US),
+    "st louis": ("St. Louis", "MO", US),
+    "kansas city": ("Kansas City", "MO", US),
+    "des moines": ("Des Moines", "IA", US),
+    "sioux falls": ("Sioux Falls", "SD", US),
+    "oklahoma city": ("Oklahoma City", "OK", US),
+    "nashville": ("Nashville", "TN", US),
+    "knoxville": ("Knoxville", "TN", US),
+    "louisville": ("Louisville", "KY", US),
+    "cincinnati": ("Cincinnati", "OH", US),
+    "charlotte": ("Charlotte", "NC", US),
+    "raleigh-durham-chapel hill": ("Raleigh", "NC", US),
+    "greensboro--winston-salem--high point": ("Greensboro", "NC", US),
+    "roanoke": ("Roanoke", "VA", US),
+    "honolulu": ("Honolulu", "HI", US),
+    "toronto": ("Toronto", "ON", CANADA),
+    "montreal": ("Montreal", "QC", CANADA),
+    "vancouver": ("Vancouver", "BC", CANADA),
+    "london": ("London", "England", "United Kingdom"),
+    "belfast": ("Belfast", "Northern Ireland", "United Kingdom"),
+    "sydney": ("Sydney", "New South Wales", "Australia"),
+    "melbourne": ("Melbourne", "Victoria", "Australia"),
+    "adelaide": ("Adelaide", "South Australia", "Australia"),
+}
+
+# work-arrangement words and sales regions that carry no place
+NON_PLACES = {"remote", "hybrid", "on-site", "onsite", "anywhere", "worldwide"}
+SALES_REGIONS = {"namer", "emea", "apac", "latam", "amer", "global"}
+
+# bump when resolve_location's rules change (the tables are hashed as is)
+RESOLVER_REVISION = 2
+
+GAZETTEER_VERSION = hashlib.sha1(
+    repr(
+        (
+            RESOLVER_REVISION,
+            US_STATES,
+            CA_PROVINCES,
+            COUNTRIES,
+            REGION_COUNTRY,
+            METRO_AREAS,
+            sorted(NON_PLACES),  # set repr order varies between processes
+            sorted(SALES_REGIONS),
+        )
+    ).encode()
+).hexdigest()[:12]
+
+_COUNTRY_BY_ALIAS = {
+    alias: name
+    for name, aliases in COUNTRIES.items()
+    for alias in [name.lower(), *aliases]
+}
+_US_BY_NAME = {name.lower(): code for code, name in US_STATES.items()}
+_CA_BY_NAME = {name.lower(): code for code, name in CA_PROVINCES.items()}
+_METRO_PREFIX = re.compile(r"^greater\s+")
+_METRO_SUFFIX = re.compile(
+    r"\s+(metropolitan area|metro area|area|metroplex|metro|region)$"
+)
+
+
+def _key(part: str) -> str:
+    return part.lower().replace(".", "").strip()
+
+
+def _tidy(part: str) -> str:
+    # "NEW YORK" / "new york" -> "New York"; mixed case ("McLean") is kept
+    return string.capwords(part) if part.islower() or part.isupper() else part
+
+
+def _state(part: str) -> tuple[str, str] | None:
+    """(postal code, country) when part is a US state or Canadian province."""
+    key = _key(part)
+    if key.upper() in US_STATES:
+        return key.upper(), US
+    if key.upper() in CA_PROVINCES:
+        return key.upper(), CANADA
+    if key in _US_BY_NAME:
+        return _US_BY_NAME[key], US
+    if key in _CA_BY_NAME:
+        return _CA_BY_NAME[key], CANADA
+    return None
+
+
+def _metro(text: str) -> tuple[str | None, str | None, str | None] | None:
+    """Resolve "Greater X Area" style names; None if text is not one."""
+    key = _key(text)
+    core = _METRO_SUFFIX.sub("", _METRO_PREFIX.sub("", key))
+    if core == key and key not in METRO_AREAS:
+        return None
+    if core in METRO_AREAS:
+        return METRO_AREAS[core]
+    if key in METRO_AREAS:
+        return METRO_AREAS[key]
+    # unknown metro: its first named city
+    return _tidy(re.split(r"-+", core)[0].strip()), None, None
+
+
+def resolve_location(raw: str | None) -> tuple[str | None, str | None, str | None]:
+    """Free-text location -> (city, state, country); unknown parts are None."""
+    if raw is None:
+        return None, None, None
+    text = re.sub(r"\(.*?\)", "", raw)
+    parts = [p.strip() for p in text.split(",")]
+    parts = [p for p in parts if p and _key(p) not in NON_PLACES]
+    if not parts or (len(parts) == 1 and _key(parts[0]) in SALES_REGIONS):
+        return None, None, None
+
+    if len(parts) == 1:
+        metro = _metro(parts[0])
+        if metro is not None:
+            return metro
+
+    # "San Antonio, Texas Metropolitan Area": the suffix sits on the state
+    is_metro = bool(_METRO_SUFFIX.search(parts[-1].lower()))
+    if is_metro:
+        parts[-1] = _METRO_SUFFIX.sub("", parts[-1].lower())
+
+    city = state = country = None
+    if _key(parts[-1]) in _COUNTRY_BY_ALIAS:
+        country = _COUNTRY_BY_ALIAS[_key(parts.pop())]
+    if parts and country in (None, US, CANADA):
+        found = _state(parts[-1])
+        if found and (country is None or found[1] == country):
+            parts.pop()
+            state, country = found[0], found[1]
+    if parts and state is None and len(parts) > 1:
+        state = _tidy(parts.pop())
+        country = country or REGION_COUNTRY.get(_key(state))
+    if parts:
+        if len(parts) == 1 and country is None and _key(parts[0]) in REGION_COUNTRY:
+            state, country = _tidy(parts[0]), REGION_COUNTRY[_key(parts[0])]
+        else:
+            city = _tidy(re.split(r"-+", parts[0])[0] if is_metro else parts[0])
+    return city, state, country
@@ -1,7 +1,17 @@
 # src/infra/io_polars.py
-import polars as pl
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
+
+import polars as pl
 from ..domain.ports import DatasetRepository
+from ..utils.runtime import RuntimeConfig, current
+
+
+def _tmp_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
 
 
 def _schema_names(lf: pl.LazyFrame) -> list[str]:
@@ -9,6 +19,17 @@ def _schema_names(lf: pl.LazyFrame) -> list[str]:
 
 
 class PolarsLocalRepository(DatasetRepository):
+    def __init__(self, runtime: RuntimeConfig | None = None):
+        # None = follow whatever runtime config the CLI applied
+        self._runtime = runtime
+
+    @property
+    def runtime(self) -> RuntimeConfig:
+        return self._runtime or current()
+
+    def collect(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        return lf.collect(engine=self.runtime.effective_engine)
+
     def load_many(self, paths: List[str]) -> pl.LazyFrame:
         if not paths:
             raise ValueError("No input files provided.")
@@ -31,8 +52,60 @@ class PolarsLocalRepository(DatasetRepository):
         # Robust concat; rechunk for downstream perf
         return pl.concat(aligned, how="diagonal_relaxed", rechunk=True)
 
-    def save_lazy(self, table: pl.LazyFrame | pl.DataFrame, path: str) -> None:
-        if isinstance(table, pl.LazyFrame):
-            table.sink_parquet(path)
-        else:
-            table.write_parquet(path)
+    def save_lazy(
+        self,
+        table: pl.LazyFrame | pl.DataFrame,
+        path: str,
+        options: dict | None = None,
+    ) -> None:
+        """Write one table atomically (temp file, then rename)."""
+        self.save_many({path: table}, {path: options or {}})
+
+    def save_many(
+        self,
+        tables: dict[str, pl.LazyFrame | pl.DataFrame],
+        options: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Write several tables at once. All lazy outputs go through one
+        collect_all, so Polars runs them concurrently and computes a subplan they
+        share (e.g. bronze under silver and gold) once; encoding/compression
+        overlaps with computation. In-memory frames are written on threads.
+        Each file is written to a temp name and renamed only when all succeed.
+
+        `options` maps path -> write_parquet/sink_parquet keyword arguments
+        (compression, compression_level, row_group_size, ...).
+        """
+        options = options or {}
+        tmps = {path: _tmp_path(path) for path in tables}
+        engine = self.runtime.effective_engine
+        try:
+            sinks = [
+                table.sink_parquet(
+                    tmps[path], lazy=True, engine=engine, **options.get(path, {})
+                )
+                for path, table in tables.items()
+                if isinstance(table, pl.LazyFrame)
+            ]
+            frames = [
+                (table, path)
+                for path, table in tables.items()
+                if isinstance(table, pl.DataFrame)
+            ]
+            with ThreadPoolExecutor(max_workers=max(1, len(frames))) as pool:
+                writes = [
+                    pool.submit(
+                        table.write_parquet, tmps[path], **options.get(path, {})
+                    )
+                    for table, path in frames
+                ]
+                if sinks:
+                    pl.collect_all(sinks, engine=engine)
+                for w in writes:
+                    w.result()
+        except BaseException:
+            for tmp in tmps.values():
+                tmp.unlink(missing_ok=True)
+            raise
+        for path, tmp in tmps.items():
+            tmp.replace(path)
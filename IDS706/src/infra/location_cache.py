@@ -0,0 +1,62 @@
+# src/infra/location_cache.py
+"""
+Persistent location -> city/state/country mapping.
+
+Distinct locations are far fewer than rows, so each is resolved once in Python
+against the bundled gazetteer. Mappings are kept in a parquet file tagged with
+GAZETTEER_VERSION; later builds only resolve locations they have not seen.
+The pipeline calls `mapping()` as its own step, and the result is joined onto
+silver by LocationNormalizeTransformer.
+"""
+
+from pathlib import Path
+
+import polars as pl
+
+from ..settings import LOCATION_CACHE_PATH
+from .gazetteer import GAZETTEER_VERSION, resolve_location
+from .io_polars import PolarsLocalRepository
+
+COLUMNS = ["city", "state", "country"]
+SCHEMA = {"location": pl.Utf8, **{c: pl.Utf8 for c in COLUMNS}}
+
+
+class LocationCache:
+    """Resolve locations through the cache file (`cache_path=None`: in memory)."""
+
+    def __init__(self, cache_path: str | Path | None = LOCATION_CACHE_PATH):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.stats = {"distinct": 0, "resolved": 0}
+
+    def _load(self) -> pl.DataFrame:
+        if self.cache_path is None or not self.cache_path.exists():
+            return pl.DataFrame(schema=SCHEMA)
+        cached = pl.read_parquet(self.cache_path)
+        # rows resolved with another gazetteer are stale
+        return cached.filter(pl.col("gazetteer") == GAZETTEER_VERSION).select(
+            list(SCHEMA)
+        )
+
+    def _save(self, cache: pl.DataFrame) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        PolarsLocalRepository().save_lazy(
+            cache.with_columns(pl.lit(GAZETTEER_VERSION).alias("gazetteer")),
+            str(self.cache_path),
+        )
+
+    def mapping(self, locations: pl.Series) -> pl.DataFrame:
+        """location -> city/state/country for the given values."""
+        wanted = locations.drop_nulls().unique()
+        cache = self._load()
+        new = wanted.filter(~wanted.is_in(cache["location"].implode()))
+        if new.len():
+            resolved = pl.DataFrame(
+                [(loc, *resolve_location(loc)) for loc in new],
+                schema=SCHEMA,
+                orient="row",
+            )
+            cache = pl.concat([cache, resolved])
+            if self.cache_path is not None:
+                self._save(cache)
+        self.stats = {"distinct": wanted.len(), "resolved": new.len()}
+        return cache.filter(pl.col("location").is_in(wanted.implode()))
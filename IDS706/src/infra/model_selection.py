@@ -0,0 +1,82 @@
+# src/infra/model_selection.py
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_score
+from threadpoolctl import threadpool_limits
+
+from .features import TfidfFeatureStore
+
+
+def _fit_one(
+    root: str, key: str, k: int, sample_idx: np.ndarray, seed: int, threads: int
+) -> dict:
+    """Worker: fit one K over the shared memory-mapped matrix and score it."""
+    # every worker maps the same .npy files; the OS shares the pages between them
+    X = TfidfFeatureStore(root=root).load(key, mmap=True).matrix
+    with threadpool_limits(limits=threads):
+        t0 = time.perf_counter()
+        model = KMeans(n_clusters=k, random_state=seed, n_init="auto")
+        labels = model.fit_predict(X)
+        fit_s = time.perf_counter() - t0
+
+        y_s = labels[sample_idx]
+        # silhouette is undefined with a single cluster in the sample
+        if 1 < len(np.unique(y_s)) < len(sample_idx):
+            sil = float(silhouette_score(X[sample_idx], y_s, metric="cosine"))
+        else:
+            sil = float("nan")
+    return {
+        "k": k,
+        "inertia": float(model.inertia_),
+        "silhouette_cosine": sil,
+        "n_iter": int(model.n_iter_),
+        "fit_seconds": fit_s,
+    }
+
+
+class KMeansSweep:
+    """Fit KMeans for several K in parallel over one cached feature matrix."""
+
+    def __init__(
+        self,
+        ks: list[int],
+        sample_size: int = 20_000,
+        seed: int = 42,
+        max_workers: int | None = None,
+    ):
+        self.ks = sorted(set(ks))
+        self.sample_size = sample_size
+        self.seed = seed
+        self.max_workers = max_workers
+
+    def run(self, store: TfidfFeatureStore, key: str) -> pl.DataFrame:
+        n_rows = store.load(key).matrix.shape[0]
+        valid = [k for k in self.ks if 1 <= k <= n_rows]
+        if not valid:
+            raise ValueError(f"No K in {self.ks} fits {n_rows} rows.")
+
+        # one shared silhouette subsample so every K is scored on the same rows
+        rng = np.random.default_rng(self.seed)
+        size = min(self.sample_size, n_rows)
+        sample_idx = np.sort(rng.choice(n_rows, size=size, replace=False))
+
+        workers = self.max_workers or min(len(valid), os.cpu_count() or 1)
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        root = str(Path(store.root))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_fit_one, root, key, k, sample_idx, self.seed, threads)
+                for k in valid
+            ]
+            rows = [f.result() for f in futures]
+
+        return pl.DataFrame(rows).with_columns(
+            pl.lit(key).alias("feature_key"),
+            pl.lit(size).alias("silhouette_sample"),
+        )
@@ -0,0 +1,171 @@
+# src/infra/normalization.py
+import polars as pl
+
+# standard column -> source column candidates, in priority order
+CANDIDATES: dict[str, list[str]] = {
+    "job_id": ["job_id", "id", "jobkey", "posting_id", "job_link"],
+    "title": ["job_title", "title", "position"],
+    "company": ["company", "company_name", "employer"],
+    "location": ["location", "job_location", "city"],
+    "posted_raw": [
+        "posted_time",
+        "posted_at",
+        "date_posted",
+        "post_date",
+        "first_seen",
+        "last_processed_time",
+        "created_at",
+        "timestamp",
+    ],
+    "desc": ["description", "job_description", "desc", "job_summary"],
+    "work_type": [
+        "work_type",
+        "job_type",
+        "onsite_remote",
+        "onsite_remote_hybrid",
+        "employment_type",
+        "remote_status",
+    ],
+    "seniority": ["seniority", "experience_level", "level", "job_level"],
+    "skills_raw": ["skills", "skill_list", "tags", "job_skills"],
+}
+
+OUTPUT_COLUMNS = [
+    "job_id",
+    "title",
+    "title_lc",
+    "company",
+    "location",
+    "desc",
+    "work_type",
+    "seniority",
+    "posted_at",
+    "skills_list",
+]
+
+
+def prepare_skills(col: str = "skills_raw") -> pl.Expr:
+    """Lowercase the raw skills string once, before it is split or decoded."""
+    return pl.col(col).str.to_lowercase()
+
+
+def parse_skills(
+    col: str = "skills_raw", canonical: dict[str, str] | None = None
+) -> pl.Expr:
+    """
+    Prepared skills string -> list[str]. Accepts "a, b" and '["a", "b"]'.
+
+    JSON arrays and comma lists are decoded in separate branches, nulls become an
+    empty list, and the only per-element work left is one strip (plus the
+    optional alias -> canonical name lookup). Run it in a later with_columns than
+    prepare_skills, so the lowercased string is computed once for both branches.
+    """
+    c = pl.col(col)
+    element = pl.element().str.strip_chars()
+    if canonical:
+        element = element.replace(canonical)
+    return (
+        pl.when(c.str.starts_with("["))
+        .then(c.str.json_decode(pl.List(pl.Utf8)))
+        .when(c.is_not_null())
+        .then(c.str.split(","))
+        .otherwise(pl.lit([], dtype=pl.List(pl.Utf8)))
+        .list.eval(element)
+    )
+
+
+def schema_fingerprint(schema: pl.Schema) -> tuple[tuple[str, str], ...]:
+    return tuple((name, str(dtype)) for name, dtype in schema.items())
+
+
+class NormalizationPlan:
+    """
+    Raw -> standard schema as a reusable plan.
+
+    Candidate columns are resolved once per distinct source schema, and the
+    resulting expression lists are cached by schema fingerprint, so normalizing
+    many files with the same layout builds the expressions only once.
+
+    Every present candidate of a standard column is coalesced in priority
+    order: a row takes its first non-null candidate. When one row fills two
+    candidates with different values, the higher-priority one wins (e.g.
+    job_title over title).
+    """
+
+    def __init__(
+        self,
+        candidates: dict[str, list[str]] | None = None,
+        canonical_skills: dict[str, str] | None = None,
+    ):
+        self.candidates = candidates or CANDIDATES
+        self.canonical_skills = canonical_skills
+        self._cache: dict[tuple, list[list[pl.Expr]]] = {}
+
+    def resolve(self, names: list[str]) -> dict[str, list[str]]:
+        """Standard column -> candidates present in `names`, in priority order."""
+        present = set(names)
+        return {
+            target: [c for c in cands if c in present]
+            for target, cands in self.candidates.items()
+        }
+
+    def stages(self, schema: pl.Schema) -> list[list[pl.Expr]]:
+        key = schema_fingerprint(schema)
+        if key not in self._cache:
+            self._cache[key] = self._compile(self.resolve(list(schema.names())))
+        return self._cache[key]
+
+    def _compile(self, mapping: dict[str, list[str]]) -> list[list[pl.Expr]]:
+        # 1) candidate columns -> standard column. After a union of files with
+        # different layouts each row fills only its own file's candidate, so take
+        # the first non-null one rather than the first column present.
+        picked = [
+            pl.coalesce([pl.col(c).cast(pl.Utf8) for c in srcs] or [pl.lit(None)])
+            .cast(pl.Utf8)
+            .alias(target)
+            for target, srcs in mapping.items()
+        ]
+        # 2) add title_lc and posted_at (aware and naive strings are parsed
+        # apart: polars refuses a naive parse of a column holding any offset)
+        has_tz = pl.col("posted_raw").str.contains(r"(?:Z|[+-]\d{2}:?\d{2})$")
+        derived = [
+            pl.when(pl.col("title").is_not_null())
+            .then(pl.col("title").str.to_lowercase())
+            .otherwise(pl.lit(None))
+            .alias("title_lc"),
+            pl.coalesce(
+                [
+                    # use UTC to parse first, and then remove timezone
+                    pl.when(has_tz)
+                    .then(pl.col("posted_raw"))
+                    .str.strptime(pl.Datetime(time_zone="UTC"), strict=False)
+                    .dt.replace_time_zone(None),
+                    # try to parse no timezome string
+                    pl.when(~has_tz)
+                    .then(pl.col("posted_raw"))
+                    .str.strptime(pl.Datetime, strict=False),
+                ]
+            ).alias("posted_at"),
+            prepare_skills("skills_raw"),
+        ]
+        # 4) skills regularization
+        skills = [
+            parse_skills("skills_raw", self.canonical_skills).alias("skills_list")
+        ]
+        return [picked, derived, skills]
+
+    def apply(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        picked, derived, skills = self.stages(lf.collect_schema())
+        return (
+            lf.with_columns(picked)
+            .with_columns(derived)
+            # 3) basic filter
+            .filter(pl.col("title").is_not_null() & pl.col("company").is_not_null())
+            .with_columns(skills)
+            # 5) final
+            .select(OUTPUT_COLUMNS)
+        )
+
+
+# Shared by CleanJobTransformer and scripts/make_test_data.py
+DEFAULT_PLAN = NormalizationPlan()
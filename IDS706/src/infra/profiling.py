@@ -0,0 +1,111 @@
+# src/infra/profiling.py
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import polars as pl
+
+try:  # not available on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+def peak_rss_mb() -> float | None:
+    """Process high-water RSS in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def parquet_rows(paths: list[str | Path]) -> int:
+    """Row count from parquet footers only (no data pages read)."""
+    return sum(pl.scan_parquet(p).select(pl.len()).collect().item() for p in paths)
+
+
+def file_bytes(paths: list[str | Path]) -> int:
+    return sum(Path(p).stat().st_size for p in paths if Path(p).exists())
+
+
+class StageProfiler:
+    """
+    Record wall time, peak RSS, rows and bytes in/out plus the optimized plan for
+    each pipeline stage, then dump everything as one JSON run report.
+    """
+
+    def __init__(self, polars_profile: bool = False):
+        # profile() re-executes the plan in memory, so it is opt-in
+        self.polars_profile = polars_profile
+        self.started_at = datetime.now()
+        self.stages: list[dict] = []
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        lf: pl.LazyFrame | None = None,
+        scans: list[str | Path] = (),
+        rows_in_from: list[str | Path] | None = None,
+        output: str | Path | None = None,
+    ) -> Iterator[dict]:
+        """
+        scans: files the lazy plan reads (for bytes_read).
+        rows_in_from: parquet files holding the stage's logical input (default: scans).
+        output: parquet file the stage writes (for rows_out / bytes_written).
+        """
+        record: dict = {"stage": name}
+        if lf is not None:
+            record["plan"] = lf.explain()
+        rss_before = peak_rss_mb()
+        t0 = time.perf_counter()
+        yield record
+        record["wall_seconds"] = round(time.perf_counter() - t0, 4)
+        record["peak_rss_mb"] = peak_rss_mb()
+        if rss_before is not None:
+            record["peak_rss_growth_mb"] = round(record["peak_rss_mb"] - rss_before, 2)
+
+        record["rows_in"] = parquet_rows(list(rows_in_from or scans))
+        record["bytes_read"] = file_bytes(list(scans))
+        if output is not None:
+            record["rows_out"] = parquet_rows([output])
+            record["bytes_written"] = file_bytes([output])
+        if lf is not None and self.polars_profile:
+            try:
+                _, timings = lf.profile()
+                record["node_timings_us"] = timings.to_dicts()
+            except AttributeError:
+                # Polars >= 2.0 dropped profile(); keep the streaming plan instead
+                record["streaming_plan"] = lf.explain(engine="streaming")
+        self.stages.append(record)
+
+    def report(self) -> dict:
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "polars_version": pl.__version__,
+            "polars_threads": pl.thread_pool_size(),
+            "total_wall_seconds": round(sum(s["wall_seconds"] for s in self.stages), 4),
+            "stages": self.stages,
+        }
+
+    def write_report(self, out_dir: str | Path) -> Path:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"build_{self.started_at:%Y%m%d-%H%M%S}.json"
+        path.write_text(json.dumps(self.report(), indent=2, default=str))
+        return path
+
+    def summary(self) -> str:
+        """One line per stage, for console output."""
+        lines = []
+        for s in self.stages:
+            lines.append(
+                f"{s['stage']:<8} {s['wall_seconds']:>8.3f}s"
+                f"  rows {s.get('rows_in', '-')} -> {s.get('rows_out', '-')}"
+                f"  peak_rss {s.get('peak_rss_mb') or 0:.0f}MB"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,55 @@
+# src/infra/sampling.py
+import polars as pl
+
+_KEY = "__sample_key__"
+_ROW = "__sample_row__"
+
+
+class StreamingStratifiedSampler:
+    """
+    Up to `n_per_group` random rows per value of `by`, without collecting the input.
+
+    Every row gets a pseudo-random key hashed from (global row number, seed); the
+    sample is the n smallest keys per group. That is a reservoir per stratum:
+    memory stays at one batch + n rows per group, and the result does not depend
+    on the batch size.
+    """
+
+    def __init__(
+        self, by: str, n_per_group: int, seed: int = 42, batch_size: int = 100_000
+    ):
+        self.by = by
+        self.n_per_group = n_per_group
+        self.seed = seed
+        self.batch_size = batch_size
+
+    def _keep_smallest(self, df: pl.DataFrame) -> pl.DataFrame:
+        return df.filter(pl.col(_KEY).rank("ordinal").over(self.by) <= self.n_per_group)
+
+    def sample(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        names = lf.collect_schema().names()
+        if self.by not in names:
+            raise ValueError(
+                f'Stratified sample "by" column "{self.by}" not found. '
+                f"Available: {names}"
+            )
+
+        reservoir: pl.DataFrame | None = None
+        offset = 0
+        for batch in lf.collect_batches(chunk_size=self.batch_size):
+            batch = batch.with_columns(
+                pl.int_range(offset, offset + pl.len(), dtype=pl.UInt64).alias(_ROW)
+            ).with_columns(pl.col(_ROW).hash(seed=self.seed).alias(_KEY))
+            offset += batch.height
+
+            batch = self._keep_smallest(batch)
+            reservoir = (
+                batch
+                if reservoir is None
+                else self._keep_smallest(pl.concat([reservoir, batch]))
+            )
+
+        if reservoir is None:
+            return lf.clear().collect()
+        # original input order, like a filter over the full table would give
+        return reservoir.sort(_ROW).drop([_KEY, _ROW])
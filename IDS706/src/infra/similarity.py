@@ -0,0 +1,191 @@
+# src/infra/similarity.py
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from .features import FeatureSet, TfidfFeatureStore
+from ..settings import SIMILARITY_DIR
+
+META_COLS = ["title_lc", "company"]
+DEFAULT_N_PROBE = 8  # buckets scored per query (capped at the bucket count)
+
+
+def _normalize_rows(Z: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(Z, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return Z / norms
+
+
+class SimilarityIndex:
+    """
+    IVF (inverted file) index over SVD-reduced, L2-normalized TF-IDF vectors.
+
+    Rows are bucketed by their nearest coarse centroid and stored contiguously per
+    bucket, so a query only scores the `n_probe` closest buckets instead of every row.
+    """
+
+    def __init__(
+        self,
+        vectorizer: TfidfVectorizer,
+        components: np.ndarray,
+        centroids: np.ndarray,
+        vectors: np.ndarray,
+        row_ids: np.ndarray,
+        offsets: np.ndarray,
+        meta: pl.DataFrame,
+    ):
+        self.vectorizer = vectorizer
+        self.components = components
+        self.centroids = centroids
+        self.vectors = vectors
+        self.row_ids = row_ids
+        self.offsets = offsets
+        self.meta = meta
+        # inverse of row_ids: silver row -> position in the bucketed vectors
+        self._pos = np.empty_like(row_ids)
+        self._pos[row_ids] = np.arange(len(row_ids), dtype=row_ids.dtype)
+
+    # -------------------------
+    # Build / persist
+    # -------------------------
+    @classmethod
+    def build(
+        cls,
+        silver_path: str | Path,
+        out_dir: str | Path = SIMILARITY_DIR,
+        store: TfidfFeatureStore | None = None,
+        n_components: int = 128,
+        n_lists: int | None = None,
+        seed: int = 42,
+    ) -> "SimilarityIndex":
+        fs: FeatureSet = (store or TfidfFeatureStore()).get_or_build(silver_path)
+        X = fs.matrix
+        n_rows, n_terms = X.shape
+
+        svd = TruncatedSVD(
+            n_components=max(1, min(n_components, n_terms - 1)), random_state=seed
+        )
+        Z = _normalize_rows(svd.fit_transform(X)).astype(np.float32)
+
+        # ~sqrt(N) buckets keeps both the centroid scan and bucket scans small
+        n_lists = n_lists or max(1, int(np.sqrt(n_rows)))
+        n_lists = min(n_lists, n_rows)
+        km = MiniBatchKMeans(n_clusters=n_lists, random_state=seed, n_init="auto")
+        km.fit(Z)
+        centroids = _normalize_rows(km.cluster_centers_).astype(np.float32)
+        assign = np.argmax(Z @ centroids.T, axis=1)
+
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assign, minlength=n_lists))
+
+        out = Path(out_dir)
+        tmp = out.with_name(out.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        np.save(tmp / "vectors.npy", Z[order])
+        np.save(tmp / "row_ids.npy", order)
+        np.save(tmp / "offsets.npy", offsets)
+        np.save(tmp / "centroids.npy", centroids)
+        np.save(tmp / "components.npy", svd.components_.astype(np.float32))
+        np.save(tmp / "idf.npy", fs.idf)
+        (tmp / "vocabulary.json").write_text(json.dumps(fs.vocabulary))
+        (tmp / "config.json").write_text(
+            json.dumps(
+                {
+                    "source": str(silver_path),
+                    "feature_key": fs.key,
+                    "params": fs.params,
+                    "n_rows": int(n_rows),
+                    "n_components": int(Z.shape[1]),
+                    "n_lists": int(n_lists),
+                },
+                indent=2,
+            )
+        )
+        pl.scan_parquet(silver_path).select(META_COLS).sink_parquet(
+            tmp / "meta.parquet"
+        )
+        shutil.rmtree(out, ignore_errors=True)
+        tmp.rename(out)
+
+        return cls.load(out)
+
+    @classmethod
+    def load(cls, out_dir: str | Path = SIMILARITY_DIR) -> "SimilarityIndex":
+        base = Path(out_dir)
+        if not (base / "config.json").exists():
+            raise FileNotFoundError(f"No similarity index under {base}")
+        config = json.loads((base / "config.json").read_text())
+        fs = FeatureSet(
+            key=config["feature_key"],
+            matrix=None,
+            vocabulary=json.loads((base / "vocabulary.json").read_text()),
+            idf=np.load(base / "idf.npy"),
+            params=config["params"],
+        )
+        return cls(
+            vectorizer=fs.vectorizer(),
+            components=np.load(base / "components.npy"),
+            centroids=np.load(base / "centroids.npy"),
+            vectors=np.load(base / "vectors.npy", mmap_mode="r"),
+            row_ids=np.load(base / "row_ids.npy"),
+            offsets=np.load(base / "offsets.npy"),
+            meta=pl.read_parquet(base / "meta.parquet"),
+        )
+
+    # -------------------------
+    # Query
+    # -------------------------
+    def embed(self, texts: list[str]) -> np.ndarray:
+        q = self.vectorizer.transform(texts) @ self.components.T
+        return _normalize_rows(np.asarray(q, dtype=np.float32))
+
+    def _search(
+        self, q: np.ndarray, k: int, n_probe: int | None, exclude: int | None = None
+    ) -> pl.DataFrame:
+        n_lists = len(self.centroids)
+        if n_probe is None:
+            n_probe = min(DEFAULT_N_PROBE, n_lists)
+        if not 1 <= n_probe <= n_lists:
+            raise ValueError(f"n_probe must be in [1, {n_lists}], got {n_probe}")
+        lists = np.argpartition(-(self.centroids @ q), n_probe - 1)[:n_probe]
+
+        cand_pos = np.concatenate(
+            [np.arange(self.offsets[c], self.offsets[c + 1]) for c in lists]
+        )
+        scores = np.asarray(self.vectors[cand_pos] @ q)
+        if exclude is not None:
+            scores[cand_pos == self._pos[exclude]] = -np.inf
+
+        k = min(k, len(cand_pos))
+        top = np.argpartition(-scores, k - 1)[:k] if k else np.array([], dtype=int)
+        top = top[np.argsort(-scores[top])]
+        top = top[np.isfinite(scores[top])]
+
+        rows = self.row_ids[cand_pos[top]]
+        return self.meta[rows].with_columns(
+            pl.Series("row_id", rows),
+            pl.Series("score", scores[top].astype(np.float32)),
+        )
+
+    def query(self, text: str, k: int = 10, n_probe: int | None = None) -> pl.DataFrame:
+        """Top-k silver rows most similar to free text."""
+        return self._search(self.embed([text])[0], k, n_probe)
+
+    def similar_to(
+        self, row_id: int, k: int = 10, n_probe: int | None = None
+    ) -> pl.DataFrame:
+        """Top-k silver rows most similar to an existing row (itself excluded)."""
+        if not 0 <= row_id < len(self.row_ids):
+            raise ValueError(
+                f"row_id must be in [0, {len(self.row_ids)}), got {row_id}"
+            )
+        q = np.asarray(self.vectors[self._pos[row_id]])
+        return self._search(q, k, n_probe, exclude=row_id)
@@ -0,0 +1,218 @@
+# src/infra/text_index.py
+import json
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from ..settings import TEXT_INDEX_DIR
+
+# Keep "c++", "c#", "node.js"-style tokens useful: letters/digits plus + and #
+TOKEN_PATTERN = r"[a-z0-9][a-z0-9+#]*"
+_TOKEN_RE = re.compile(TOKEN_PATTERN)
+# "quoted phrase" | -term | term
+_QUERY_RE = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+META_COLS = ["title_lc", "company", "location"]
+
+
+def tokenize(text: str) -> list[str]:
+    """Same tokenization the index uses, for query strings."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TextIndex:
+    """
+    Positional inverted index over silver `text`.
+
+    postings.parquet holds one row per term (sorted by term, so row-group statistics
+    prune lookups) with gap-encoded doc ids and gap-encoded positions per doc.
+    Doc ids are silver row numbers; meta.parquet maps them to display columns.
+    """
+
+    def __init__(self, base: Path, meta: pl.DataFrame, n_docs: int):
+        self.base = Path(base)
+        self.meta = meta
+        self.n_docs = n_docs
+
+    # -------------------------
+    # Build / persist
+    # -------------------------
+    @classmethod
+    def build(
+        cls,
+        silver_path: str | Path,
+        out_dir: str | Path = TEXT_INDEX_DIR,
+        text_col: str = "text",
+        row_group_size: int = 4096,
+    ) -> "TextIndex":
+        silver = pl.scan_parquet(silver_path)
+        tokens = (
+            silver.select(
+                pl.col(text_col)
+                .fill_null("")
+                .str.to_lowercase()
+                .str.extract_all(TOKEN_PATTERN)
+                .alias("term")
+            )
+            .with_row_index("doc_id")
+            .with_columns(
+                pl.int_ranges(0, pl.col("term").list.len(), dtype=pl.UInt32).alias(
+                    "pos"
+                )
+            )
+            .explode(["term", "pos"])
+            .drop_nulls("term")
+        )
+        postings = (
+            tokens.group_by(["term", "doc_id"])
+            .agg(
+                pl.col("pos")
+                .sort()
+                .diff()
+                .fill_null(pl.col("pos").min())
+                .cast(pl.UInt32)
+                .alias("pos_gaps")
+            )
+            .sort(["term", "doc_id"])
+            .group_by("term", maintain_order=True)
+            .agg(
+                pl.len().alias("df"),
+                pl.col("doc_id")
+                .diff()
+                .fill_null(pl.col("doc_id").first())
+                .cast(pl.UInt32)
+                .alias("doc_gaps"),
+                pl.col("pos_gaps"),
+            )
+        )
+
+        out = Path(out_dir)
+        tmp = out.with_name(out.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        postings.sink_parquet(
+            tmp / "postings.parquet",
+            compression="zstd",
+            row_group_size=row_group_size,
+        )
+        silver.select(META_COLS).sink_parquet(tmp / "meta.parquet")
+        n_docs = silver.select(pl.len()).collect().item()
+        (tmp / "config.json").write_text(
+            json.dumps(
+                {
+                    "source": str(silver_path),
+                    "text_col": text_col,
+                    "token_pattern": TOKEN_PATTERN,
+                    "n_docs": n_docs,
+                },
+                indent=2,
+            )
+        )
+        shutil.rmtree(out, ignore_errors=True)
+        tmp.rename(out)
+        return cls.load(out)
+
+    @classmethod
+    def load(cls, out_dir: str | Path = TEXT_INDEX_DIR) -> "TextIndex":
+        base = Path(out_dir)
+        if not (base / "config.json").exists():
+            raise FileNotFoundError(f"No text index under {base}")
+        config = json.loads((base / "config.json").read_text())
+        return cls(base, pl.read_parquet(base / "meta.parquet"), config["n_docs"])
+
+    # -------------------------
+    # Postings access
+    # -------------------------
+    def _postings(self, terms: list[str], positions: bool = False) -> pl.DataFrame:
+        """Decoded (term, doc_id[, pos]) rows for the given terms only."""
+        cols = ["term", "doc_gaps"] + (["pos_gaps"] if positions else [])
+        lf = (
+            pl.scan_parquet(self.base / "postings.parquet")
+            .filter(pl.col("term").is_in(terms))
+            .select(cols)
+            .explode(cols[1:])
+            .with_columns(pl.col("doc_gaps").cum_sum().over("term").alias("doc_id"))
+        )
+        if positions:
+            lf = lf.with_columns(
+                pl.col("pos_gaps").list.eval(pl.element().cum_sum()).alias("pos")
+            )
+        return lf.drop([c for c in cols if c.endswith("_gaps")]).collect()
+
+    def docs(self, term: str) -> np.ndarray:
+        """Sorted doc ids containing a single (already tokenized) term."""
+        return self._postings([term])["doc_id"].to_numpy()
+
+    # -------------------------
+    # Queries (all return sorted silver row ids)
+    # -------------------------
+    def all_of(self, terms: list[str]) -> np.ndarray:
+        terms = sorted(set(terms))
+        if not terms:
+            return np.arange(self.n_docs, dtype=np.uint32)
+        post = self._postings(terms)
+        hits = post.group_by("doc_id").agg(pl.col("term").n_unique().alias("n"))
+        return np.sort(hits.filter(pl.col("n") == len(terms))["doc_id"].to_numpy())
+
+    def any_of(self, terms: list[str]) -> np.ndarray:
+        return np.unique(self._postings(sorted(set(terms)))["doc_id"].to_numpy())
+
+    def phrase(self, text: str) -> np.ndarray:
+        """Docs containing the tokens of `text` consecutively, in order."""
+        words = tokenize(text)
+        if not words:
+            return np.array([], dtype=np.uint32)
+        if len(words) <= 1:
+            return self.all_of(words)
+        post = self._postings(sorted(set(words)), positions=True).explode("pos")
+        # align every occurrence to the phrase start: start = pos - offset(term)
+        aligned = pl.concat(
+            [
+                post.filter(pl.col("term") == w).select(
+                    "doc_id", (pl.col("pos").cast(pl.Int64) - i).alias("start")
+                )
+                for i, w in enumerate(words)
+            ]
+        )
+        hits = (
+            aligned.group_by(["doc_id", "start"])
+            .agg(pl.len().alias("n"))
+            .filter(pl.col("n") == len(words))
+        )
+        return np.unique(hits["doc_id"].to_numpy())
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        Boolean query: whitespace = AND, `OR` between clauses, `-term` / `-"..."`
+        excludes, and "quoted text" is a phrase. A term without tokens matches
+        nothing; a query without any raises ValueError. Example:
+            python "machine learning" -intern OR "data engineer" spark
+        """
+        result, searchable = np.array([], dtype=np.uint32), False
+        for clause in re.split(r"\s+OR\s+", query.strip()):
+            must, must_not = [], []
+            for neg, quoted, word in _QUERY_RE.findall(clause):
+                is_neg = bool(neg) or word.startswith("-")
+                text = word.lstrip("-") if word else quoted
+                if is_neg and not tokenize(text):
+                    continue  # a bare "-" excludes nothing (and selects nothing)
+                searchable = searchable or bool(tokenize(text))
+                (must_not if is_neg else must).append(self.phrase(text))
+            if not must and not must_not:
+                continue
+            docs = np.arange(self.n_docs, dtype=np.uint32)
+            for hits in must:
+                docs = np.intersect1d(docs, hits, assume_unique=True)
+            for hits in must_not:
+                docs = np.setdiff1d(docs, hits, assume_unique=True)
+            result = np.union1d(result, docs)
+        if not searchable:
+            raise ValueError(f"No searchable terms in query {query!r}.")
+        return result
+
+    def frame(self, ids: np.ndarray) -> pl.DataFrame:
+        """Display columns for the given silver row ids."""
+        return self.meta[ids].with_columns(pl.Series("row_id", ids))
@@ -1,7 +1,9 @@
 # src/infra/transformers.py
 import re
+
 import polars as pl
 from ..domain.ports import Transformer
+from .normalization import DEFAULT_PLAN, NormalizationPlan
 
 
 # -------------------------
@@ -10,114 +12,91 @@ from ..domain.ports import Transformer
 class CleanJobTransformer(Transformer):
     """Normalize raw columns into a consistent schema and basic typing."""
 
+    def __init__(self, plan: NormalizationPlan | None = None):
+        # the shared plan caches resolved expressions per source schema
+        self.plan = plan or DEFAULT_PLAN
+
     def run(self, lf: pl.LazyFrame) -> pl.LazyFrame:
-        cols_set = set(lf.collect_schema().names())
-
-        def first_present(cands: list[str]) -> pl.Expr:
-            for c in cands:
-                if c in cols_set:
-                    return pl.col(c)
-            return pl.lit(None)
-
-        title_candidates = ["job_title", "title", "position"]
-        company_candidates = ["company", "company_name", "employer"]
-        location_candidates = ["location", "job_location", "city"]
-        posted_candidates = [
-            "posted_time",
-            "posted_at",
-            "date_posted",
-            "post_date",
-            "first_seen",
-            "last_processed_time",
-            "created_at",
-            "timestamp",
-        ]
-        desc_candidates = ["description", "job_description", "desc", "job_summary"]
-        skills_candidates = ["skills", "skill_list", "tags", "job_skills"]
-        work_type_candidates = [
-            "work_type",
-            "job_type",
-            "onsite_remote",
-            "onsite_remote_hybrid",
-            "employment_type",
-            "remote_status",
-        ]
-        seniority_candidates = ["seniority", "experience_level", "level", "job_level"]
-
-        out = (
-            lf
-            # 1) candidate column -> standard column
-            .with_columns(
-                [
-                    first_present(title_candidates).cast(pl.Utf8).alias("title"),
-                    first_present(company_candidates).cast(pl.Utf8).alias("company"),
-                    first_present(location_candidates).cast(pl.Utf8).alias("location"),
-                    first_present(posted_candidates).cast(pl.Utf8).alias("posted_raw"),
-                    first_present(desc_candidates).cast(pl.Utf8).alias("desc"),
-                    first_present(work_type_candidates)
-                    .cast(pl.Utf8)
-                    .alias("work_type"),
-                    first_present(seniority_candidates)
-                    .cast(pl.Utf8)
-                    .alias("seniority"),
-                    first_present(skills_candidates).cast(pl.Utf8).alias("skills_raw"),
-                ]
-            )
-            # 2) add title_lc and posted_at
-            .with_columns(
-                [
-                    pl.when(pl.col("title").is_not_null())
-                    .then(pl.col("title").str.to_lowercase())
-                    .otherwise(pl.lit(None))
-                    .alias("title_lc"),
-                    pl.coalesce(
-                        [
-                            # use UTC to parse first, and then remove timezone
-                            pl.col("posted_raw")
-                            .str.strptime(pl.Datetime(time_zone="UTC"), strict=False)
-                            .dt.replace_time_zone(None),
-                            # try to parse no timezome string
-                            pl.col("posted_raw").str.strptime(
-                                pl.Datetime, strict=False
-                            ),
-                        ]
-                    ).alias("posted_at"),
-                ]
-            )
-            # 3) basic filter
-            .filter(pl.col("title").is_not_null() & pl.col("company").is_not_null())
-            # 4) skills regularization
+        return self.plan.apply(lf)
+
+
+# -------------------------
+# 1b) Skills enrichment from job_skills
+# -------------------------
+class SkillsJoinTransformer(Transformer):
+    """
+    Attach skills from a separate skills table by job id, lazily.
+
+    The skills table may be one row per posting with a comma-separated string
+    (Kaggle's job_skills: job_link, job_skills) or one row per skill (job_id, skill).
+    Joined skills replace skills_list where present; otherwise it is kept.
+    Pass `keys` (a frame with the key column) to semi-join the skills table down to
+    those postings first, e.g. when enriching a small sample.
+    """
+
+    key_candidates = ["job_id", "job_link", "id", "posting_id"]
+    csv_candidates = ["job_skills", "skills", "skill_list"]
+
+    def __init__(
+        self,
+        skills: pl.LazyFrame,
+        key: str = "job_id",
+        keys: pl.LazyFrame | None = None,
+    ):
+        self.skills = skills
+        self.key = key
+        self.keys = keys
+
+    def skills_long(self) -> pl.LazyFrame:
+        """(job_id, skill) rows, one per skill, lowercased and stripped."""
+        names = self.skills.collect_schema().names()
+        src_key = next((c for c in self.key_candidates if c in names), None)
+        if src_key is None:
+            raise ValueError(f"No job id column in skills table. Available: {names}")
+
+        if "skill" in names:
+            skill, is_list = pl.col("skill").cast(pl.Utf8), False
+        else:
+            csv_col = next((c for c in self.csv_candidates if c in names), None)
+            if csv_col is None:
+                raise ValueError(
+                    f"No skills column in skills table. Available: {names}"
+                )
+            skill, is_list = pl.col(csv_col).cast(pl.Utf8).str.split(","), True
+
+        long = self.skills.select(
+            pl.col(src_key).cast(pl.Utf8).alias(self.key),
+            skill.alias("skill"),
+        )
+        if self.keys is not None:
+            wanted = self.keys.select(pl.col(self.key).cast(pl.Utf8)).drop_nulls()
+            long = long.join(wanted, on=self.key, how="semi")
+        if is_list:
+            long = long.explode("skill")
+        # scalar string ops after explode (cheaper than list.eval per row)
+        return long.with_columns(
+            pl.col("skill").str.strip_chars().str.to_lowercase()
+        ).filter(pl.col("skill").is_not_null() & (pl.col("skill") != ""))
+
+    def skills_by_job(self) -> pl.LazyFrame:
+        """(job_id, skills_joined) with one list of skills per posting."""
+        return (
+            self.skills_long()
+            .group_by(self.key)
+            .agg(pl.col("skill").unique(maintain_order=True).alias("skills_joined"))
+        )
+
+    def run(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        return (
+            lf.join(self.skills_by_job(), on=self.key, how="left")
             .with_columns(
-                [
-                    pl.when(pl.col("skills_raw").is_not_null())
-                    .then(
-                        pl.when(pl.col("skills_raw").str.starts_with("["))
-                        .then(pl.col("skills_raw").str.json_decode(pl.List(pl.Utf8)))
-                        .otherwise(pl.col("skills_raw").str.split(","))
-                    )
-                    .otherwise(pl.lit([]))
-                    .list.eval(
-                        pl.element().cast(pl.Utf8).str.strip_chars().str.to_lowercase()
-                    )
-                    .alias("skills_list")
-                ]
-            )
-            # 5) final
-            .select(
-                [
-                    "title",
-                    "title_lc",
-                    "company",
-                    "location",
-                    "desc",
-                    "work_type",
-                    "seniority",
-                    "posted_at",
-                    "skills_list",
-                ]
+                pl.when(pl.col("skills_joined").list.len() > 0)
+                .then(pl.col("skills_joined"))
+                .otherwise(pl.col("skills_list"))
+                .alias("skills_list")
             )
+            .drop("skills_joined")
         )
-        return out
 
 
 # -------------------------
@@ -222,3 +201,29 @@ class DeriveSeniorityTransformer(Transformer):
                 .alias("seniority")
             ]
         )
+
+
+# -------------------------
+# 5) Location -> city/state/country
+# -------------------------
+class LocationNormalizeTransformer(Transformer):
+    """
+    Add city/state/country by left-joining a location mapping, lazily.
+
+    `mapping` is an already-materialized frame with location plus the three
+    columns, e.g. from LocationCache.mapping() over the distinct locations of
+    bronze. Rows whose location is missing from it get nulls.
+    """
+
+    columns = ["city", "state", "country"]
+
+    def __init__(self, mapping: pl.DataFrame):
+        self.mapping = mapping.select("location", *self.columns)
+
+    def run(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        return lf.join(
+            self.mapping.lazy(),
+            on="location",
+            how="left",
+            maintain_order="left",
+        )
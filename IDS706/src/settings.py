@@ -6,11 +6,32 @@ RAW_DIR = DATA_DIR / "raw"
 BRONZE_DIR = DATA_DIR / "bronze"
 SILVER_DIR = DATA_DIR / "silver"
 GOLD_DIR = DATA_DIR / "gold"
+REPORTS_DIR = DATA_DIR / "reports"
+
+# Raw skills table (joined onto postings by job id instead of unioned)
+JOB_SKILLS_PATH = RAW_DIR / "job_skills.parquet"
 
 # File names for standardized outputs
 BRONZE_PATH = BRONZE_DIR / "jobs.parquet"
 SILVER_PATH = SILVER_DIR / "jobs_text.parquet"
 TOP_SKILLS_PATH = GOLD_DIR / "top_skills.parquet"
+K_SWEEP_PATH = GOLD_DIR / "kmeans_k_sweep.parquet"
+
+# Posting/skill count rollups by posted_at (weekly/monthly derived from daily)
+ROLLUP_PATHS = {
+    "1d": GOLD_DIR / "rollup_daily.parquet",
+    "1w": GOLD_DIR / "rollup_weekly.parquet",
+    "1mo": GOLD_DIR / "rollup_monthly.parquet",
+}
+
+# Parquet write options per pipeline table ("default" fills in the rest). Bronze
+# is the biggest and only an intermediate, so it trades ratio for write speed.
+PARQUET_WRITE_OPTIONS = {
+    "default": {"compression": "zstd", "compression_level": 3},
+    "bronze": {"compression_level": 1},
+    "silver": {},
+    "gold": {"compression_level": 9},
+}
 
 # Role filters for this project
 TARGET_ROLES = [
@@ -19,3 +40,48 @@ TARGET_ROLES = [
     "data engineer",
     "software engineer",
 ]
+
+# Cached ML features (TF-IDF matrices keyed by input hash + params)
+FEATURES_DIR = DATA_DIR / "features"
+
+# Resolved location -> city/state/country mappings (see infra/gazetteer.py)
+CACHE_DIR = DATA_DIR / "cache"
+LOCATION_CACHE_PATH = CACHE_DIR / "locations.parquet"
+
+# Footer-statistics catalog of the pipeline's parquet outputs (infra/catalog.py)
+CATALOG_DIR = DATA_DIR / "catalog"
+CATALOG_DATASETS = {
+    "raw": RAW_DIR / "*.parquet",
+    "bronze": BRONZE_PATH,
+    "silver": SILVER_PATH,
+    "top_skills": TOP_SKILLS_PATH,
+    "kmeans_k_sweep": K_SWEEP_PATH,
+    **{f"rollup_{every}": path for every, path in ROLLUP_PATHS.items()},
+}
+
+# On-disk search indexes built over silver
+INDEX_DIR = DATA_DIR / "index"
+SIMILARITY_DIR = INDEX_DIR / "similarity"
+TEXT_INDEX_DIR = INDEX_DIR / "text"
+
+# TF-IDF settings used by the clustering workflow (02_kmeans.ipynb)
+TFIDF_PARAMS = {
+    "max_features": 5000,
+    "stop_words": "english",
+    "min_df": 3,
+    "max_df": 0.7,
+    "ngram_range": (1, 2),
+}
+
+# K values tried by the cluster model-selection sweep
+KMEANS_KS = [4, 5, 6, 7, 8, 10]
+
+# Polars execution settings. Precedence: CLI flags > JOBS_* env vars > the TOML
+# file below ([runtime] table) > these defaults. See src/utils/runtime.py.
+RUNTIME_CONFIG_PATH = Path("jobs.toml")
+RUNTIME_DEFAULTS = {
+    "engine": "auto",  # "auto" | "streaming" | "in-memory"
+    "threads": None,  # Polars thread pool size (None = all cores)
+    "chunk_size": None,  # rows per streaming morsel (None = Polars default)
+    "memory_limit_mb": None,  # advisory: with engine "auto", forces streaming
+}
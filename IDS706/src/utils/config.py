@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import List
 
+from ..settings import PARQUET_WRITE_OPTIONS
+
 
 def ensure_dirs(*dirs: Path) -> None:
     """Create directories if they do not exist."""
@@ -11,3 +13,8 @@ def ensure_dirs(*dirs: Path) -> None:
 def list_parquet_files(folder: Path) -> List[Path]:
     """Return all .parquet files under a folder (non-recursive)."""
     return sorted(folder.glob("*.parquet"))
+
+
+def write_options(table: str) -> dict:
+    """Parquet write kwargs for a pipeline table, on top of the defaults."""
+    return {**PARQUET_WRITE_OPTIONS["default"], **PARQUET_WRITE_OPTIONS.get(table, {})}
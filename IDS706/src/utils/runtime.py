@@ -0,0 +1,158 @@
+# src/utils/runtime.py
+"""
+Polars runtime settings (engine, thread pool, streaming chunk size).
+
+Polars reads POLARS_MAX_THREADS once, when it is first imported, so this module
+does not import polars at the top: apply() must run before anything else loads
+it (the CLI imports its commands lazily for that reason).
+"""
+
+import os
+import sys
+import tomllib
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..settings import RUNTIME_CONFIG_PATH, RUNTIME_DEFAULTS
+
+ENGINES = ("auto", "streaming", "in-memory")
+ENV_PREFIX = "JOBS_"
+_INT_KEYS = ("threads", "chunk_size", "memory_limit_mb")
+
+
+def _coerce(key: str, value, source: str):
+    """A TOML or env value as its setting's type; ValueError names the key."""
+    if key in _INT_KEYS:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+        raise ValueError(f"{key} must be an integer (from {source}), got {value!r}")
+    if not isinstance(value, str):
+        raise ValueError(f"{key} must be a string (from {source}), got {value!r}")
+    return value
+
+
+@dataclass
+class RuntimeConfig:
+    """Execution settings used by every collect/sink in the pipeline."""
+
+    engine: str = "auto"
+    threads: int | None = None
+    chunk_size: int | None = None
+    memory_limit_mb: int | None = None
+    # key -> where its value came from (default / file path / env var / flag)
+    sources: dict[str, str] = field(default_factory=dict, compare=False)
+
+    def __post_init__(self):
+        if self.engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {self.engine!r}")
+        for key in _INT_KEYS:
+            value = getattr(self, key)
+            if value is not None and value <= 0:
+                raise ValueError(f"{key} must be a positive integer, got {value}")
+
+    @classmethod
+    def load(
+        cls,
+        config_path: str | Path | None = None,
+        env: dict[str, str] | None = None,
+        **flags,
+    ) -> "RuntimeConfig":
+        """Merge defaults < TOML file < JOBS_* env vars < non-None flags."""
+        values = dict(RUNTIME_DEFAULTS)
+        sources = {key: "default" for key in values}
+
+        path = Path(config_path) if config_path else RUNTIME_CONFIG_PATH
+        if path.exists():
+            data = tomllib.loads(path.read_text())
+            data = data.get("runtime", data)
+            unknown = set(data) - set(values)
+            if unknown:
+                raise ValueError(f"Unknown runtime keys in {path}: {sorted(unknown)}")
+            for key, value in data.items():
+                values[key] = _coerce(key, value, str(path))
+                sources[key] = str(path)
+        elif config_path:
+            raise FileNotFoundError(f"Runtime config not found: {path}")
+
+        env = os.environ if env is None else env
+        for key in values:
+            name = ENV_PREFIX + key.upper()
+            if env.get(name):
+                values[key] = _coerce(key, env[name], f"${name}")
+                sources[key] = f"${name}"
+
+        for key, value in flags.items():
+            if key not in values:
+                raise TypeError(f"Unknown runtime setting: {key}")
+            if value is not None:
+                values[key] = value
+                sources[key] = "flag"
+
+        return cls(**values, sources=sources)
+
+    @property
+    def effective_engine(self) -> str:
+        # Polars has no hard memory cap; a limit means "prefer bounded memory"
+        if self.engine == "auto" and self.memory_limit_mb:
+            return "streaming"
+        return self.engine
+
+    def apply(self) -> "RuntimeConfig":
+        """Configure Polars and make this the config returned by current().
+
+        Before Polars is imported only its env vars are set (it reads them at
+        import), so `cli --help` and friends never pay for loading Polars.
+        """
+        global _current
+        if "polars" not in sys.modules:
+            if self.threads:
+                os.environ["POLARS_MAX_THREADS"] = str(self.threads)
+            os.environ["POLARS_ENGINE_AFFINITY"] = self.effective_engine
+            if self.chunk_size:
+                os.environ["POLARS_IDEAL_MORSEL_SIZE"] = str(self.chunk_size)
+            else:
+                os.environ.pop("POLARS_IDEAL_MORSEL_SIZE", None)
+            _current = self
+            return self
+
+        import polars as pl
+
+        if self.threads and pl.thread_pool_size() != self.threads:
+            warnings.warn(
+                f"Polars is already imported with {pl.thread_pool_size()} "
+                f"threads; threads={self.threads} is ignored.",
+                stacklevel=2,
+            )
+        pl.Config.set_engine_affinity(self.effective_engine)
+        pl.Config.set_streaming_chunk_size(self.chunk_size)
+        _current = self
+        return self
+
+    def describe(self) -> str:
+        """Effective settings, one per line, with where each came from."""
+        import polars as pl
+
+        rows = [
+            ("engine", self.effective_engine),
+            ("threads", pl.thread_pool_size()),
+            ("chunk_size", self.chunk_size or "polars default"),
+            ("memory_limit_mb", self.memory_limit_mb or "none"),
+        ]
+        return "\n".join(
+            f"  {key:<16} {value}  ({self.sources.get(key, 'default')})"
+            for key, value in rows
+        )
+
+
+_current = RuntimeConfig()
+
+
+def current() -> RuntimeConfig:
+    """The config last applied (defaults if none was)."""
+    return _current
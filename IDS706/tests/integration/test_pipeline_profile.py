@@ -0,0 +1,44 @@
+# English comments only below.
+import json
+import shutil
+from pathlib import Path
+
+from src.app.pipeline import JobsPipeline
+from src.infra.profiling import StageProfiler
+
+TEST_DIR = Path(__file__).resolve().parents[2] / "data" / "test"
+
+
+def test_profiled_build_writes_stage_report(tmp_path, monkeypatch):
+    # settings paths are relative to the project root, so build inside tmp_path
+    raw = tmp_path / "data" / "raw"
+    raw.mkdir(parents=True)
+    shutil.copy(TEST_DIR / "tiny_jobs.parquet", raw / "tiny_jobs.parquet")
+    monkeypatch.chdir(tmp_path)
+
+    profiler = StageProfiler()
+    JobsPipeline(profiler=profiler).build()
+    report_path = profiler.write_report(tmp_path / "reports")
+
+    report = json.loads(report_path.read_text())
+    assert [s["stage"] for s in report["stages"]] == [
+        "bronze",
+        "locations",
+        "silver",
+        "gold",
+        "rollups",
+    ]
+    bronze, locations, silver, gold, rollups = report["stages"]
+    assert bronze["rows_in"] == 2000
+    assert bronze["rows_out"] <= bronze["rows_in"]
+    assert silver["rows_in"] == bronze["rows_out"]
+    assert gold["rows_in"] == silver["rows_out"]
+    assert rollups["rows_in"] == silver["rows_out"]
+    assert locations["rows_in"] == bronze["rows_out"]
+    assert 0 < locations["resolved"] <= locations["distinct"]
+    assert "rows_out" not in locations  # resolution writes no table
+    for s in report["stages"]:
+        assert s["wall_seconds"] >= 0
+        assert s["plan"]
+        if s is not locations:
+            assert s["bytes_written"] > 0
@@ -0,0 +1,36 @@
+# English comments only below.
+import shutil
+from pathlib import Path
+
+import polars as pl
+from src.app.pipeline import JobsPipeline
+from src.settings import ROLLUP_PATHS, SILVER_PATH
+
+TEST_DIR = Path(__file__).resolve().parents[2] / "data" / "test"
+
+
+def _assert_rollups_match_silver() -> None:
+    dated = pl.read_parquet(SILVER_PATH)["posted_at"].drop_nulls().len()
+    assert dated > 0
+    for path in ROLLUP_PATHS.values():
+        totals = pl.read_parquet(path).filter(pl.col("skill").is_null())
+        assert totals["postings"].sum() == dated
+
+
+def test_second_build_on_replaced_raw_rebuilds_rollups(tmp_path, monkeypatch):
+    # settings paths are relative to the project root, so build inside tmp_path
+    raw = tmp_path / "data" / "raw"
+    raw.mkdir(parents=True)
+    shutil.copy(TEST_DIR / "tiny_jobs.parquet", raw / "tiny_jobs.parquet")
+    monkeypatch.chdir(tmp_path)
+
+    JobsPipeline().build()
+    _assert_rollups_match_silver()
+
+    # replace raw with a smaller extract: earlier days now hold fewer postings
+    tiny = pl.read_parquet(raw / "tiny_jobs.parquet")
+    (raw / "tiny_jobs.parquet").unlink()
+    tiny.head(tiny.height // 3).write_parquet(raw / "tiny_jobs_v2.parquet")
+
+    JobsPipeline().build()
+    _assert_rollups_match_silver()
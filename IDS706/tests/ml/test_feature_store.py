@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from pathlib import Path
+
+sklearn = pytest.importorskip("sklearn")
+
+from src.infra.features import TfidfFeatureStore  # noqa: E402
+
+TEST_DIR = Path("data/test")
+PARAMS = {"max_features": 500, "ngram_range": (1, 2)}
+
+
+def test_feature_store_builds_then_reuses_cache(tmp_path):
+    src = TEST_DIR / "tiny_jobs_text.parquet"
+    store = TfidfFeatureStore(root=tmp_path, params=PARAMS)
+
+    built = store.get_or_build(src)
+    assert store.exists(built.key)
+    assert built.matrix.shape[0] > 0
+    assert built.matrix.shape[1] <= 500
+
+    # Second call loads the memory-mapped copy instead of refitting
+    loaded = store.get_or_build(src)
+    assert loaded.key == built.key
+    assert not loaded.matrix.data.flags.owndata  # view over the mmap, no copy
+    assert (loaded.matrix != built.matrix).nnz == 0
+
+
+def test_feature_key_changes_with_params(tmp_path):
+    src = TEST_DIR / "tiny_jobs_text.parquet"
+    a = TfidfFeatureStore(root=tmp_path, params=PARAMS).key_for(src)
+    b = TfidfFeatureStore(root=tmp_path, params={**PARAMS, "max_features": 100})
+    assert a != b.key_for(src)
+
+
+def test_rebuilt_vectorizer_matches_stored_rows(tmp_path):
+    import polars as pl
+
+    src = TEST_DIR / "tiny_jobs_text.parquet"
+    fs = TfidfFeatureStore(root=tmp_path, params=PARAMS).get_or_build(src)
+    texts = pl.read_parquet(src)["text"].fill_null("").head(5).to_list()
+
+    X_new = fs.vectorizer().transform(texts)
+    assert np.allclose(X_new.toarray(), fs.matrix[:5].toarray())
@@ -0,0 +1,29 @@
+import polars as pl
+import pytest
+from pathlib import Path
+
+sklearn = pytest.importorskip("sklearn")
+
+from src.infra.features import TfidfFeatureStore  # noqa: E402
+from src.infra.model_selection import KMeansSweep  # noqa: E402
+
+TEST_DIR = Path("data/test")
+
+
+def test_parallel_sweep_scores_every_k(tmp_path):
+    # tiny_jobs_text is mostly empty text, so cluster on titles instead
+    src = tmp_path / "titles.parquet"
+    pl.read_parquet(TEST_DIR / "tiny_jobs.parquet").select(
+        pl.col("title_lc").alias("text")
+    ).write_parquet(src)
+    store = TfidfFeatureStore(root=tmp_path / "features", params={"max_features": 300})
+    fs = store.get_or_build(src)
+
+    out = KMeansSweep([3, 2, 4], sample_size=200, max_workers=2).run(store, fs.key)
+
+    assert out["k"].to_list() == [2, 3, 4]
+    assert {"inertia", "silhouette_cosine", "fit_seconds"}.issubset(out.columns)
+    assert (out["inertia"] > 0).all()
+    # inertia should not grow as K increases on the same data
+    assert out["inertia"][0] >= out["inertia"][-1]
+    assert out["silhouette_cosine"].is_not_nan().all()
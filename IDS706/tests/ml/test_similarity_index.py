@@ -0,0 +1,55 @@
+import polars as pl
+import pytest
+from pathlib import Path
+
+sklearn = pytest.importorskip("sklearn")
+
+from src.infra.features import TfidfFeatureStore  # noqa: E402
+from src.infra.similarity import SimilarityIndex  # noqa: E402
+
+TEST_DIR = Path("data/test")
+
+
+def _silver_like(tmp_path: Path) -> Path:
+    src = tmp_path / "silver.parquet"
+    pl.read_parquet(TEST_DIR / "tiny_jobs.parquet").select(
+        "title_lc", "company", pl.col("title_lc").alias("text")
+    ).write_parquet(src)
+    return src
+
+
+def test_similarity_index_build_query_and_reload(tmp_path):
+    src = _silver_like(tmp_path)
+    store = TfidfFeatureStore(root=tmp_path / "features", params={"max_features": 500})
+    idx = SimilarityIndex.build(
+        src, out_dir=tmp_path / "sim", store=store, n_components=32
+    )
+
+    title = pl.read_parquet(src)["title_lc"][10]
+    # probing every bucket makes the search exhaustive
+    hits = idx.query(title, k=5, n_probe=len(idx.centroids))
+    assert hits.height == 5
+    assert hits["title_lc"][0] == title
+    assert hits["score"].is_sorted(descending=True)
+
+    reloaded = SimilarityIndex.load(tmp_path / "sim")
+    near = reloaded.similar_to(10, k=3)
+    assert 10 not in near["row_id"].to_list()
+    assert {"title_lc", "company", "row_id", "score"}.issubset(near.columns)
+
+
+def test_similarity_index_rejects_bad_row_and_probe(tmp_path):
+    src = _silver_like(tmp_path)
+    store = TfidfFeatureStore(root=tmp_path / "features", params={"max_features": 500})
+    idx = SimilarityIndex.build(
+        src, out_dir=tmp_path / "sim", store=store, n_components=32
+    )
+    n_rows, n_lists = len(idx.row_ids), len(idx.centroids)
+
+    for row_id in (-1, n_rows):
+        with pytest.raises(ValueError, match="row_id"):
+            idx.similar_to(row_id)
+    for n_probe in (0, n_lists + 1):
+        with pytest.raises(ValueError, match="n_probe"):
+            idx.query("data engineer", n_probe=n_probe)
+    assert idx.similar_to(n_rows - 1, k=2, n_probe=1).height <= 2
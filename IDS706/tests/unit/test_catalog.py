@@ -0,0 +1,55 @@
+# English comments only below.
+from datetime import datetime
+
+import polars as pl
+from src.infra.catalog import DatasetCatalog
+
+
+def _write_part(path, start_day: int, n: int = 6):
+    pl.DataFrame(
+        {
+            "posted_at": [datetime(2024, 1, start_day + i) for i in range(n)],
+            "work_type": ["remote", None] * (n // 2),
+            "count": list(range(n)),
+        }
+    ).write_parquet(path, row_group_size=3)
+
+
+def test_summary_and_pruning_from_footers(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    _write_part(raw / "a.parquet", 1)
+    _write_part(raw / "b.parquet", 11)
+    cat = DatasetCatalog(tmp_path / "catalog", {"raw": raw / "*.parquet"})
+    files = cat.refresh()
+
+    assert files["num_row_groups"].to_list() == [2, 2]
+    assert cat.row_count("raw") == 12
+    summary = {r["column"]: r for r in cat.summary("raw").iter_rows(named=True)}
+    assert summary["work_type"]["null_count"] == 6
+    assert summary["work_type"]["null_rate"] == 0.5
+    assert summary["posted_at"]["min"] == "2024-01-01T00:00:00"
+    assert summary["posted_at"]["max"] == "2024-01-16T00:00:00"
+    assert (summary["count"]["min"], summary["count"]["max"]) == ("0", "5")
+
+    # days 1-3, 4-6, 11-13, 14-16 per row group; only 4-6 and 11-13 can hold 5..12
+    hits = cat.prune("raw", "posted_at", "2024-01-05", datetime(2024, 1, 12))
+    assert hits.select("row_group", "num_rows").rows() == [(1, 3), (0, 3)]
+    assert hits["path"].to_list() == [str(raw / "a.parquet"), str(raw / "b.parquet")]
+
+
+def test_refresh_rereads_only_changed_files(tmp_path):
+    _write_part(tmp_path / "a.parquet", 1)
+    _write_part(tmp_path / "b.parquet", 11)
+    datasets = {"t": tmp_path / "*.parquet"}
+    DatasetCatalog(tmp_path / "catalog", datasets).refresh()
+
+    _write_part(tmp_path / "b.parquet", 21, n=4)
+    (tmp_path / "a.parquet").unlink()
+    cat = DatasetCatalog(tmp_path / "catalog", datasets)  # loads the persisted one
+    cat.refresh()
+    assert cat.stats == {"read": 1, "reused": 0}
+    assert cat.row_count("t") == 4
+    assert cat.summary("t").filter(pl.col("column") == "posted_at")["min"][0] == (
+        "2024-01-21T00:00:00"
+    )
@@ -0,0 +1,40 @@
+# English comments only below.
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJ = Path(__file__).resolve().parents[2]
+HEAVY = ("polars", "pyarrow", "numpy", "sklearn", "scipy")
+
+
+def _loaded_modules(*args: str) -> set[str]:
+    # fresh interpreter: this test process has polars loaded already
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJ,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return {
+        line.rsplit("|", 1)[1].strip().split(".")[0]
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import src.app.cli"),
+        ("-m", "src.app.cli", "--help"),
+        ("-m", "src.app.cli", "--threads", "2", "build", "--help"),
+        ("-m", "src.app.cli", "sweep", "--help"),
+    ],
+)
+def test_cli_startup_skips_heavy_imports(args):
+    loaded = _loaded_modules(*args)
+    assert not loaded & set(HEAVY)
+    assert "typer" in loaded  # sanity: the parse saw the imports
@@ -0,0 +1,91 @@
+# English comments only below.
+import json
+
+import polars as pl
+from scripts.download_kaggle import (
+    MANIFEST_NAME,
+    convert_csv,
+    infer_schema,
+    ingest_local,
+)
+
+
+def _write(path, lines: list[str]):
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _jobs_csv(path, n: int = 400):
+    # the float only shows up near the end, past the first sample
+    rows = [f"l{i},{i},Data Engineer" for i in range(n)]
+    rows[-2] = f"l{n - 2},2.5,Data Engineer"
+    return _write(path, ["job_link,salary,title", *rows])
+
+
+def test_infer_schema_sees_late_values(tmp_path):
+    schema = infer_schema(_jobs_csv(tmp_path / "jobs.csv"), sample_bytes=1200)
+    assert schema == {"job_link": pl.String, "salary": pl.Float64, "title": pl.String}
+
+
+def test_convert_csv_types_and_counts_rejects(tmp_path):
+    src = _write(
+        tmp_path / "jobs.csv",
+        ["job_link,n,title", "a,1,x", "b,oops,y", "c,3,z", "d,,w"],
+    )
+    out = tmp_path / "jobs.parquet"
+    # as if sampling had missed "oops"
+    schema = {"job_link": pl.String, "n": pl.Int64, "title": pl.String}
+    stats = convert_csv(src, out, schema=schema)
+
+    df = pl.read_parquet(out)
+    assert df.schema["n"] == pl.Int64
+    assert df["n"].to_list() == [1, None, 3, None]
+    assert stats["rows"] == 4
+    assert stats["rejected_rows"] == 1  # "oops"; an empty field is just null
+    assert stats["rejected_by_column"] == {"n": 1}
+    assert stats["ragged_rows"] == 0 and stats["sorted_by"] == []
+    assert not (tmp_path / "jobs.parquet.tmp").exists()
+
+
+def test_convert_csv_drops_ragged_lines(tmp_path):
+    src = _write(
+        tmp_path / "jobs.csv",
+        ["job_link,n,title", "a,1,x", "c,3,bar,extra", '"b,c",2,"multi', 'line"'],
+    )
+    out = tmp_path / "jobs.parquet"
+    stats = convert_csv(src, out)
+
+    df = pl.read_parquet(out)
+    assert df["job_link"].to_list() == ["a", "b,c"]
+    assert df["title"].to_list() == ["x", "multi\nline"]
+    assert stats["rows"] == 3
+    assert stats["ragged_rows"] == 1 and stats["rejected_rows"] == 1
+
+
+def test_local_ingest_writes_manifest_and_survives_a_bad_file(tmp_path):
+    src, out = tmp_path / "src", tmp_path / "raw"
+    src.mkdir()
+    _jobs_csv(src / "a_jobs.csv", n=50)
+    _write(src / "b_ragged.csv", ["job_link,n", "x,1", "y,2,extra", "z,3"])
+    (src / "c_empty.csv").write_text("")
+
+    results = ingest_local(src, out, max_workers=2, sort_keys=["job_link"])
+
+    manifest = json.loads((out / MANIFEST_NAME).read_text())
+    assert manifest == results
+    by_file = {r["file"]: r for r in manifest}
+    assert set(by_file) == {"a_jobs.csv", "b_ragged.csv", "c_empty.csv"}
+
+    jobs = by_file["a_jobs.csv"]
+    assert jobs["rows"] == 50 and jobs["rejected_rows"] == 0
+    assert jobs["schema"]["salary"] == "Float64"
+    assert jobs["sorted_by"] == ["job_link"]
+    assert by_file["b_ragged.csv"]["ragged_rows"] == 1
+    assert pl.read_parquet(out / "b_ragged.parquet")["n"].to_list() == [1, 3]
+
+    assert "error" in by_file["c_empty.csv"]
+    assert sorted(p.name for p in out.iterdir()) == [
+        MANIFEST_NAME,
+        "a_jobs.parquet",
+        "b_ragged.parquet",
+    ]
@@ -1,5 +1,6 @@
 # English comments only below.
 import polars as pl
+import pytest
 from pathlib import Path
 
 TEST_DIR = Path("data/test")
@@ -39,3 +40,33 @@ def test_tiny_jobs_text_exists_and_nonempty_ratio():
 
     # Very permissive: require at least one non-empty text
     assert nonempty >= 1
+
+
+def test_save_many_writes_all_outputs_atomically(tmp_path):
+    from src.infra.io_polars import PolarsLocalRepository
+
+    repo = PolarsLocalRepository()
+    base = pl.LazyFrame({"a": [3, 1, 2]})
+    outs = {
+        str(tmp_path / "base.parquet"): base,
+        str(tmp_path / "sorted.parquet"): base.sort("a"),
+        str(tmp_path / "eager.parquet"): pl.DataFrame({"b": ["x"]}),
+    }
+    repo.save_many(outs, {str(tmp_path / "sorted.parquet"): {"compression": "lz4"}})
+
+    assert pl.read_parquet(tmp_path / "sorted.parquet")["a"].to_list() == [1, 2, 3]
+    assert pl.read_parquet(tmp_path / "eager.parquet")["b"].to_list() == ["x"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "base.parquet",
+        "eager.parquet",
+        "sorted.parquet",
+    ]
+
+    # a failing output leaves neither temp files nor partial outputs behind
+    bad = pl.LazyFrame({"s": ["not a number"]}).select(pl.col("s").cast(pl.Int64))
+    with pytest.raises(pl.exceptions.PolarsError):
+        repo.save_many(
+            {str(tmp_path / "ok.parquet"): base, str(tmp_path / "bad.parquet"): bad}
+        )
+    assert not (tmp_path / "ok.parquet").exists()
+    assert len(list(tmp_path.iterdir())) == 3
@@ -0,0 +1,77 @@
+# English comments only below.
+import polars as pl
+import pytest
+from src.infra.gazetteer import resolve_location
+from src.infra.location_cache import LocationCache
+from src.infra.transformers import LocationNormalizeTransformer
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("San Francisco, CA", ("San Francisco", "CA", "United States")),
+        ("Ontario, CA", ("Ontario", "CA", "United States")),
+        ("Toronto, Ontario, Canada", ("Toronto", "ON", "Canada")),
+        ("London, England, United Kingdom", ("London", "England", "United Kingdom")),
+        ("SF Bay Area", ("San Francisco", "CA", "United States")),
+        ("Bay Area", ("San Francisco", "CA", "United States")),
+        ("Greater Green Bay Area", ("Green Bay", None, None)),
+        ("Tampa Bay Area", ("Tampa", "FL", "United States")),
+        ("Green Bay, Wisconsin", ("Green Bay", "WI", "United States")),
+        ("Greater Minneapolis-St. Paul Area", ("Minneapolis", "MN", "United States")),
+        (
+            "San Antonio, Texas Metropolitan Area",
+            ("San Antonio", "TX", "United States"),
+        ),
+        ("Remote, US", (None, None, "United States")),
+        ("New Jersey, United States", (None, "NJ", "United States")),
+        ("Remote", (None, None, None)),
+        (None, (None, None, None)),
+    ],
+)
+def test_resolve_location(raw, expected):
+    assert resolve_location(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw", ["Greater Bay Area", "Bay Region", "Bay Metro Area", "Monterey Bay Area"]
+)
+def test_other_bays_are_not_san_francisco(raw):
+    # only explicit aliases ("Bay Area", "SF Bay Area", ...) mean the SF Bay Area
+    assert resolve_location(raw)[0] != "San Francisco"
+
+
+def test_cache_resolves_only_unseen_values(tmp_path):
+    cache = tmp_path / "cache" / "locations.parquet"
+    locations = pl.Series(["Seattle, WA", None, "Seattle, WA", "Greater Boston"])
+
+    c = LocationCache(cache)
+    mapping = c.mapping(locations)
+    assert c.stats == {"distinct": 2, "resolved": 2}
+    assert mapping.sort("location")["state"].to_list() == ["MA", "WA"]
+    assert cache.exists()
+
+    # a new instance reuses the cache and only resolves the unseen value
+    c2 = LocationCache(cache)
+    mapping2 = c2.mapping(pl.concat([locations, pl.Series(["Austin, TX"])]))
+    assert c2.stats == {"distinct": 3, "resolved": 1}
+    assert mapping2.height == 3
+    assert pl.read_parquet(cache).height == 3
+    assert not list(cache.parent.glob("*.tmp"))
+
+
+def test_transformer_is_a_lazy_join_against_the_mapping():
+    lf = pl.LazyFrame(
+        {
+            "title_lc": ["a", "b", "c", "d", "e"],
+            "location": ["Seattle, WA", None, "Seattle, WA", "Greater Boston", "Mars"],
+        }
+    )
+    mapping = LocationCache(None).mapping(pl.Series(["Seattle, WA", "Greater Boston"]))
+
+    out = LocationNormalizeTransformer(mapping).run(lf)
+    assert isinstance(out, pl.LazyFrame)
+    df = out.collect()
+    assert df["title_lc"].to_list() == ["a", "b", "c", "d", "e"]  # rows and order kept
+    assert df["state"].to_list() == ["WA", None, "WA", "MA", None]
+    assert df["city"].to_list()[3] == "Boston"
@@ -0,0 +1,139 @@
+# English comments only below.
+import polars as pl
+from scripts.bench_skills_parsing import legacy_skills_expr
+from src.infra.normalization import (
+    OUTPUT_COLUMNS,
+    NormalizationPlan,
+    parse_skills,
+    prepare_skills,
+)
+from src.infra.transformers import CleanJobTransformer
+
+
+def _linkedin() -> pl.LazyFrame:
+    return pl.DataFrame(
+        {
+            "job_link": ["l1", "l2", "l3"],
+            "job_title": ["Data Scientist", None, "Data Analyst"],
+            "company": ["Acme", "Acme", "Globex"],
+            "first_seen": ["2024-01-02 10:00:00", None, "2024-01-03 00:00:00"],
+            "job_skills": ["Python, SQL", None, '["Spark"]'],
+        }
+    ).lazy()
+
+
+def _generic() -> pl.LazyFrame:
+    return pl.DataFrame(
+        {"title": ["Engineer"], "company_name": ["Initech"], "skills": [None]},
+        schema_overrides={"skills": pl.Utf8},
+    ).lazy()
+
+
+def test_plan_normalizes_and_filters():
+    out = NormalizationPlan().apply(_linkedin()).collect()
+
+    assert out.columns == OUTPUT_COLUMNS
+    assert out["job_id"].to_list() == ["l1", "l3"]  # null title dropped
+    assert out["title_lc"].to_list() == ["data scientist", "data analyst"]
+    assert out["skills_list"].to_list() == [["python", "sql"], ["spark"]]
+    assert out["posted_at"].null_count() == 0
+
+
+def test_plan_caches_expressions_per_schema():
+    plan = NormalizationPlan()
+    first = plan.stages(_linkedin().collect_schema())
+    again = plan.stages(_linkedin().collect_schema())
+    other = plan.stages(_generic().collect_schema())
+
+    assert first is again
+    assert other is not first
+    assert len(plan._cache) == 2
+    assert plan.resolve(["title", "company_name"])["company"] == ["company_name"]
+
+
+def test_union_of_layouts_keeps_every_row():
+    # load_many unions files with different column names; each row only
+    # fills its own file's candidates
+    union = pl.concat(
+        [
+            pl.DataFrame({"job_title": ["A"], "company": ["X"], "job_skills": ["Go"]}),
+            pl.DataFrame({"title": ["B"], "employer": ["Y"], "tags": ["Rust, SQL"]}),
+        ],
+        how="diagonal",
+    ).lazy()
+    out = NormalizationPlan().apply(union).collect()
+
+    assert out["title"].to_list() == ["A", "B"]
+    assert out["company"].to_list() == ["X", "Y"]
+    assert out["skills_list"].to_list() == [["go"], ["rust", "sql"]]
+
+
+def test_conflicting_candidates_take_the_first_non_null_by_priority():
+    raw = pl.DataFrame(
+        {
+            "job_title": ["Data Engineer", None],
+            "title": ["Nurse", "Data Analyst"],
+            "company": ["X", None],
+            "company_name": ["Y", "Z"],
+        }
+    ).lazy()
+    out = NormalizationPlan().apply(raw).collect()
+
+    assert out["title"].to_list() == ["Data Engineer", "Data Analyst"]
+    assert out["company"].to_list() == ["X", "Z"]
+
+
+def test_clean_transformer_uses_the_plan():
+    plan = NormalizationPlan()
+    out = CleanJobTransformer(plan).run(_generic()).collect()
+
+    assert out["company"].to_list() == ["Initech"]
+    assert out["skills_list"].to_list() == [[]]
+    assert len(plan._cache) == 1
+
+
+def test_mixed_aware_and_naive_timestamps_parse():
+    raw = pl.DataFrame(
+        {
+            "title": ["a", "b", "c"],
+            "company": ["x", "x", "x"],
+            "posted_at": ["2024-01-02T03:04:05Z", "2024-01-02 10:00:00", None],
+        }
+    ).lazy()
+    out = NormalizationPlan().apply(raw).collect()
+
+    assert out["posted_at"].null_count() == 1
+    assert out["posted_at"].dt.hour().to_list()[:2] == [3, 10]
+
+
+def test_staged_skills_parsing_matches_legacy():
+    raw = pl.DataFrame(
+        {
+            "skills_raw": [
+                "Python, SQL",
+                " Power BI ,excel ",
+                '["Spark", "AWS"]',
+                '[" Docker", "a, b "]',
+                "[]",
+                "",
+                None,
+            ]
+        }
+    ).lazy()
+    legacy = raw.select(legacy_skills_expr().alias("s")).collect()
+    staged = (
+        raw.with_columns(prepare_skills()).select(parse_skills().alias("s")).collect()
+    )
+
+    assert staged.equals(legacy)
+    assert staged["s"].to_list()[2] == ["spark", "aws"]
+
+
+def test_canonical_skill_dictionary():
+    plan = NormalizationPlan(canonical_skills={"powerbi": "power bi", "py": "python"})
+    raw = pl.DataFrame(
+        {"title": ["T"], "company": ["C"], "skills": ["PowerBI, Py, SQL"]}
+    ).lazy()
+
+    out = plan.apply(raw).collect()
+    assert out["skills_list"].to_list() == [["power bi", "python", "sql"]]
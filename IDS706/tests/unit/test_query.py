@@ -0,0 +1,157 @@
+# English comments only below.
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+import polars as pl
+import pytest
+from src.app.query import (
+    CountsOverTimeQuery,
+    QueryService,
+    TopSkillsQuery,
+    make_server,
+)
+from src.infra.aggregators import TopSkillsAggregator
+
+
+def _write_silver(path, n_extra_python: int = 0):
+    rows = {
+        "title_lc": ["data scientist", "senior data engineer", "data scientist ii"],
+        "seniority": ["junior", "senior", "senior"],
+        "work_type": ["remote", "onsite", "Remote"],
+        "posted_at": [
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 2),
+            datetime(2024, 1, 9),
+        ],
+        "skills_list": [["python", "sql"], ["spark", "python"], ["sql"]],
+    }
+    df = pl.DataFrame(rows)
+    # extra copies of the first (data scientist, python) row
+    pl.concat([df] + [df.head(1)] * n_extra_python).write_parquet(path)
+
+
+@pytest.fixture
+def service(tmp_path):
+    _write_silver(tmp_path / "silver.parquet")
+    return QueryService(
+        tmp_path / "silver.parquet",
+        tmp_path / "missing_gold.parquet",
+        rollup_paths={},  # always answer from silver here
+    )
+
+
+def test_top_skills_with_filters(service):
+    out = service.run(TopSkillsQuery(k=2))
+    assert out.rows() == [("python", 2), ("sql", 2)]
+
+    out = service.run(TopSkillsQuery(role="data scientist", work_type="REMOTE"))
+    assert out.rows() == [("sql", 2), ("python", 1)]
+
+    out = service.run(TopSkillsQuery(seniority="senior", k=1))
+    assert out.rows() == [("python", 1)]
+
+
+def test_counts_over_time(service):
+    out = service.run(CountsOverTimeQuery(every="1w"))
+    assert out["count"].to_list() == [2, 1]
+
+    out = service.run(CountsOverTimeQuery(every="1d", skill="Python"))
+    assert out["count"].to_list() == [1, 1]
+
+    with pytest.raises(ValueError):
+        CountsOverTimeQuery(every="1y")
+
+
+def test_top_skills_rejects_non_positive_k():
+    for k in (0, -3):
+        with pytest.raises(ValueError, match="k must be"):
+            TopSkillsQuery(k=k)
+
+
+def test_gold_and_silver_break_ties_the_same_way(tmp_path):
+    # every skill appears once: the order is decided by the tie-break alone
+    silver = pl.DataFrame(
+        {
+            "title_lc": ["a", "b"],
+            "seniority": ["x", "x"],
+            "work_type": ["x", "x"],
+            "posted_at": [datetime(2024, 1, 1)] * 2,
+            "skills_list": [["sql", "docker"], ["python", "aws"]],
+        }
+    )
+    silver.write_parquet(tmp_path / "silver.parquet")
+    gold = TopSkillsAggregator(topk=4).aggregate(silver.lazy()).collect()
+    gold.reverse().write_parquet(tmp_path / "gold.parquet")  # as if unsorted
+
+    q = TopSkillsQuery(k=3)
+    from_gold = QueryService(
+        tmp_path / "silver.parquet", tmp_path / "gold.parquet", rollup_paths={}
+    ).run(q)
+    from_silver = QueryService(
+        tmp_path / "silver.parquet", tmp_path / "missing.parquet", rollup_paths={}
+    ).run(q)
+    assert from_gold["skills_list"].to_list() == ["aws", "docker", "python"]
+    assert from_gold.equals(from_silver)
+    assert gold["skills_list"].to_list() == ["aws", "docker", "python", "sql"]
+
+
+def test_queries_execute_concurrently(service, monkeypatch):
+    # both queries must be inside _execute at once, or the barrier times out
+    barrier = threading.Barrier(2, timeout=5)
+    execute = service._execute
+
+    def waiting_execute(query):
+        barrier.wait()
+        return execute(query)
+
+    monkeypatch.setattr(service, "_execute", waiting_execute)
+    results = {}
+    threads = [
+        threading.Thread(target=lambda q=q: results.update({q.k: service.run(q)}))
+        for q in [TopSkillsQuery(k=1), TopSkillsQuery(k=2)]
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not barrier.broken
+    assert results[2].height == 2
+    assert service.run(TopSkillsQuery(k=1)) is results[1]  # cached afterwards
+
+
+def test_results_are_cached_until_a_new_version(tmp_path, service):
+    q = TopSkillsQuery(role="data scientist")
+    first = service.run(q)
+    assert service.run(q) is first
+    assert service.stats["hits"] == 1
+
+    _write_silver(tmp_path / "silver.parquet", n_extra_python=3)
+    again = service.run(q)
+    assert again is not first
+    assert service.stats["invalidations"] == 1
+    assert dict(again.rows())["python"] == 4
+
+
+def test_http_stand_in(service):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/top-skills?role=data+engineer") as r:
+            body = json.loads(r.read())
+        assert body["rows"] == [
+            {"skills_list": "python", "count": 1},
+            {"skills_list": "spark", "count": 1},
+        ]
+        for bad in ("counts?every=bogus", "top-skills?k=0"):
+            with pytest.raises(urllib.error.HTTPError) as err:
+                urllib.request.urlopen(f"{base}/{bad}")
+            assert err.value.code == 400
+    finally:
+        server.shutdown()
+        server.server_close()
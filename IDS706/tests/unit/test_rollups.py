@@ -0,0 +1,108 @@
+# English comments only below.
+from datetime import date, datetime
+
+import polars as pl
+from src.app.query import CountsOverTimeQuery, QueryService
+from src.infra.aggregators import PostingRollupAggregator
+from src.settings import TARGET_ROLES
+
+ROLES = ["data scientist", "data engineer"]
+
+
+def _silver(days: list[int]) -> pl.LazyFrame:
+    n = len(days)
+    return pl.DataFrame(
+        {
+            "title_lc": ["senior data scientist", "data engineer", "nurse"] * n,
+            "seniority": ["Senior", None, "Entry"] * n,
+            "work_type": ["remote", "onsite", "remote"] * n,
+            "posted_at": [datetime(2024, 1, d, 9) for d in days for _ in range(3)],
+            "skills_list": [["python", "sql", "python"], ["spark"], []] * n,
+        }
+    ).lazy()
+
+
+def test_daily_rollup_counts():
+    daily = PostingRollupAggregator(ROLES).aggregate(_silver([1])).collect()
+
+    totals = daily.filter(pl.col("skill").is_null())
+    assert totals.select("role", "postings").sort("role").rows() == [
+        ("data engineer", 1),
+        ("data scientist", 1),
+        ("other", 1),
+    ]
+    ds = daily.filter(pl.col("role") == "data scientist")
+    # duplicate skills in one posting count once
+    assert dict(ds.select("skill", "postings").drop_nulls().rows()) == {
+        "python": 1,
+        "sql": 1,
+    }
+    assert set(ds["seniority"]) == {"senior"}
+    assert daily.filter(pl.col("role") == "data engineer")["seniority"][0] == "na"
+
+
+def test_incremental_update_matches_full_rebuild():
+    agg = PostingRollupAggregator(ROLES)
+    # first run saw day 1 and part of day 2; later silver has all of 2 and 3
+    previous = agg.aggregate(_silver([1, 2])).collect()
+    previous = previous.select(sorted(previous.columns))  # as reloaded by load_many
+    later = _silver([1, 2, 2, 3])
+
+    updated = agg.update(later, previous).collect()
+    full = agg.aggregate(later).collect()
+    assert updated.sort(updated.columns).equals(full.sort(full.columns))
+
+
+def test_weekly_from_daily_and_query_uses_rollups(tmp_path):
+    agg = PostingRollupAggregator(ROLES)
+    silver = _silver([1, 2, 9])  # two ISO weeks
+    daily = agg.aggregate(silver)
+    weekly = agg.roll_up(daily, "1w").collect()
+
+    py = weekly.filter(pl.col("skill") == "python")
+    assert py.select("period", "postings").rows() == [
+        (date(2024, 1, 1), 2),
+        (date(2024, 1, 8), 1),
+    ]
+
+    silver.collect().write_parquet(tmp_path / "silver.parquet")
+    weekly.write_parquet(tmp_path / "weekly.parquet")
+    q = CountsOverTimeQuery(every="1w", skill="python", role="data scientist")
+    from_rollup = QueryService(
+        tmp_path / "silver.parquet",
+        tmp_path / "no_gold.parquet",
+        rollup_paths={"1w": tmp_path / "weekly.parquet"},
+    ).run(q)
+    from_silver = QueryService(
+        tmp_path / "silver.parquet", tmp_path / "no_gold.parquet", rollup_paths={}
+    ).run(q)
+    assert from_rollup.equals(from_silver)
+
+
+def test_title_with_two_roles_counts_the_same_on_both_paths(tmp_path):
+    silver = pl.DataFrame(
+        {
+            "title_lc": ["data scientist / data engineer", "data engineer"],
+            "seniority": ["Senior", "Senior"],
+            "work_type": ["remote", "remote"],
+            "posted_at": [datetime(2024, 1, 1, 9), datetime(2024, 1, 1, 10)],
+            "skills_list": [["python"], ["spark"]],
+        }
+    )
+    silver.write_parquet(tmp_path / "silver.parquet")
+    agg = PostingRollupAggregator(TARGET_ROLES)
+    agg.aggregate(silver.lazy()).collect().write_parquet(tmp_path / "daily.parquet")
+
+    from_rollup = QueryService(
+        tmp_path / "silver.parquet",
+        tmp_path / "no_gold.parquet",
+        rollup_paths={"1d": tmp_path / "daily.parquet"},
+    )
+    from_silver = QueryService(
+        tmp_path / "silver.parquet", tmp_path / "no_gold.parquet", rollup_paths={}
+    )
+    # the first target role in the title wins, on both paths
+    for role, count in [("data scientist", 1), ("data engineer", 1)]:
+        q = CountsOverTimeQuery(every="1d", role=role)
+        assert from_rollup.run(q)["count"].to_list() == [count]
+        assert from_silver.run(q).equals(from_rollup.run(q))
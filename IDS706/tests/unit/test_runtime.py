@@ -0,0 +1,95 @@
+# English comments only below.
+import subprocess
+import sys
+from pathlib import Path
+
+import polars as pl
+import pytest
+from src.infra.io_polars import PolarsLocalRepository
+from src.utils.runtime import RuntimeConfig, current
+
+
+def test_precedence_file_env_flag(tmp_path):
+    cfg_file = tmp_path / "jobs.toml"
+    cfg_file.write_text(
+        '[runtime]\nengine = "in-memory"\nchunk_size = 1000\nthreads = 2\n'
+    )
+    env = {"JOBS_CHUNK_SIZE": "5000", "JOBS_THREADS": "4"}
+
+    cfg = RuntimeConfig.load(cfg_file, env=env, threads=8)
+
+    assert cfg.engine == "in-memory"
+    assert cfg.chunk_size == 5000
+    assert cfg.threads == 8
+    assert cfg.sources == {
+        "engine": str(cfg_file),
+        "chunk_size": "$JOBS_CHUNK_SIZE",
+        "threads": "flag",
+        "memory_limit_mb": "default",
+    }
+
+
+def test_validation_and_memory_limit(tmp_path):
+    with pytest.raises(ValueError):
+        RuntimeConfig(engine="gpu-please")
+    with pytest.raises(ValueError):
+        RuntimeConfig(threads=0)
+    with pytest.raises(FileNotFoundError):
+        RuntimeConfig.load(tmp_path / "missing.toml", env={})
+
+    assert RuntimeConfig(memory_limit_mb=512).effective_engine == "streaming"
+    assert RuntimeConfig(engine="in-memory", memory_limit_mb=512).effective_engine == (
+        "in-memory"
+    )
+
+
+def test_file_and_env_values_are_coerced_or_rejected_by_key(tmp_path):
+    cfg_file = tmp_path / "jobs.toml"
+    cfg_file.write_text('[runtime]\nthreads = "4"\n')
+    assert RuntimeConfig.load(cfg_file, env={}).threads == 4
+
+    for body in ('threads = "four"', "threads = 2.5", "threads = true", "engine = 3"):
+        cfg_file.write_text(f"[runtime]\n{body}\n")
+        key = body.split()[0]
+        with pytest.raises(ValueError, match=key):
+            RuntimeConfig.load(cfg_file, env={})
+    cfg_file.write_text("[runtime]\n")
+    with pytest.raises(ValueError, match="chunk_size"):
+        RuntimeConfig.load(cfg_file, env={"JOBS_CHUNK_SIZE": "big"})
+
+
+def test_apply_sets_current_and_repo_follows(tmp_path):
+    try:
+        cfg = RuntimeConfig(engine="streaming", chunk_size=10_000).apply()
+        assert current() is cfg
+        assert "streaming" in cfg.describe()
+
+        repo = PolarsLocalRepository()
+        assert repo.runtime is cfg
+        out = tmp_path / "t.parquet"
+        repo.save_lazy(pl.LazyFrame({"a": [1, 2]}), str(out))
+        assert repo.collect(pl.scan_parquet(out))["a"].to_list() == [1, 2]
+    finally:
+        RuntimeConfig().apply()
+
+
+def test_apply_before_polars_import_uses_env(tmp_path):
+    # fresh interpreter so polars is not imported yet when apply() runs
+    code = (
+        "import sys\n"
+        "from src.utils.runtime import RuntimeConfig\n"
+        "RuntimeConfig(engine='streaming', threads=2, chunk_size=5000).apply()\n"
+        "assert 'polars' not in sys.modules\n"
+        "import polars as pl\n"
+        "state = pl.Config.state(if_set=True)\n"
+        "print(pl.thread_pool_size(), state['POLARS_ENGINE_AFFINITY'],"
+        " state['POLARS_IDEAL_MORSEL_SIZE'])\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["2", "streaming", "5000"]
@@ -0,0 +1,42 @@
+# English comments only below.
+import polars as pl
+from pathlib import Path
+from src.infra.sampling import StreamingStratifiedSampler
+
+TEST_DIR = Path("data/test")
+
+
+def _jobs() -> pl.LazyFrame:
+    return pl.scan_parquet(TEST_DIR / "tiny_jobs.parquet")
+
+
+def test_caps_rows_per_group():
+    out = StreamingStratifiedSampler("company", n_per_group=2, batch_size=97).sample(
+        _jobs()
+    )
+    counts = out.group_by("company").len()
+    assert counts["len"].max() <= 2
+    # every company in the input is represented
+    assert (
+        counts.height == _jobs().select(pl.col("company").n_unique()).collect().item()
+    )
+
+
+def test_result_is_deterministic_and_independent_of_batch_size():
+    small = StreamingStratifiedSampler("company", 1, seed=7, batch_size=50).sample(
+        _jobs()
+    )
+    large = StreamingStratifiedSampler("company", 1, seed=7, batch_size=10_000).sample(
+        _jobs()
+    )
+    other_seed = StreamingStratifiedSampler("company", 1, seed=8).sample(_jobs())
+
+    assert small.equals(large)
+    assert not small.equals(other_seed)
+    assert small.columns == _jobs().collect_schema().names()
+
+
+def test_empty_input_keeps_schema():
+    out = StreamingStratifiedSampler("company", 2).sample(_jobs().head(0))
+    assert out.height == 0
+    assert out.columns == _jobs().collect_schema().names()
@@ -0,0 +1,38 @@
+# English comments only below.
+import polars as pl
+from src.infra.transformers import SkillsJoinTransformer
+
+
+def _postings() -> pl.LazyFrame:
+    return pl.DataFrame(
+        {
+            "job_id": ["a", "b", "c"],
+            "title": ["x", "y", "z"],
+            "skills_list": [["inline"], [], []],
+        }
+    ).lazy()
+
+
+def test_join_from_comma_separated_job_skills():
+    skills = pl.DataFrame(
+        {"job_link": ["a", "b"], "job_skills": ["Python, SQL", " Spark ,python"]}
+    ).lazy()
+    out = SkillsJoinTransformer(skills).run(_postings()).collect().sort("job_id")
+
+    assert out["skills_list"].to_list() == [
+        ["python", "sql"],
+        ["spark", "python"],
+        [],  # no skills row -> keeps its own (empty) list
+    ]
+
+
+def test_join_from_long_format_and_restrict_to_keys():
+    skills = pl.DataFrame(
+        {"job_id": ["a", "a", "c", "zzz"], "skill": ["Excel", "excel", "Go", "Rust"]}
+    ).lazy()
+    joiner = SkillsJoinTransformer(skills, keys=pl.DataFrame({"job_id": ["a"]}).lazy())
+
+    assert joiner.skills_long().collect()["skill"].to_list() == ["excel", "excel"]
+    out = joiner.run(_postings()).collect().sort("job_id")
+    # 'c' was filtered out of the skills side, so it keeps its original list
+    assert out["skills_list"].to_list() == [["excel"], [], []]
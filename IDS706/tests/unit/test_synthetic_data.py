@@ -0,0 +1,10 @@
+# English comments only below.
+import polars as pl
+from scripts.make_synthetic_data import VARIANTS, generate
+
+
+def test_generate_writes_every_variant(tmp_path):
+    paths = generate(1_000, tmp_path)
+
+    assert {p.name.split("_")[1] for p in paths} == set(VARIANTS)
+    assert sum(pl.read_parquet(p).height for p in paths) == 1_000
@@ -0,0 +1,74 @@
+# English comments only below.
+import polars as pl
+import pytest
+from pathlib import Path
+from src.infra.text_index import TextIndex
+
+TEST_DIR = Path("data/test")
+
+
+def _build(tmp_path: Path) -> tuple[TextIndex, pl.DataFrame]:
+    docs = pl.DataFrame(
+        {
+            "title_lc": ["a", "b", "c", "d", "e"],
+            "company": ["x"] * 5,
+            "location": ["y"] * 5,
+            "text": [
+                "senior data engineer python spark",
+                "data scientist machine learning python",
+                "machine shop engineer learning on the job",
+                None,
+                "software engineer c++ python data",
+            ],
+        }
+    )
+    src = tmp_path / "silver.parquet"
+    docs.write_parquet(src)
+    return TextIndex.build(src, out_dir=tmp_path / "idx"), docs
+
+
+def test_boolean_and_phrase_queries(tmp_path):
+    idx, _ = _build(tmp_path)
+
+    assert idx.search("python").tolist() == [0, 1, 4]
+    assert idx.search("python data").tolist() == [0, 1, 4]
+    assert idx.search("python -spark").tolist() == [1, 4]
+    assert idx.search("spark OR shop").tolist() == [0, 2]
+    assert idx.search("c++").tolist() == [4]
+    # phrase must match consecutive tokens, not just co-occurrence
+    assert idx.search('"machine learning"').tolist() == [1]
+    assert idx.search('learning -"machine learning"').tolist() == [2]
+    assert idx.search("nonexistent").tolist() == []
+
+
+def test_reload_and_frame(tmp_path):
+    idx, docs = _build(tmp_path)
+    again = TextIndex.load(tmp_path / "idx")
+    assert again.n_docs == docs.height
+    out = again.frame(again.search("engineer"))
+    assert out["title_lc"].to_list() == ["a", "c", "e"]
+
+
+def test_matches_string_scan_on_tiny_jobs(tmp_path):
+    src = tmp_path / "tiny.parquet"
+    df = pl.read_parquet(TEST_DIR / "tiny_jobs.parquet").select(
+        "title_lc", "company", "location", pl.col("title_lc").alias("text")
+    )
+    df.write_parquet(src)
+    idx = TextIndex.build(src, out_dir=tmp_path / "idx")
+
+    expected = df.with_row_index().filter(pl.col("text").str.contains(r"\bmanager\b"))[
+        "index"
+    ]
+    assert idx.search("manager").tolist() == expected.to_list()
+
+
+def test_token_less_terms_match_nothing(tmp_path):
+    idx, _ = _build(tmp_path)
+
+    assert idx.search('python ""').tolist() == []
+    assert idx.search("spark OR -").tolist() == [0]
+    assert idx.search("python -!!").tolist() == [0, 1, 4]
+    for query in ["", "   ", "-", '""', "!! OR -"]:
+        with pytest.raises(ValueError):
+            idx.search(query)